@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 
-from .models import Account
+from .models import Account, LoginLockout
 
 
 @admin.register(Account)
@@ -48,3 +48,18 @@ class AccountAdmin(UserAdmin):
             },
         ),
     )
+
+
+@admin.register(LoginLockout)
+class LoginLockoutAdmin(admin.ModelAdmin):
+    list_display = ("created_at", "scope", "username", "ip_address", "failures", "locked_until")
+    list_filter = ("scope",)
+    search_fields = ("username", "ip_address")
+    date_hierarchy = "created_at"
+
+    # 잠금 이력은 조회 전용
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,123 @@
+"""회원가입 중복 확인 (아이디/이메일/전화번호)
+
+세 필드를 OR 조건 쿼리 1번으로 확인하고 결과를 캐시에 짧게 둔다.
+  - 사용 중(taken): TAKEN_TTL 동안 캐시 (탈퇴 외에는 바뀌지 않음)
+  - 사용 가능(조회 miss): AVAILABLE_TTL 동안만 캐시하고 회원 생성 시 삭제
+최종 중복 방지는 DB 유니크 제약이 맡고, 여기서는 폼/실시간 확인의 왕복 수만 줄인다.
+"""
+import hashlib
+import re
+from typing import Dict, Tuple
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Q
+
+from common import metrics
+
+FIELDS = ("username", "email", "phone")
+TAKEN_TTL = 60 * 5
+AVAILABLE_TTL = 30
+
+TAKEN_MESSAGES = {
+    "username": "이미 사용 중인 닉네임입니다.",
+    "email": "이미 사용 중인 이메일입니다.",
+    "phone": "이미 사용 중인 전화번호입니다.",
+}
+
+
+def normalize_phone(raw: str) -> str:
+    digits = re.sub(r"\D", "", raw or "")
+    if digits.startswith("82"):
+        digits = "0" + digits[2:]
+    return digits
+
+
+def normalize(field: str, value: str) -> str:
+    value = (value or "").strip()
+    if field == "email":
+        return value.lower()
+    if field == "phone":
+        return normalize_phone(value)
+    return value
+
+
+def _cache_key(field: str, value: str) -> str:
+    digest = hashlib.sha1(value.lower().encode("utf-8")).hexdigest()
+    return f"signup:avail:{field}:{digest}"
+
+
+def _query(values: Dict[str, str]):
+    condition = Q()
+    for field, value in values.items():
+        condition |= Q(**{f"{field}__iexact" if field == "email" else field: value})
+    return get_user_model().objects.filter(condition).values_list(*FIELDS)
+
+
+def _resolve(values: Dict[str, str], rows) -> Dict[str, bool]:
+    taken = {field: set() for field in FIELDS}
+    for row in rows:
+        for field, value in zip(FIELDS, row):
+            taken[field].add((value or "").lower())
+    return {field: value.lower() not in taken[field] for field, value in values.items()}
+
+
+def _split(values: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    normalized = {
+        field: normalize(field, value)
+        for field, value in values.items()
+        if field in FIELDS and value
+    }
+    normalized = {field: value for field, value in normalized.items() if value}
+    keys = {field: _cache_key(field, value) for field, value in normalized.items()}
+    return normalized, keys
+
+
+def _to_cache(result: Dict[str, bool], keys: Dict[str, str]):
+    taken = {keys[field]: False for field, ok in result.items() if not ok}
+    available = {keys[field]: True for field, ok in result.items() if ok}
+    return taken, available
+
+
+def check(values: Dict[str, str]) -> Dict[str, bool]:
+    """필드 -> 사용 가능 여부. 캐시에 없는 필드만 모아서 쿼리 1번"""
+    normalized, keys = _split(values)
+    if not normalized:
+        return {}
+    cached = cache.get_many(list(keys.values()))
+    result = {field: cached[key] for field, key in keys.items() if key in cached}
+    missing = {field: value for field, value in normalized.items() if field not in result}
+    metrics.cache_result("availability", True, len(result))
+    metrics.cache_result("availability", False, len(missing))
+    if missing:
+        fresh = _resolve(missing, _query(missing))
+        taken, available = _to_cache(fresh, keys)
+        cache.set_many(taken, TAKEN_TTL)
+        cache.set_many(available, AVAILABLE_TTL)
+        result.update(fresh)
+    return result
+
+
+async def acheck(values: Dict[str, str]) -> Dict[str, bool]:
+    """check()의 비동기 버전 (실시간 확인 엔드포인트용)"""
+    normalized, keys = _split(values)
+    if not normalized:
+        return {}
+    cached = await cache.aget_many(list(keys.values()))
+    result = {field: cached[key] for field, key in keys.items() if key in cached}
+    missing = {field: value for field, value in normalized.items() if field not in result}
+    metrics.cache_result("availability", True, len(result))
+    metrics.cache_result("availability", False, len(missing))
+    if missing:
+        rows = [row async for row in _query(missing)]
+        fresh = _resolve(missing, rows)
+        taken, available = _to_cache(fresh, keys)
+        await cache.aset_many(taken, TAKEN_TTL)
+        await cache.aset_many(available, AVAILABLE_TTL)
+        result.update(fresh)
+    return result
+
+
+def forget(user):
+    """회원 생성/변경 시 '사용 가능' 캐시 삭제"""
+    cache.delete_many([_cache_key(field, normalize(field, getattr(user, field, ""))) for field in FIELDS])
@@ -0,0 +1,178 @@
+"""유출 비밀번호 확인 (Pwned Passwords k-익명성 range API)
+
+비밀번호 SHA-1의 앞 5자리(prefix)로 range를 조회하고 나머지 35자리(suffix)가
+목록에 있는지 확인한다. 조회 순서:
+  1) 오프라인 인덱스 (PWNED_INDEX_PATH): 덤프로 만든 정렬된 20바이트 해시 파일을 mmap 후
+     이진 탐색. 설정돼 있으면 이것만으로 판정하고 네트워크를 쓰지 않는다.
+  2) Redis 셋 pwned:range:{prefix} (PWNED_CACHE_TTL)
+  3) 디스크 캐시 PWNED_CACHE_DIR/{prefix}.txt (PWNED_CACHE_TTL)
+  4) range API 호출 후 2), 3)에 저장
+API가 응답하지 않으면 가입을 막지 않도록 유출되지 않은 것으로 본다(fail-open).
+"""
+import hashlib
+import logging
+import mmap
+import os
+import tempfile
+import time
+from typing import Optional, Set
+
+import requests
+from django.conf import settings
+
+from common.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+DIGEST_SIZE = 20 # SHA-1 바이트 수
+# 빈 range도 캐시했음을 표시하는 멤버 (16진수 suffix와 겹치지 않음)
+EMPTY_RANGE_MARKER = "-"
+
+
+def _digest(password: str) -> str:
+    return hashlib.sha1(password.encode("utf-8")).hexdigest().upper()
+
+
+#------------------- 오프라인 인덱스 -------------------#
+
+class HashIndex:
+    """정렬된 SHA-1 다이제스트(20바이트씩 연속) 파일을 mmap 해서 이진 탐색"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as fp:
+            self._mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self.count = len(self._mm) // DIGEST_SIZE
+
+    def __contains__(self, digest: bytes) -> bool:
+        mm, low, high = self._mm, 0, self.count
+        while low < high:
+            mid = (low + high) // 2
+            offset = mid * DIGEST_SIZE
+            value = mm[offset:offset + DIGEST_SIZE]
+            if value < digest:
+                low = mid + 1
+            elif value > digest:
+                high = mid
+            else:
+                return True
+        return False
+
+
+_index = None
+_index_missing = False
+
+
+def get_index() -> Optional[HashIndex]:
+    global _index, _index_missing
+    path = settings.PWNED_INDEX_PATH
+    if not path or _index_missing:
+        return None
+    if _index is None:
+        try:
+            _index = HashIndex(path)
+        except (OSError, ValueError):
+            logger.warning("유출 비밀번호 인덱스를 열 수 없어 range API 캐시를 사용합니다: %s", path)
+            _index_missing = True
+            return None
+    return _index
+
+
+#------------------- range 캐시 -------------------#
+
+def _redis_key(prefix: str) -> str:
+    return f"pwned:range:{prefix}"
+
+
+def _disk_path(prefix: str) -> str:
+    return os.path.join(settings.PWNED_CACHE_DIR, f"{prefix}.txt")
+
+
+def _parse_range(text: str) -> Set[str]:
+    suffixes = set()
+    for line in text.splitlines():
+        suffix, _, count = line.partition(":")
+        # Add-Padding 응답의 가짜 항목(출현 0회)은 제외
+        if suffix and count.strip() != "0":
+            suffixes.add(suffix.strip())
+    return suffixes
+
+
+def _read_disk(prefix: str) -> Optional[Set[str]]:
+    path = _disk_path(prefix)
+    try:
+        if time.time() - os.path.getmtime(path) > settings.PWNED_CACHE_TTL:
+            return None
+        with open(path, encoding="ascii") as fp:
+            return set(fp.read().split())
+    except OSError:
+        return None
+
+
+def _write_disk(prefix: str, suffixes: Set[str]):
+    try:
+        os.makedirs(settings.PWNED_CACHE_DIR, exist_ok=True)
+        # 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓰고 교체
+        fd, tmp_path = tempfile.mkstemp(dir=settings.PWNED_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="ascii") as fp:
+            fp.write("\n".join(sorted(suffixes)))
+        os.replace(tmp_path, _disk_path(prefix))
+    except OSError:
+        logger.warning("유출 비밀번호 디스크 캐시 저장 실패: prefix=%s", prefix, exc_info=True)
+
+
+def _write_redis(prefix: str, suffixes: Set[str]):
+    key = _redis_key(prefix)
+    # Redis는 빈 셋을 저장하지 못하므로 빈 range는 표시 멤버만 넣어 다음 조회에서 API를 다시 부르지 않게 한다
+    members = suffixes or {EMPTY_RANGE_MARKER}
+    pipe = get_redis().pipeline()
+    pipe.delete(key)
+    pipe.sadd(key, *members)
+    pipe.expire(key, settings.PWNED_CACHE_TTL)
+    pipe.execute()
+
+
+def fetch_range(prefix: str) -> Set[str]:
+    resp = requests.get(
+        f"{settings.PWNED_API_URL}{prefix}",
+        headers={"Add-Padding": "true"},
+        timeout=settings.PWNED_API_TIMEOUT,
+    )
+    resp.raise_for_status()
+    return _parse_range(resp.text)
+
+
+def _check_range(prefix: str, suffix: str) -> bool:
+    key = _redis_key(prefix)
+    try:
+        pipe = get_redis().pipeline()
+        pipe.exists(key)
+        pipe.sismember(key, suffix)
+        cached, found = pipe.execute()
+        if cached:
+            return bool(found)
+    except Exception:
+        # Redis 장애 시에도 디스크 캐시/API로 계속 진행
+        logger.warning("유출 비밀번호 Redis 캐시 조회 실패", exc_info=True)
+
+    suffixes = _read_disk(prefix)
+    if suffixes is None:
+        suffixes = fetch_range(prefix)
+        _write_disk(prefix, suffixes)
+    try:
+        _write_redis(prefix, suffixes)
+    except Exception:
+        logger.warning("유출 비밀번호 Redis 캐시 저장 실패", exc_info=True)
+    return suffix in suffixes
+
+
+def is_breached(password: str) -> bool:
+    digest = _digest(password)
+    index = get_index()
+    if index is not None:
+        return bytes.fromhex(digest) in index
+    try:
+        return _check_range(digest[:5], digest[5:])
+    except requests.RequestException:
+        logger.warning("유출 비밀번호 API 조회 실패 - 검사를 건너뜁니다.", exc_info=True)
+        return False
@@ -6,13 +6,14 @@ from django.contrib.auth import password_validation
 from django_recaptcha.fields import ReCaptchaField
 from django_recaptcha.widgets import ReCaptchaV2Checkbox
 
-import re
 from django.core.exceptions import ValidationError
 
 import hashlib  # 난수,해시함수 사용
 from datetime import date
 
-import requests
+from accounts import availability
+from accounts.availability import normalize_phone
+from accounts.breach import is_breached
 
 #----------------------------------이메일 인증용----------------------------------
 SIGNUP_SESSION_KEY = "signup_verification"
@@ -52,12 +53,6 @@ class LoginForm(AuthenticationForm):
         if self.use_recaptcha:
             self.fields["captcha"] = ReCaptchaField(widget=ReCaptchaV2Checkbox)
 
-def normalize_phone(raw: str) -> str:
-        digits = re.sub(r"\D", "", raw or "")
-        if digits.startswith("82"):
-            digits = "0" + digits[2:]
-        return digits
-
 class ExtraFieldsMixin(forms.Form):
     username = forms.CharField(label="닉네임", max_length=150, required=True)
     name = forms.CharField(label="이름", max_length=50, required=True)
@@ -74,18 +69,23 @@ class ExtraFieldsMixin(forms.Form):
         phone = normalize_phone(self.cleaned_data.get("phone", ""))
         if not phone:
             raise ValidationError("전화번호를 입력해 주세요.")
-        if User.objects.filter(phone=phone).exists():
-            raise ValidationError("이미 사용 중인 전화번호입니다.")
         return phone
     
     def clean_username(self):
         username = (self.cleaned_data.get("username") or "").strip()
         if not username:
             raise ValidationError("닉네임을 입력해주세요.")
-        if User.objects.filter(username=username).exists():
-            raise ValidationError("이미 사용 중인 닉네임입니다.")
         return username
 
+    def clean(self):
+        cleaned = super().clean()
+        # 닉네임/이메일/전화번호 중복을 쿼리 1번(캐시 우선)으로 확인
+        values = {field: cleaned.get(field) for field in availability.FIELDS if cleaned.get(field)}
+        for field, is_available in availability.check(values).items():
+            if not is_available:
+                self.add_error(field, availability.TAKEN_MESSAGES[field])
+        return cleaned
+
     @staticmethod
     def _save_extra_to_user(user, data):
         """Persist extra profile fields onto the user model."""
@@ -120,27 +120,8 @@ class ExtraFieldsMixin(forms.Form):
     
 #----------------------------------비밀번호 유출 확인용----------------------------------
 def is_pwned_password(password: str) -> bool:
-    digest = hashlib.sha1(password.encode("utf-8")).hexdigest().upper() # 비밀번호 -> utf-8-> SHA-1 해시 생성
-    prefix, suffix = digest[:5], digest[5:] # 앞 5자리와 나머지로 분리
-
-     # Pwned Passwords API에 접속하여 앞 5자리와 일치하는 해시 목록을 가져옴
-     # https://haveibeenpwned.com/API/v3#PwnedPasswords
-     # 응답은 해시 뒷부분과 출현 횟수로 구성된 텍스트
-     # 예: 003DF6C8D8E8F3C4F5E6A7B89C0D1E2F3:2
-     # 이 중에서 뒷부분이 suffix와 일치하는지 확인
-     # 일치하면 해당 비밀번호가 유출된 것으로 간주
-     # 타임아웃 2초 설정
-     # 예외 발생 시 호출자에게 전달
-     # 일치 여부 반환
-     # any() 함수 사용하여 한 줄이라도 일치하면 True 반환
-     # splitlines() 함수 사용하여 응답 텍스트를 줄 단위로 분리
-     # 각 줄을 ':'로 분리하여 해시 뒷부분과 출현 횟수 추출
-     # 해시 뒷부분이 suffix와 일치하는지 확인
-     # 일치하면 True 반환, 그렇지 않으면 False 반환
-     # 최종적으로 비밀번호 유출 여부 반환
-    resp = requests.get(f"https://api.pwnedpasswords.com/range/{prefix}", timeout=2)
-    resp.raise_for_status()
-    return any(line.split(":")[0] == suffix for line in resp.text.splitlines())
+    # 로컬 인덱스/캐시 우선 조회, API 장애 시 통과 (accounts/breach.py)
+    return is_breached(password)
     
 class SignUpForm(ExtraFieldsMixin):
     password1 = forms.CharField(
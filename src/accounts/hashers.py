@@ -0,0 +1,30 @@
+"""비용을 설정으로 조정하는 비밀번호 해셔
+
+로그인 1회의 CPU 비용은 거의 전부 비밀번호 검증이다. 비용 값을 settings(.env)로 빼서
+bench_password_hashing 명령으로 잰 결과를 보고 보안/지연을 조정할 수 있게 한다.
+비용을 바꾸면 기존 해시는 다음 로그인 때 백그라운드에서 새 비용으로 재해시된다.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, PBKDF2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    # 알고리즘 이름을 그대로 두어 기존 argon2 해시와 호환
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return settings.PASSWORD_PBKDF2_ITERATIONS
+
@@ -0,0 +1,153 @@
+import json
+import statistics
+import time
+from datetime import date
+
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import get_hasher, get_hashers
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory, override_settings
+
+from accounts.models import Account
+
+BENCH_PASSWORD = "bench-Password-1234!"
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _measure(func, rounds: int) -> dict:
+    """호출당 wall/CPU 시간(ms). CPU는 process_time이라 해셔 내부 스레드까지 포함"""
+    func()  # 워밍업
+    walls = []
+    cpu_start = time.process_time()
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        walls.append((time.perf_counter() - started) * 1000)
+    cpu_ms = (time.process_time() - cpu_start) * 1000 / rounds
+    walls.sort()
+    return {
+        "wall_ms": round(statistics.mean(walls), 2),
+        "p95_ms": round(walls[min(len(walls) - 1, int(len(walls) * 0.95))], 2),
+        "cpu_ms": round(cpu_ms, 2),
+        # 코어 1개가 초당 처리할 수 있는 횟수 (CPU 시간 기준)
+        "per_core_per_sec": round(1000 / cpu_ms, 1) if cpu_ms else None,
+    }
+
+
+class Command(BaseCommand):
+    help = "비밀번호 해셔별 해시/검증 비용과 로그인(authenticate) 1회 CPU 비용, 코어당 처리량 측정"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rounds", type=int, default=20, help="측정 반복 횟수 (기본 20)")
+        parser.add_argument(
+            "--algorithm",
+            action="append",
+            dest="algorithms",
+            help="측정할 알고리즘 (argon2, pbkdf2_sha256 등, 여러 번 지정 가능. 기본 설정된 해셔 전체)",
+        )
+        parser.add_argument("--argon2-time-cost", type=int, help="PASSWORD_ARGON2_TIME_COST 대신 사용할 값")
+        parser.add_argument("--argon2-memory-cost", type=int, help="PASSWORD_ARGON2_MEMORY_COST(KiB) 대신 사용할 값")
+        parser.add_argument("--argon2-parallelism", type=int, help="PASSWORD_ARGON2_PARALLELISM 대신 사용할 값")
+        parser.add_argument("--pbkdf2-iterations", type=int, help="PASSWORD_PBKDF2_ITERATIONS 대신 사용할 값")
+        parser.add_argument(
+            "--authenticate",
+            action="store_true",
+            help="임시 회원으로 authenticate() 전체 경로(axes + ModelBackend)도 측정 (DB 변경은 롤백)",
+        )
+        parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+
+    def handle(self, *args, **options):
+        if options["rounds"] < 1:
+            raise CommandError("--rounds는 1 이상이어야 합니다.")
+        overrides = {
+            name: options[option]
+            for name, option in (
+                ("PASSWORD_ARGON2_TIME_COST", "argon2_time_cost"),
+                ("PASSWORD_ARGON2_MEMORY_COST", "argon2_memory_cost"),
+                ("PASSWORD_ARGON2_PARALLELISM", "argon2_parallelism"),
+                ("PASSWORD_PBKDF2_ITERATIONS", "pbkdf2_iterations"),
+            )
+            if options[option] is not None
+        }
+        with override_settings(**overrides):
+            results = {
+                "settings": {
+                    "strategy": settings.PASSWORD_HASHER_STRATEGY,
+                    "argon2": {
+                        "time_cost": settings.PASSWORD_ARGON2_TIME_COST,
+                        "memory_cost_kib": settings.PASSWORD_ARGON2_MEMORY_COST,
+                        "parallelism": settings.PASSWORD_ARGON2_PARALLELISM,
+                    },
+                    "pbkdf2_iterations": settings.PASSWORD_PBKDF2_ITERATIONS,
+                    "rounds": options["rounds"],
+                },
+                "hashers": self._bench_hashers(options["algorithms"], options["rounds"]),
+            }
+            if options["authenticate"]:
+                results["authenticate"] = self._bench_authenticate(options["rounds"])
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+            return
+        self.stdout.write(f"전략={results['settings']['strategy']} 반복={options['rounds']}회")
+        for algorithm, result in results["hashers"].items():
+            encode, verify = result["encode"], result["verify"]
+            self.stdout.write(
+                f"{algorithm:<16} 해시 {encode['wall_ms']}ms(p95 {encode['p95_ms']}) "
+                f"검증 {verify['wall_ms']}ms(p95 {verify['p95_ms']}) CPU {verify['cpu_ms']}ms "
+                f"-> 코어당 {verify['per_core_per_sec']}회/초"
+            )
+        if "authenticate" in results:
+            auth = results["authenticate"]
+            self.stdout.write(
+                f"authenticate()    {auth['wall_ms']}ms(p95 {auth['p95_ms']}) CPU {auth['cpu_ms']}ms "
+                f"-> 코어당 {auth['per_core_per_sec']}회/초 ({auth['algorithm']})"
+            )
+
+    def _bench_hashers(self, algorithms, rounds: int) -> dict:
+        if not algorithms:
+            algorithms = [hasher.algorithm for hasher in get_hashers()]
+        results = {}
+        for algorithm in algorithms:
+            try:
+                hasher = get_hasher(algorithm)
+            except ValueError:
+                raise CommandError(f"PASSWORD_HASHERS에 없는 알고리즘: {algorithm}")
+            encoded = hasher.encode(BENCH_PASSWORD, hasher.salt())
+            results[algorithm] = {
+                "encode": _measure(lambda: hasher.encode(BENCH_PASSWORD, hasher.salt()), rounds),
+                "verify": _measure(lambda: hasher.verify(BENCH_PASSWORD, encoded), rounds),
+            }
+        return results
+
+    def _bench_authenticate(self, rounds: int) -> dict:
+        request = RequestFactory().post("/accounts/login/", REMOTE_ADDR="127.0.0.1")
+        result = {}
+        try:
+            with transaction.atomic():
+                user = Account.objects.create_user(
+                    username="__bench_login__",
+                    email="bench-login@example.invalid",
+                    password=BENCH_PASSWORD,
+                    name="bench",
+                    birth_date=date(2000, 1, 1),
+                    phone="010-0000-0000",
+                    address="-",
+                )
+
+                def login_once():
+                    if authenticate(request, username=user.username, password=BENCH_PASSWORD) is None:
+                        raise CommandError("임시 회원 인증 실패 (인증 백엔드 설정 확인 필요)")
+
+                result = _measure(login_once, rounds)
+                result["algorithm"] = get_hasher().algorithm
+                raise _Rollback
+        except _Rollback:
+            pass
+        return result
+
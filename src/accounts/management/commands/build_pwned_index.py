@@ -0,0 +1,72 @@
+import os
+from typing import Iterator, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+def _iter_dump(path: str) -> Iterator[Tuple[str, int]]:
+    """해시 순 정렬 덤프(HASH:COUNT 한 줄씩) 또는 prefix별 range 파일 디렉터리(SUFFIX:COUNT)"""
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            prefix, ext = os.path.splitext(name)
+            if len(prefix) != 5 or ext != ".txt":
+                continue
+            with open(os.path.join(path, name), encoding="ascii") as fp:
+                for line in fp:
+                    suffix, _, count = line.strip().partition(":")
+                    if suffix:
+                        yield prefix.upper() + suffix.upper(), int(count or 1)
+        return
+    with open(path, encoding="ascii") as fp:
+        for line in fp:
+            digest, _, count = line.strip().partition(":")
+            if digest:
+                yield digest.upper(), int(count or 1)
+
+
+class Command(BaseCommand):
+    help = "Pwned Passwords SHA-1 덤프로 오프라인 유출 비밀번호 인덱스(정렬된 20바이트 해시 파일) 생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument("source", help="해시 순 정렬 덤프 파일 또는 prefix별 range 파일 디렉터리")
+        parser.add_argument(
+            "--output",
+            default=settings.PWNED_INDEX_PATH,
+            help="생성할 인덱스 파일 경로 (기본 PWNED_INDEX_PATH)",
+        )
+        parser.add_argument(
+            "--min-count",
+            type=int,
+            default=1,
+            help="출현 횟수가 이 값 이상인 해시만 포함 (파일 크기 축소용, 기본 1)",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"]
+        if not output:
+            raise CommandError("--output 또는 PWNED_INDEX_PATH를 지정해 주세요.")
+
+        tmp_path = f"{output}.tmp"
+        written = skipped = 0
+        previous = b""
+        with open(tmp_path, "wb") as out:
+            for digest, count in _iter_dump(options["source"]):
+                if count < options["min_count"]:
+                    skipped += 1
+                    continue
+                try:
+                    raw = bytes.fromhex(digest)
+                except ValueError:
+                    raise CommandError(f"잘못된 해시: {digest}")
+                if len(raw) != 20:
+                    raise CommandError(f"SHA-1 해시가 아닙니다: {digest}")
+                if raw <= previous:
+                    os.remove(tmp_path)
+                    raise CommandError("덤프가 해시 순으로 정렬되어 있지 않습니다 (ordered-by-hash 덤프 필요).")
+                out.write(raw)
+                previous = raw
+                written += 1
+        # 사용 중인 인덱스를 읽는 프로세스가 있어도 안전하게 교체
+        os.replace(tmp_path, output)
+        self.stdout.write(self.style.SUCCESS(f"{written}개 해시 기록 ({skipped}개 제외) -> {output}"))
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 12:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_alter_account_managers'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LoginLockout',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('IP', 'IP'), ('USERNAME', '아이디')], max_length=10)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('username', models.CharField(blank=True, max_length=150)),
+                ('failures', models.PositiveIntegerField()),
+                ('locked_until', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['created_at'], name='login_lockout_created_idx')],
+            },
+        ),
+    ]
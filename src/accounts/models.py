@@ -1,4 +1,5 @@
 from django.db import models
+from django.contrib.auth.hashers import acheck_password, check_password
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.core.validators import RegexValidator
 
@@ -55,6 +56,57 @@ class Account(AbstractUser):
             self.is_staff = False
             self.is_superuser = False
         super().save(*args, **kwargs)
+
+    def _rehash_later(self, raw_password):
+        # 해시 업그레이드는 응답 경로에서 저장하지 않고 백그라운드로 넘긴다
+        from accounts import rehash
+
+        if self.pk is None:
+            self.set_password(raw_password)
+            return
+        rehash.schedule(self.pk, raw_password, self.password)
+
+    def check_password(self, raw_password):
+        return check_password(raw_password, self.password, self._rehash_later)
+
+    async def acheck_password(self, raw_password):
+        async def setter(raw_password):
+            self._rehash_later(raw_password)
+
+        return await acheck_password(raw_password, self.password, setter)
+
+    def get_session_auth_fallback_hash(self):
+        from accounts import rehash
+
+        yield from super().get_session_auth_fallback_hash()
+        previous = rehash.session_fallback(self)
+        if previous:
+            yield previous
         
     def __str__(self):
         return self.username
+
+
+class LoginLockout(models.Model):
+    """로그인 잠금 이력 (실패 카운터는 Redis에만 두고 잠금이 걸릴 때만 기록)"""
+
+    class Scope(models.TextChoices):
+        IP = "IP", "IP"
+        USERNAME = "USERNAME", "아이디"
+
+    scope = models.CharField(max_length=10, choices=Scope.choices)
+    ip_address = models.GenericIPAddressField(null=True, blank=True)
+    username = models.CharField(max_length=150, blank=True)
+    failures = models.PositiveIntegerField()
+    locked_until = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"], name="login_lockout_created_idx"),
+        ]
+
+    def __str__(self):
+        target = self.username if self.scope == self.Scope.USERNAME else self.ip_address
+        return f"{self.get_scope_display()} {target} 잠금"
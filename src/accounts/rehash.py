@@ -0,0 +1,96 @@
+"""로그인 시 비밀번호 재해시를 응답 경로 밖에서 처리
+
+해셔 비용이나 전략을 바꾸면 Django는 로그인 성공 시 그 자리에서 새 해시를 만들고
+저장한다. 재해시는 검증만큼 비싸므로 요청 스레드에서 하지 않고 작은 스레드 풀에 넘긴다.
+- 저장은 비밀번호가 그 사이 바뀌지 않았을 때만 하는 조건부 UPDATE (동시 변경을 덮어쓰지 않음)
+- 세션 인증 해시는 비밀번호 해시에서 나오므로, 재해시 전 값으로 만든 세션이 로그아웃되지
+  않도록 이전 세션 해시를 캐시에 남겨 Account.get_session_auth_fallback_hash가 인정한다.
+- 같은 회원의 재해시는 한 번에 하나만 예약한다 (동시 로그인이 서로의 이전 세션 해시를 지우지 않도록).
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import close_old_connections, connection
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_REHASH_WORKERS, thread_name_prefix="rehash"
+        )
+    return _executor
+
+
+def fallback_key(user_id: int) -> str:
+    return f"account:rehash:{user_id}"
+
+
+def pending_key(user_id: int) -> str:
+    return f"account:rehash:pending:{user_id}"
+
+
+def session_fallback(user) -> Optional[str]:
+    """재해시 직전 비밀번호 해시로 만든 세션 인증 해시 (현재 비밀번호가 재해시 결과일 때만)"""
+    cached = cache.get(fallback_key(user.pk))
+    if cached and cached["to"] == user.password:
+        return cached["from"]
+    return None
+
+
+def rehash(user_id: int, raw_password: str, old_encoded: str) -> bool:
+    """새 해시로 바꾸고 저장했으면 True (그 사이 비밀번호가 바뀌었으면 False)"""
+    from accounts.models import Account
+
+    encoded = make_password(raw_password)
+    old_session_hash = Account(pk=user_id, password=old_encoded).get_session_auth_hash()
+    previous = cache.get(fallback_key(user_id))
+    cache.set(
+        fallback_key(user_id),
+        {"from": old_session_hash, "to": encoded},
+        settings.SESSION_COOKIE_AGE,
+    )
+    updated = Account.objects.filter(pk=user_id, password=old_encoded).update(password=encoded)
+    if not updated:
+        # 이 호출이 쓴 값일 때만 되돌린다 (다른 재해시가 그 사이 쓴 값은 남겨 둔다)
+        cached = cache.get(fallback_key(user_id))
+        if cached and cached["to"] == encoded:
+            if previous:
+                cache.set(fallback_key(user_id), previous, settings.SESSION_COOKIE_AGE)
+            else:
+                cache.delete(fallback_key(user_id))
+    return bool(updated)
+
+
+def _run(user_id: int, raw_password: str, old_encoded: str):
+    close_old_connections()
+    try:
+        rehash(user_id, raw_password, old_encoded)
+    except Exception:
+        logger.exception("비밀번호 재해시 실패: user=%s", user_id)
+    finally:
+        cache.delete(pending_key(user_id))
+        # 작업 스레드의 DB 커넥션이 남지 않도록 정리
+        connection.close()
+
+
+def schedule(user_id: int, raw_password: str, old_encoded: str):
+    """재해시 예약. 이미 예약된 재해시가 있으면 건너뛴다. PASSWORD_REHASH_ASYNC=False이면 바로 처리"""
+    # 작업이 비정상 종료돼도 표시가 영원히 남지 않도록 만료를 둔다
+    if not cache.add(pending_key(user_id), 1, 60):
+        return
+    if not settings.PASSWORD_REHASH_ASYNC:
+        try:
+            rehash(user_id, raw_password, old_encoded)
+        finally:
+            cache.delete(pending_key(user_id))
+        return
+    _get_executor().submit(_run, user_id, raw_password, old_encoded)
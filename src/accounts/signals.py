@@ -1,10 +1,13 @@
 import logging
+from django.contrib.auth import get_user_model
 from django.contrib.auth.signals import user_logged_in, user_login_failed
+from django.db.models.signals import post_save
 from django.dispatch import receiver
-from django.contrib.sessions.models import Session
-from django.utils import timezone
 from django.contrib import messages
 
+from accounts import availability
+from common import sessions
+
 
 logger = logging.getLogger("accounts.audit")
 
@@ -12,14 +15,17 @@ logger = logging.getLogger("accounts.audit")
 def log_login(sender, request, user, **kwargs):
     logger.info("로그인 성공: user=%s ip=%s", user.pk, request.META.get("REMOTE_ADDR"))
 
-    current_session_key = request.session.session_key
-    user_sessions = Session.objects.filter(expire_date__gte=timezone.now())
-    for session in user_sessions:
-        data = session.get_decoded()
-        if data.get("_auth_user_id") == str(user.pk) and session.session_key != current_session_key:
-            session.delete()
-            messages.error(request, "다른 기기에서의 로그인이 감지되어 해당 세션이 종료되었습니다.")
+    # 회원별 세션 셋으로 이 회원의 다른 세션만 찾아 종료 (세션 전체를 훑지 않음)
+    ended = sessions.delete_user_sessions(user.pk, exclude=request.session.session_key)
+    if ended:
+        messages.error(request, "다른 기기에서의 로그인이 감지되어 해당 세션이 종료되었습니다.")
 
 @receiver(user_login_failed)
 def log_login_failed(sender, credentials, request, **kwargs):
-    logger.warning("로그인 실패: email=%s ip=%s", credentials.get("username"), request.META.get("REMOTE_ADDR"))
\ No newline at end of file
+    logger.warning("로그인 실패: email=%s ip=%s", credentials.get("username"), request.META.get("REMOTE_ADDR"))
+
+
+# 가입/정보 변경 시 중복 확인 캐시('사용 가능')를 비움
+@receiver(post_save, sender=get_user_model())
+def forget_availability(sender, instance, **kwargs):
+    availability.forget(instance)
@@ -0,0 +1,211 @@
+"""로그인 요청 제한/실패 잠금 (Redis 슬라이딩 윈도우)
+
+카운터는 전부 Redis 정렬 셋(시도 시각 로그)에 두고 Lua 스크립트 1번으로
+오래된 항목 정리 -> 개수 확인 -> 기록 -> 잠금 설정을 원자적으로 처리한다.
+크리덴셜 스터핑처럼 실패가 몰려도 DB에는 잠금이 새로 걸릴 때만 LoginLockout 1행을 쓴다.
+- login:rate:ip:{ip}    IP당 로그인 요청 수 (LoginView)
+- login:fail:ip:{ip}, login:fail:user:{hash}   실패 수 (axes 핸들러)
+- login:lock:ip:{ip}, login:lock:user:{hash}   잠금 표시 (TTL = 잠금 시간)
+
+주의: 기존 axes DB 핸들러는 IP 기준으로만 잠갔지만 여기서는 아이디 기준 잠금도 건다.
+따라서 누구든 남의 아이디로 AXES_FAILURE_LIMIT번 틀린 비밀번호를 보내면 그 계정을
+AXES_COOLOFF_TIME 동안 잠글 수 있다(어느 IP에서 로그인하든 잠김). 대신 여러 IP로 나눠
+한 계정을 공격하는 시도를 막는다. 잠긴 계정은 관리자가 reset()/axes_reset_username으로 풀 수 있다.
+"""
+import hashlib
+import logging
+import secrets
+import time
+from datetime import timedelta
+from typing import Optional, Tuple
+
+from axes.handlers.base import AbstractAxesHandler, AxesBaseHandler
+from axes.helpers import get_client_username
+from axes.signals import user_locked_out
+from django.conf import settings
+from django.utils import timezone
+
+from common.redis_client import get_redis
+
+logger = logging.getLogger("accounts.audit")
+
+# KEYS[1]=윈도우 정렬 셋, KEYS[2]=잠금 키(선택)
+# ARGV: 현재 ms, 윈도우 ms, 한도, 멤버, 잠금 ms
+# 반환: {기록 후 개수, 허용 여부, 다시 시도까지 ms, 잠금 상태(0 없음, 1 이번에 잠금, 2 이미 잠김)}
+_HIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+local allowed, retry = 1, 0
+if count >= limit then
+    -- 한도를 넘은 시도는 기록하지 않아 정렬 셋 크기가 한도를 넘지 않는다
+    local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+    allowed, retry = 0, tonumber(oldest[2]) + window - now
+else
+    redis.call('ZADD', KEYS[1], now, ARGV[4])
+    redis.call('PEXPIRE', KEYS[1], window)
+    count = count + 1
+end
+local locked = 0
+-- 잠금이 풀린 뒤에도 윈도우 안 실패가 한도 이상이면 다시 잠근다
+if KEYS[2] and count >= limit then
+    if redis.call('SET', KEYS[2], count, 'PX', ARGV[5], 'NX') then
+        locked = 1
+    else
+        locked = 2
+    end
+end
+return {count, allowed, retry, locked}
+"""
+_hit = None
+
+
+def client_ip(request) -> str:
+    return getattr(request, "axes_ip_address", None) or request.META.get("REMOTE_ADDR", "")
+
+
+def _user_id(username: str) -> str:
+    # 아이디 길이/문자와 상관없이 키 크기를 고정
+    return hashlib.sha256(username.strip().lower().encode()).hexdigest()[:32]
+
+
+def _lockout_ms() -> int:
+    return int(settings.AXES_COOLOFF_TIME.total_seconds() * 1000)
+
+
+def _run(window_key: str, limit: int, window_seconds: int, lock_key: Optional[str] = None) -> Tuple[int, bool, int, int]:
+    global _hit
+    client = get_redis()
+    if _hit is None:
+        _hit = client.register_script(_HIT_SCRIPT)
+    keys = [window_key] + ([lock_key] if lock_key else [])
+    now_ms = int(time.time() * 1000)
+    count, allowed, retry_ms, locked = _hit(
+        keys=keys,
+        args=[now_ms, window_seconds * 1000, limit, f"{now_ms}:{secrets.token_hex(4)}", _lockout_ms()],
+    )
+    return int(count), bool(allowed), int(retry_ms), int(locked)
+
+
+def hit_rate(ip: str) -> int:
+    """IP의 로그인 요청 1회 기록. 한도 초과면 다시 시도까지 남은 초, 아니면 0"""
+    if not ip:
+        return 0
+    _, allowed, retry_ms, _ = _run(f"login:rate:ip:{ip}", settings.LOGIN_RATE_LIMIT, settings.LOGIN_RATE_WINDOW)
+    return 0 if allowed else max(1, retry_ms // 1000)
+
+
+def lock_remaining(ip: Optional[str], username: Optional[str]) -> int:
+    """IP/아이디 중 하나라도 잠겨 있으면 남은 초, 아니면 0 (Redis 왕복 1번)"""
+    keys = []
+    if ip:
+        keys.append(f"login:lock:ip:{ip}")
+    if username:
+        keys.append(f"login:lock:user:{_user_id(username)}")
+    if not keys:
+        return 0
+    pipe = get_redis().pipeline(transaction=False)
+    for key in keys:
+        pipe.pttl(key)
+    remaining = max(pipe.execute())
+    return (remaining + 999) // 1000 if remaining > 0 else 0
+
+
+def failure_count(ip: Optional[str], username: Optional[str]) -> int:
+    window_start = (time.time() - settings.LOGIN_FAILURE_WINDOW) * 1000
+    pipe = get_redis().pipeline(transaction=False)
+    if ip:
+        pipe.zcount(f"login:fail:ip:{ip}", window_start, "+inf")
+    if username:
+        pipe.zcount(f"login:fail:user:{_user_id(username)}", window_start, "+inf")
+    return max(pipe.execute() or [0])
+
+
+def register_failure(ip: Optional[str], username: Optional[str]) -> Tuple[int, bool]:
+    """실패 1회 기록. (최대 실패 수, 잠겨 있는지). 잠금이 새로 걸릴 때만 이력 저장"""
+    from accounts.models import LoginLockout
+
+    failures, is_locked, newly_locked = 0, False, []
+    targets = []
+    if username:
+        user_id = _user_id(username)
+        targets.append(
+            (LoginLockout.Scope.USERNAME, f"login:fail:user:{user_id}", f"login:lock:user:{user_id}", settings.AXES_FAILURE_LIMIT)
+        )
+    if ip:
+        targets.append(
+            (LoginLockout.Scope.IP, f"login:fail:ip:{ip}", f"login:lock:ip:{ip}", settings.LOGIN_IP_FAILURE_LIMIT)
+        )
+    for scope, window_key, lock_key, limit in targets:
+        count, _, _, locked = _run(window_key, limit, settings.LOGIN_FAILURE_WINDOW, lock_key)
+        failures = max(failures, count)
+        is_locked = is_locked or bool(locked)
+        if locked == 1:
+            newly_locked.append((scope, count))
+
+    if newly_locked:
+        locked_until = timezone.now() + timedelta(milliseconds=_lockout_ms())
+        LoginLockout.objects.bulk_create(
+            LoginLockout(
+                scope=scope,
+                ip_address=ip or None,
+                username=(username or "")[:150],
+                failures=count,
+                locked_until=locked_until,
+            )
+            for scope, count in newly_locked
+        )
+        logger.warning(
+            "로그인 잠금: scope=%s username=%s ip=%s",
+            ",".join(scope for scope, _ in newly_locked),
+            username,
+            ip,
+        )
+    return failures, is_locked
+
+
+def reset(ip: Optional[str] = None, username: Optional[str] = None) -> int:
+    """실패 카운터와 잠금 해제. 지운 키 수 반환"""
+    keys = []
+    if ip:
+        keys += [f"login:fail:ip:{ip}", f"login:lock:ip:{ip}"]
+    if username:
+        user_id = _user_id(username)
+        keys += [f"login:fail:user:{user_id}", f"login:lock:user:{user_id}"]
+    return get_redis().delete(*keys) if keys else 0
+
+
+class RedisAxesHandler(AbstractAxesHandler, AxesBaseHandler):
+    """axes 실패 기록/잠금 판정을 DB 대신 throttle 모듈로 처리 (settings.AXES_HANDLER)"""
+
+    def is_locked(self, request, credentials: dict = None) -> bool:
+        # 기본 핸들러와 같은 전제 조건 (AXES_ONLY_ADMIN_SITE, AXES_LOCK_OUT_AT_FAILURE)
+        if self.is_admin_site(request) or not settings.AXES_LOCK_OUT_AT_FAILURE:
+            return False
+        return lock_remaining(client_ip(request), get_client_username(request, credentials)) > 0
+
+    def get_failures(self, request, credentials: dict = None) -> int:
+        return failure_count(client_ip(request), get_client_username(request, credentials))
+
+    def user_login_failed(self, sender, credentials: dict, request=None, **kwargs):
+        if request is None or self.is_whitelisted(request, credentials):
+            return
+        username = get_client_username(request, credentials)
+        failures, locked = register_failure(client_ip(request), username)
+        request.axes_failures_since_start = failures
+        if locked and settings.AXES_LOCK_OUT_AT_FAILURE:
+            request.axes_locked_out = True
+            request.axes_credentials = credentials
+            user_locked_out.send("axes", request=request, username=username, ip_address=client_ip(request))
+
+    def user_logged_in(self, sender, request, user, **kwargs):
+        # 로그인에 성공하면 해당 아이디의 실패 기록만 지운다 (IP 기록은 유지)
+        reset(username=user.get_username())
+
+    def user_logged_out(self, sender, request, user, **kwargs):
+        pass
+
+    def reset_attempts(self, *, ip_address: str = None, username: str = None, ip_or_username: bool = False) -> int:
+        return reset(ip_address, username)
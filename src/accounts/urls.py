@@ -8,4 +8,6 @@ urlpatterns = [
     path("login/", views.LoginView.as_view(), name="login"),
     path("logout/", LogoutView.as_view(next_page="home"), name="logout"),
     path("signup/", views.SignUpView.as_view(), name="signup"),
+    path("signup/availability/", views.availability_check, name="signup_availability"),
+    path("signup/mail-status/", views.SignUpMailStatusView.as_view(), name="signup_mail_status"),
 ]
\ No newline at end of file
@@ -2,21 +2,22 @@ import logging
 import secrets
 from datetime import datetime, timedelta
 
-from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import authenticate, login
 from django.contrib.auth import views as auth_views
-from django.core.mail import send_mail
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.http import JsonResponse
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
 from django.utils import timezone
 from django.utils.crypto import constant_time_compare
+from django.views import View
 from django.views.generic import FormView
 
-from django.utils.decorators import method_decorator
-from django_ratelimit.decorators import ratelimit
-
-logger = logging.getLogger(__name__)
+from accounts import availability, throttle
+from common.mailqueue import enqueue, get_status
+from common.models import OutboundEmail
 
 from .forms import (
     LoginForm,
@@ -28,8 +29,9 @@ from .forms import (
     save_signup_session,
 )
 
+logger = logging.getLogger(__name__)
+
 # Django 기본 인증 뷰를 상속하여 커스터마이징
-@method_decorator(ratelimit(key="ip", rate="5/m", method="POST", block=False), name="dispatch")
 class LoginView(auth_views.LoginView):
     template_name = "accounts/login.html"
     form_class = LoginForm
@@ -37,7 +39,8 @@ class LoginView(auth_views.LoginView):
     redirect_authenticated_user = True
     
     def dispatch(self, request, *args, **kwargs):
-        if getattr(request, "limited", False):
+        # IP당 요청 수 제한 (Redis 슬라이딩 윈도우, accounts/throttle.py)
+        if request.method == "POST" and throttle.hit_rate(throttle.client_ip(request)):
             logger.warning("로그인 시도 과다 - IP: %s", request.META.get("REMOTE_ADDR"))
             messages.error(request, "로그인 시도가 너무 많습니다. 잠시 후 다시 시도해 주세요.")
             return self.get(request, *args, **kwargs)
@@ -97,16 +100,17 @@ class SignUpView(FormView):
             "tries": 0, #시도 횟수
             "verified": False,
         }
+        # SMTP를 기다리지 않도록 메일 큐에 넣기만 하고, 발송 결과는 mail_id로 조회
+        payload["mail_id"] = enqueue("Bijou 인증번호", f"인증번호: {code}", [form.cleaned_data["email"]])
         save_signup_session(request, payload)
-        logger.info("세션에 인증 정보 저장 - email=%s", form.cleaned_data.get("email"))
-        send_mail("Bijou 인증번호", f"인증번호: {code}", settings.DEFAULT_FROM_EMAIL, [form.cleaned_data["email"]])
-        logger.info("인증 이메일 발송 완료 - email=%s", form.cleaned_data.get("email"))
-        messages.info(request, "이메일로 인증번호를 보냈습니다.")
+        logger.info("인증 이메일 발송 요청 - email=%s mail_id=%s", form.cleaned_data.get("email"), payload["mail_id"])
+        messages.info(request, "이메일로 인증번호를 보내고 있습니다.")
         ctx = self.get_context_data(
             form=form,
             show_verification=True,
             verification_form=VerificationForm(),
             verification_passed=False,
+            mail_status=OutboundEmail.Status.PENDING,
         )
         return self.render_to_response(ctx)
     
@@ -199,7 +203,14 @@ class SignUpView(FormView):
             )
             return self.render_to_response(ctx)
 
-        user = SignUpForm.create_user_from_payload(session_data["data"])
+        try:
+            user = SignUpForm.create_user_from_payload(session_data["data"])
+        except IntegrityError:
+            # 인증 중에 같은 닉네임/이메일/전화번호로 다른 가입이 먼저 끝난 경우
+            logger.info("가입 시점 중복 - email=%s", session_data["data"].get("email"))
+            clear_signup_session(request)
+            messages.error(request, "이미 사용 중인 정보가 있습니다. 입력 내용을 확인해 주세요.")
+            return redirect("accounts:signup")
         auth_user = authenticate(
             request,
             username=user.username,
@@ -214,3 +225,29 @@ class SignUpView(FormView):
         logger.info("회원가입 완료 및 자동 로그인 - username=%s", user.username)
         messages.success(request, "회원가입이 완료되었습니다.")
         return redirect(self.get_success_url())
+
+
+class SignUpMailStatusView(View):
+    """회원가입 인증 메일 발송 상태 (signup.js가 폴링)"""
+
+    def get(self, request, *args, **kwargs):
+        session_data = get_signup_session(request)
+        mail_id = session_data.get("mail_id") if session_data else None
+        if not mail_id:
+            return JsonResponse({"status": None}, status=404)
+        return JsonResponse({"status": get_status(mail_id)})
+
+
+AVAILABILITY_RATE = 30 # IP당 분당 조회 수 (가입 여부 대량 조회 방지)
+
+
+async def availability_check(request):
+    """실시간 중복 확인 JSON (?username=&email=&phone=)"""
+    ip = request.META.get("REMOTE_ADDR", "")
+    key = f"signup:avail:rate:{ip}"
+    await cache.aadd(key, 0, timeout=60)
+    if await cache.aincr(key) > AVAILABILITY_RATE:
+        return JsonResponse({"error": "too many requests"}, status=429)
+    values = {field: request.GET.get(field, "") for field in availability.FIELDS}
+    result = await availability.acheck(values)
+    return JsonResponse({"available": result})
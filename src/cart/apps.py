@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CartConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'cart'
+
+    def ready(self):
+        # 로그인 시 비회원 장바구니 병합, 찜 상품 캐시 갱신
+        import cart.signals  # noqa: F401
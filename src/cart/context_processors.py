@@ -0,0 +1,16 @@
+from django.utils.functional import SimpleLazyObject
+
+from cart import store
+from cart.pricing import cart_summary
+
+EMPTY_SUMMARY = {"count": 0, "total": 0, "has_stale": False}
+
+
+def cart_badge(request):
+    """헤더 장바구니 배지. 템플릿에서 실제로 쓸 때만 조회하고 장바구니를 새로 만들지 않는다"""
+
+    def _summary():
+        cart_id = store.get_cart_id(request, create=False)
+        return cart_summary(cart_id) if cart_id else EMPTY_SUMMARY
+
+    return {"cart_summary": SimpleLazyObject(_summary)}
@@ -0,0 +1,157 @@
+"""버려진 장바구니 정리
+
+다음 장바구니를 Cart/CartItem 테이블에서 지운다.
+  - 비활성 장바구니 (로그인 병합 등으로 더 이상 쓰지 않음)
+  - 세션이 만료된 비회원 장바구니
+  - N일 동안 변경이 없는 장바구니
+Redis에 사본이 살아 있거나 반영 대기 중인 장바구니는 사용 중으로 보고 건너뛴다.
+"""
+import gzip
+import json
+import logging
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from importlib import import_module
+from typing import Dict, Iterable, List, Optional, Set
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from cart import store
+from cart.models import Cart, CartItem
+from common.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+CART_FIELDS = ("id", "user_id", "session_key", "is_active", "created_at", "updated_at")
+ITEM_FIELDS = ("cart_id", "product_id", "product_option_id", "quantity", "unit_price", "discount_amount")
+
+REASON_INACTIVE = "inactive"
+REASON_SESSION_EXPIRED = "session_expired"
+REASON_STALE = "stale"
+
+
+def _live_session_keys(session_keys: Iterable[str]) -> Set[str]:
+    """아직 유효한 세션 키만 반환 (DB 세션은 쿼리 1번, Redis 세션은 파이프라인 1번, 그 외 엔진은 키별 확인)"""
+    session_keys = [key for key in set(session_keys) if key]
+    if not session_keys:
+        return set()
+    engine = import_module(settings.SESSION_ENGINE)
+    session_store = engine.SessionStore
+    if hasattr(session_store, "get_model_class"):
+        return set(
+            session_store.get_model_class()
+            .objects.filter(session_key__in=session_keys, expire_date__gt=timezone.now())
+            .values_list("session_key", flat=True)
+        )
+    if hasattr(session_store, "existing_keys"):
+        return session_store.existing_keys(session_keys)
+    checker = session_store()
+    return {key for key in session_keys if checker.exists(key)}
+
+
+def _cached_cart_ids(cart_ids: List[int]) -> Set[int]:
+    """Redis에 사본이 있거나 DB 반영 대기 중인 장바구니 id"""
+    pipe = get_redis().pipeline()
+    for cart_id in cart_ids:
+        pipe.exists(store.cart_key(cart_id))
+        pipe.sismember(store.DIRTY_SET, cart_id)
+    results = pipe.execute()
+    return {
+        cart_id
+        for index, cart_id in enumerate(cart_ids)
+        if results[index * 2] or results[index * 2 + 1]
+    }
+
+
+def _classify(rows: List[Dict], cutoff: datetime) -> Dict[int, str]:
+    expired_candidates = [row["session_key"] for row in rows if not row["user_id"] and row["is_active"]]
+    live_sessions = _live_session_keys(expired_candidates)
+    reasons = {}
+    for row in rows:
+        if not row["is_active"]:
+            reasons[row["id"]] = REASON_INACTIVE
+        elif not row["user_id"] and row["session_key"] not in live_sessions:
+            reasons[row["id"]] = REASON_SESSION_EXPIRED
+        elif row["updated_at"] < cutoff:
+            reasons[row["id"]] = REASON_STALE
+    return reasons
+
+
+def collect_carts(
+    days: int,
+    *,
+    batch_size: int = 500,
+    export_path: Optional[str] = None,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """정리 대상 장바구니를 id 키셋 배치로 삭제하고 사유별 건수를 반환
+
+    배치마다 짧은 트랜잭션에서 잠금 -> (보관 기록) -> CartItem/Cart 삭제를 수행하므로
+    테이블 전체를 오래 잠그지 않는다. 시작 이후 변경된 장바구니는 건드리지 않는다.
+    export_path를 주면 삭제한 장바구니와 라인을 JSONL.gz로 남긴다.
+    """
+    started_at = timezone.now()
+    cutoff = started_at - timedelta(days=days)
+    report = Counter()
+    export_file = gzip.open(export_path, "at", encoding="utf-8") if export_path and not dry_run else None
+    last_id = 0
+    try:
+        while True:
+            rows = list(
+                Cart.objects.filter(pk__gt=last_id)
+                .order_by("pk")
+                .values(*CART_FIELDS)[:batch_size]
+            )
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+            reasons = _classify(rows, cutoff)
+            if not reasons:
+                continue
+            in_use = _cached_cart_ids(list(reasons))
+            report["skipped_in_use"] += len(in_use)
+            targets = {cart_id: reason for cart_id, reason in reasons.items() if cart_id not in in_use}
+            if not targets:
+                continue
+            if dry_run:
+                report.update(targets.values())
+                report["carts"] += len(targets)
+                continue
+            _delete_batch(targets, started_at, report, export_file)
+            logger.info("장바구니 정리 진행: carts=%d items=%d (last_id=%d)", report["carts"], report["items"], last_id)
+    finally:
+        if export_file:
+            export_file.close()
+    return dict(report)
+
+
+def _delete_batch(targets: Dict[int, str], started_at: datetime, report: Counter, export_file=None):
+    with transaction.atomic():
+        # 잠근 뒤 다시 확인해 그 사이 갱신된 장바구니는 제외
+        carts = list(
+            Cart.objects.select_for_update()
+            .filter(pk__in=list(targets), updated_at__lt=started_at)
+            .order_by("pk")
+            .values(*CART_FIELDS)
+        )
+        if not carts:
+            return
+        cart_ids = [cart["id"] for cart in carts]
+        if export_file:
+            items_by_cart = defaultdict(list)
+            for item in CartItem.objects.filter(cart_id__in=cart_ids).order_by("id").values(*ITEM_FIELDS):
+                items_by_cart[item.pop("cart_id")].append(item)
+            for cart in carts:
+                line = dict(cart, reason=targets[cart["id"]], items=items_by_cart.get(cart["id"], []))
+                export_file.write(json.dumps(line, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n")
+        item_count, _ = CartItem.objects.filter(cart_id__in=cart_ids).delete()
+        Cart.objects.filter(pk__in=cart_ids).delete()
+
+    store.evict(cart_ids)
+    store.forget_owners((cart["user_id"], cart["session_key"]) for cart in carts)
+    report["carts"] += len(carts)
+    report["items"] += item_count
+    report.update(targets[cart_id] for cart_id in cart_ids)
@@ -0,0 +1,51 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from cart.store import flush, requeue_dead
+
+
+class Command(BaseCommand):
+    help = "Redis 장바구니 변경분을 Cart/CartItem 테이블에 반영 (write-behind)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.CART_FLUSH_BATCH_SIZE,
+            help="한 번에 반영할 장바구니 수(기본 CART_FLUSH_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 주기적으로 반영",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="--loop 시 대기 간격(초, 기본 2)",
+        )
+        parser.add_argument(
+            "--requeue-dead",
+            action="store_true",
+            help="반영을 반복 실패해 cart:dead 셋에 옮긴 장바구니를 다시 반영 대상에 넣는다",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        if options["requeue_dead"]:
+            self.stdout.write(f"장바구니 {requeue_dead()}개를 다시 반영 대상에 넣음")
+        while True:
+            total = 0
+            while True:
+                flushed = flush(batch_size=batch_size)
+                total += flushed
+                if flushed < batch_size:
+                    break
+            if total:
+                self.stdout.write(f"장바구니 {total}개 반영")
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
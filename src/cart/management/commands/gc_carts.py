@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from cart.gc import REASON_INACTIVE, REASON_SESSION_EXPIRED, REASON_STALE, collect_carts
+
+
+class Command(BaseCommand):
+    help = "비활성/세션 만료/장기 미사용 장바구니를 배치로 삭제"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.CART_GC_DAYS,
+            help="N일 동안 변경이 없는 장바구니를 삭제 (기본 CART_GC_DAYS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 검사/삭제할 장바구니 수(기본 500)",
+        )
+        parser.add_argument(
+            "--export",
+            dest="export_path",
+            help="삭제한 장바구니를 JSONL.gz 파일로 기록할 경로",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="삭제하지 않고 대상 장바구니 수만 출력",
+        )
+
+    def handle(self, *args, **options):
+        report = collect_carts(
+            options["days"],
+            batch_size=options["batch_size"],
+            export_path=options["export_path"],
+            dry_run=options["dry_run"],
+        )
+        detail = (
+            f"비활성 {report.get(REASON_INACTIVE, 0)}, "
+            f"세션 만료 {report.get(REASON_SESSION_EXPIRED, 0)}, "
+            f"{options['days']}일 미사용 {report.get(REASON_STALE, 0)}, "
+            f"사용 중이라 건너뜀 {report.get('skipped_in_use', 0)}"
+        )
+        if options["dry_run"]:
+            self.stdout.write(f"삭제 대상 장바구니: {report.get('carts', 0)}개 ({detail})")
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"장바구니 {report.get('carts', 0)}개, 상품 {report.get('items', 0)}건 삭제 ({detail})"
+            )
+        )
@@ -0,0 +1,100 @@
+import logging
+from typing import Optional
+
+from django.db import connection, transaction
+
+from cart import store
+from cart.models import Cart, CartItem
+
+logger = logging.getLogger(__name__)
+
+LINE_FIELDS = ("id", "product_id", "product_option_id", "quantity", "unit_price", "discount_amount")
+
+
+def merge_session_cart(guest_cart_id: int, user) -> Optional[int]:
+    """비회원 장바구니를 회원의 활성 장바구니로 합치고 회원 장바구니 id를 반환
+
+    장바구니 크기와 상관없이 고정된 수의 SQL로 처리한다.
+    - 회원 장바구니가 없으면 비회원 장바구니의 소유자만 바꾼다 (UPDATE 1번)
+    - 있으면 양쪽 라인을 한 번씩 읽어 수량을 합친 뒤
+      bulk_create(update_conflicts=True) 한 번으로 upsert 하고 비회원 장바구니를 비활성화한다.
+    """
+    user_cart_id = (
+        Cart.objects.filter(user=user, is_active=True).values_list("pk", flat=True).first()
+    )
+    # Redis에만 있는 변경분을 먼저 DB에 반영
+    store.flush([cart_id for cart_id in (guest_cart_id, user_cart_id) if cart_id])
+
+    with transaction.atomic():
+        guest = (
+            Cart.objects.select_for_update()
+            .filter(pk=guest_cart_id, is_active=True, user__isnull=True)
+            .first()
+        )
+        if guest is None:
+            return user_cart_id
+
+        if user_cart_id is None:
+            Cart.objects.filter(pk=guest.pk).update(user=user, session_key="")
+            merged_cart_id = guest.pk
+        else:
+            _merge_items(guest.pk, user_cart_id)
+            Cart.objects.filter(pk=guest.pk).update(is_active=False)
+            merged_cart_id = user_cart_id
+
+    store.evict([guest_cart_id, merged_cart_id])
+    store.forget_owner(user_id=user.pk)
+    logger.info("장바구니 병합: guest_cart=%s -> cart=%s user=%s", guest_cart_id, merged_cart_id, user.pk)
+    return merged_cart_id
+
+
+def _merge_items(guest_cart_id: int, user_cart_id: int):
+    guest_lines = list(CartItem.objects.filter(cart_id=guest_cart_id).values(*LINE_FIELDS))
+    if not guest_lines:
+        return
+    existing = {
+        (line["product_id"], line["product_option_id"]): line
+        for line in CartItem.objects.filter(
+            cart_id=user_cart_id,
+            product_id__in={line["product_id"] for line in guest_lines},
+        ).values(*LINE_FIELDS)
+    }
+
+    merged = []
+    for line in guest_lines:
+        current = existing.get((line["product_id"], line["product_option_id"]))
+        if current:
+            # 이미 담긴 상품은 수량만 더하고 기존 가격 스냅샷 유지.
+            # PK를 지정해 두면 옵션이 NULL인 라인(유니크 제약이 NULL을 구분하지 않음)도
+            # 확실히 충돌 -> UPDATE 경로로 간다.
+            merged.append(
+                CartItem(
+                    pk=current["id"],
+                    cart_id=user_cart_id,
+                    product_id=current["product_id"],
+                    product_option_id=current["product_option_id"],
+                    quantity=current["quantity"] + line["quantity"],
+                    unit_price=current["unit_price"],
+                    discount_amount=current["discount_amount"],
+                )
+            )
+        else:
+            merged.append(
+                CartItem(
+                    cart_id=user_cart_id,
+                    product_id=line["product_id"],
+                    product_option_id=line["product_option_id"],
+                    quantity=line["quantity"],
+                    unit_price=line["unit_price"],
+                    discount_amount=line["discount_amount"],
+                )
+            )
+
+    # MySQL은 충돌 대상 지정 없이 ON DUPLICATE KEY UPDATE, 그 외 DB는 PK를 충돌 대상으로 지정
+    unique_fields = ["pk"] if connection.features.supports_update_conflicts_with_target else None
+    CartItem.objects.bulk_create(
+        merged,
+        update_conflicts=True,
+        unique_fields=unique_fields,
+        update_fields=["quantity", "updated_at"],
+    )
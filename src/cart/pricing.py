@@ -0,0 +1,121 @@
+import json
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from django.db.models import FilteredRelation, Q
+
+from cart import store
+from common import metrics
+from common.redis_client import get_redis
+from product.models import Product
+
+SUMMARY_TTL = 60 # 헤더 배지용 요약 캐시 (장바구니 변경 시 즉시 삭제, 상품 가격 변경은 최대 1분 늦게 반영)
+
+LineKey = Tuple[int, Optional[int]]
+
+
+def load_current_prices(lines: List[Dict]) -> Dict[LineKey, Dict]:
+    """라인들의 현재 단가(판매가 + 옵션 추가금)와 구매 가능 여부를 쿼리 1번으로 조회
+
+    상품 테이블에 요청된 옵션만 조건으로 LEFT JOIN 하므로
+    옵션 없는 라인과 옵션 라인을 한 번에 읽는다.
+    """
+    product_ids = {line["product_id"] for line in lines}
+    option_ids = {line["product_option_id"] for line in lines if line["product_option_id"]}
+    if not product_ids:
+        return {}
+
+    queryset = Product.objects.filter(pk__in=product_ids).order_by().annotate(
+        current_sale_price=Product.sale_price_expression()
+    )
+    fields = ["id", "current_sale_price", "is_active"]
+    if option_ids:
+        queryset = queryset.annotate(
+            requested_option=FilteredRelation("options", condition=Q(options__id__in=option_ids))
+        )
+        fields += ["requested_option__id", "requested_option__extra_price", "requested_option__is_active"]
+
+    prices = {}
+    for row in queryset.values(*fields):
+        sale_price = row["current_sale_price"]
+        prices[(row["id"], None)] = {"unit_price": sale_price, "available": row["is_active"]}
+        option_id = row.get("requested_option__id")
+        if option_id:
+            prices[(row["id"], option_id)] = {
+                "unit_price": sale_price + row["requested_option__extra_price"],
+                "available": row["is_active"] and row["requested_option__is_active"],
+            }
+    return prices
+
+
+def price_lines(lines: List[Dict]) -> Dict:
+    """라인별 현재가 비교(stale 표시)와 합계를 한 번에 계산"""
+    prices = load_current_prices(lines)
+    priced = []
+    subtotal = discount_total = Decimal("0")
+    count = stale_count = unavailable_count = 0
+    for line in lines:
+        current = prices.get((line["product_id"], line["product_option_id"]))
+        available = bool(current and current["available"])
+        current_price = current["unit_price"] if current else line["unit_price"]
+        stale = available and current_price != line["unit_price"]
+        line_subtotal = line["unit_price"] * line["quantity"]
+        line_discount = line["discount_amount"] * line["quantity"]
+        if available:
+            subtotal += line_subtotal
+            discount_total += line_discount
+            count += line["quantity"]
+        else:
+            unavailable_count += 1
+        stale_count += int(stale)
+        priced.append(
+            {
+                **line,
+                "current_unit_price": current_price,
+                "line_total": line_subtotal - line_discount,
+                "is_stale": stale,
+                "is_available": available,
+            }
+        )
+    return {
+        "items": priced,
+        "count": count,
+        "subtotal": subtotal,
+        "discount_total": discount_total,
+        "total": subtotal - discount_total,
+        "stale_count": stale_count,
+        "unavailable_count": unavailable_count,
+    }
+
+
+def price_cart(cart_id: int) -> Dict:
+    return price_lines(store.get_lines(cart_id))
+
+
+def reprice_cart(cart_id: int) -> int:
+    """가격이 바뀐 라인의 단가 스냅샷을 현재가로 일괄 갱신하고 갱신한 라인 수 반환"""
+    result = price_cart(cart_id)
+    stale = [
+        (item["product_id"], item["product_option_id"], item["current_unit_price"], item["discount_amount"])
+        for item in result["items"]
+        if item["is_stale"]
+    ]
+    store.update_prices(cart_id, stale)
+    return len(stale)
+
+
+def cart_summary(cart_id: int) -> Dict:
+    """헤더 배지용 요약(수량/합계/가격 변동 여부). Redis에 짧게 캐시"""
+    client = get_redis()
+    cached = client.get(store.summary_key(cart_id))
+    metrics.cache_result("cart_summary", bool(cached))
+    if cached:
+        return json.loads(cached)
+    result = price_cart(cart_id)
+    summary = {
+        "count": result["count"],
+        "total": float(result["total"]),
+        "has_stale": bool(result["stale_count"] or result["unavailable_count"]),
+    }
+    client.set(store.summary_key(cart_id), json.dumps(summary), ex=SUMMARY_TTL)
+    return summary
@@ -0,0 +1,41 @@
+from django.contrib.auth.signals import user_logged_in
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from cart import wishlist
+from cart.merge import merge_session_cart
+from cart.models import Wishlist, WishlistItem
+from cart.store import SESSION_CART_KEY
+
+
+# 로그인 시 비회원 장바구니를 회원 장바구니로 병합
+# (login()이 세션 키를 바꾸므로 세션에 저장해 둔 장바구니 id를 사용)
+@receiver(user_logged_in)
+def merge_guest_cart(sender, request, user, **kwargs):
+    if request is None or not hasattr(request, "session"):
+        return
+    guest_cart_id = request.session.pop(SESSION_CART_KEY, None)
+    if guest_cart_id:
+        merge_session_cart(guest_cart_id, user)
+
+
+# 찜 추가/삭제 시 회원별 찜 상품 id 캐시 갱신 (커밋 후 반영)
+def _wishlist_owner(instance):
+    return Wishlist.objects.filter(pk=instance.wishlist_id).values_list("user_id", flat=True).first()
+
+
+@receiver(post_save, sender=WishlistItem)
+def on_wishlist_item_save(sender, instance, created, **kwargs):
+    if not created:
+        return
+    user_id = _wishlist_owner(instance)
+    if user_id:
+        transaction.on_commit(lambda: wishlist.mark_added(user_id, instance.product_id))
+
+
+@receiver(post_delete, sender=WishlistItem)
+def on_wishlist_item_delete(sender, instance, **kwargs):
+    user_id = _wishlist_owner(instance)
+    if user_id:
+        transaction.on_commit(lambda: wishlist.mark_removed(user_id, instance.product_id))
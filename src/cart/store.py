@@ -0,0 +1,391 @@
+"""Redis 해시 기반 장바구니 저장소
+
+장바구니 1개 = Redis 해시 1개(cart:{id}). 상품 라인마다 두 필드를 둔다.
+  "{product_id}:{option_id}:q" -> 수량 (HINCRBY로 원자적 증감)
+  "{product_id}:{option_id}:p" -> "단가|수량당 할인" (담을 당시 가격 스냅샷)
+추가/수정/삭제는 Redis 왕복 1번으로 끝나고, 변경된 장바구니 id는 cart:dirty 셋에
+쌓였다가 flush()가 배치로 Cart/CartItem 테이블에 반영한다(write-behind).
+Redis에 없는 장바구니는 DB에서 읽어 다시 채운다.
+"""
+import logging
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from cart.models import Cart, CartItem
+from common import metrics
+from common.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+DIRTY_SET = "cart:dirty"
+DEAD_SET = "cart:dead"  # 반영을 계속 실패해 자동 재시도를 멈춘 장바구니
+FLUSH_FAILURES = "cart:flush_failures"  # cart_id -> 연속 반영 실패 횟수
+LOADED_FIELD = "__loaded__" # 빈 장바구니도 '적재됨'을 표시하기 위한 필드
+SESSION_CART_KEY = "cart_id"
+
+# 키가 없을 때만 DB 내용을 채운다 (동시에 들어온 변경을 덮어쓰지 않도록)
+_HYDRATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+    return 1
+end
+return 0
+"""
+_hydrate = None
+
+# 변경 스크립트 공통: KEYS = 장바구니 해시, dirty 셋, 요약 캐시 / ARGV[1] = cart_id, ARGV[2] = TTL
+# 해시가 없으면(만료) -1을 돌려 호출자가 DB에서 채운 뒤 다시 실행한다.
+# 확인과 변경을 한 스크립트에서 해야 그 사이 만료로 일부 라인만 있는 해시가 생기지 않는다.
+_TOUCH = """
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('SADD', KEYS[2], ARGV[1])
+redis.call('DEL', KEYS[3])
+"""
+_MUTATE_SCRIPTS = {
+    # ARGV[3] 수량 필드, ARGV[4] 증감, ARGV[5] 가격 필드, ARGV[6] 가격 스냅샷 -> 변경 후 수량
+    "add": """
+if redis.call('EXISTS', KEYS[1]) == 0 then return -1 end
+local quantity = redis.call('HINCRBY', KEYS[1], ARGV[3], ARGV[4])
+redis.call('HSETNX', KEYS[1], ARGV[5], ARGV[6])
+""" + _TOUCH + """
+return quantity
+""",
+    # ARGV[3] 수량 필드, ARGV[4] 수량, ARGV[5] 가격 필드 -> 라인이 없으면 0
+    "set": """
+if redis.call('EXISTS', KEYS[1]) == 0 then return -1 end
+if redis.call('HEXISTS', KEYS[1], ARGV[5]) == 0 then return 0 end
+redis.call('HSET', KEYS[1], ARGV[3], ARGV[4])
+""" + _TOUCH + """
+return 1
+""",
+    # ARGV[3] 수량 필드, ARGV[4] 가격 필드 -> 지운 필드 수
+    "remove": """
+if redis.call('EXISTS', KEYS[1]) == 0 then return -1 end
+local removed = redis.call('HDEL', KEYS[1], ARGV[3], ARGV[4])
+""" + _TOUCH + """
+return removed
+""",
+    # ARGV[3..] 가격 필드/값 쌍. 해시가 없으면 다음 적재 때 가격을 다시 계산하므로 건너뛴다
+    "prices": """
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+redis.call('HSET', KEYS[1], unpack(ARGV, 3))
+""" + _TOUCH + """
+return 1
+""",
+}
+_mutate: Dict[str, object] = {}
+
+
+def cart_key(cart_id: int) -> str:
+    return f"cart:{cart_id}"
+
+
+def summary_key(cart_id: int) -> str:
+    return f"cart:summary:{cart_id}"
+
+
+def _owner_key(user_id: Optional[int] = None, session_key: Optional[str] = None) -> str:
+    return f"cart:owner:u:{user_id}" if user_id else f"cart:owner:s:{session_key}"
+
+
+def _line_id(product_id: int, option_id: Optional[int]) -> str:
+    return f"{product_id}:{option_id or 0}"
+
+
+def _price_value(unit_price: Decimal, discount_amount: Decimal) -> str:
+    return f"{unit_price}|{discount_amount}"
+
+
+#------------------- 장바구니 식별 -------------------#
+
+def get_cart_id(request, create: bool = True) -> Optional[int]:
+    """요청 사용자(회원/비회원 세션)의 활성 장바구니 id
+
+    소유자 -> 장바구니 id 매핑도 Redis에 두어 평소에는 DB를 조회하지 않는다.
+    """
+    user_id = request.user.pk if request.user.is_authenticated else None
+    if not user_id and not request.session.session_key:
+        if not create:
+            return None
+        request.session.save()
+    session_key = None if user_id else request.session.session_key
+
+    client = get_redis()
+    owner_key = _owner_key(user_id, session_key)
+    cached = client.get(owner_key)
+    metrics.cache_result("cart_owner", bool(cached))
+    if cached:
+        cart_id = int(cached)
+    else:
+        lookup = {"user_id": user_id} if user_id else {"session_key": session_key}
+        cart_id = (
+            Cart.objects.filter(is_active=True, **lookup)
+            .values_list("pk", flat=True)
+            .first()
+        )
+        if cart_id is None:
+            if not create:
+                return None
+            try:
+                with transaction.atomic():
+                    cart_id = Cart.objects.create(**lookup).pk
+            except IntegrityError:
+                # 동시 생성 시 부분 유니크 제약에 걸린 쪽은 기존 장바구니 사용
+                cart_id = Cart.objects.get(is_active=True, **lookup).pk
+        client.set(owner_key, cart_id, ex=settings.CART_REDIS_TTL)
+
+    if not user_id and request.session.get(SESSION_CART_KEY) != cart_id:
+        # 로그인 시 세션 키가 바뀌어도 병합할 수 있도록 세션에도 기록
+        request.session[SESSION_CART_KEY] = cart_id
+    return cart_id
+
+
+def forget_owner(user_id: Optional[int] = None, session_key: Optional[str] = None):
+    get_redis().delete(_owner_key(user_id, session_key))
+
+
+def forget_owners(owners: Iterable[Tuple[Optional[int], Optional[str]]]):
+    """(user_id, session_key) 목록의 소유자 매핑을 한 번에 삭제"""
+    keys = [_owner_key(user_id, session_key) for user_id, session_key in owners]
+    if keys:
+        get_redis().delete(*keys)
+
+
+#------------------- 적재/조회 -------------------#
+
+def hydrate(cart_id: int) -> bool:
+    """Redis에 장바구니가 없으면 DB의 CartItem으로 채운다. 채웠으면 True"""
+    global _hydrate
+    client = get_redis()
+    key = cart_key(cart_id)
+    if client.exists(key):
+        return False
+    mapping = {LOADED_FIELD: "1"}
+    items = CartItem.objects.filter(cart_id=cart_id).values_list(
+        "product_id", "product_option_id", "quantity", "unit_price", "discount_amount"
+    )
+    for product_id, option_id, quantity, unit_price, discount_amount in items:
+        line = _line_id(product_id, option_id)
+        mapping[f"{line}:q"] = quantity
+        mapping[f"{line}:p"] = _price_value(unit_price, discount_amount)
+    if _hydrate is None:
+        _hydrate = client.register_script(_HYDRATE_SCRIPT)
+    args = [settings.CART_REDIS_TTL]
+    for field, value in mapping.items():
+        args.extend([field, value])
+    return bool(_hydrate(keys=[key], args=args))
+
+
+def _parse_lines(raw: Dict[bytes, bytes]) -> List[Dict]:
+    quantities, prices = {}, {}
+    for field, value in raw.items():
+        field = field.decode()
+        if field == LOADED_FIELD:
+            continue
+        line, kind = field.rsplit(":", 1)
+        if kind == "q":
+            quantities[line] = int(value)
+        else:
+            prices[line] = value.decode()
+    lines = []
+    for line, quantity in quantities.items():
+        if quantity <= 0 or line not in prices:
+            continue
+        product_id, option_id = line.split(":")
+        unit_price, discount_amount = prices[line].split("|")
+        lines.append(
+            {
+                "product_id": int(product_id),
+                "product_option_id": int(option_id) or None,
+                "quantity": quantity,
+                "unit_price": Decimal(unit_price),
+                "discount_amount": Decimal(discount_amount),
+            }
+        )
+    lines.sort(key=lambda item: (item["product_id"], item["product_option_id"] or 0))
+    return lines
+
+
+def get_lines(cart_id: int) -> List[Dict]:
+    """장바구니 라인 목록 (Redis에 없으면 DB에서 채운 뒤 반환)"""
+    client = get_redis()
+    raw = client.hgetall(cart_key(cart_id))
+    if not raw:
+        hydrate(cart_id)
+        raw = client.hgetall(cart_key(cart_id))
+    return _parse_lines(raw)
+
+
+#------------------- 변경 -------------------#
+
+def _run_mutation(name: str, cart_id: int, *args):
+    """변경 스크립트 실행. 해시가 만료돼 없으면 DB에서 채우고 다시 실행"""
+    client = get_redis()
+    script = _mutate.get(name)
+    if script is None:
+        script = _mutate[name] = client.register_script(_MUTATE_SCRIPTS[name])
+    keys = [cart_key(cart_id), DIRTY_SET, summary_key(cart_id)]
+    argv = [cart_id, settings.CART_REDIS_TTL, *args]
+    for _ in range(3):
+        result = script(keys=keys, args=argv)
+        if result != -1:
+            return result
+        hydrate(cart_id)
+    raise RuntimeError(f"장바구니 {cart_id}를 Redis에 적재하지 못했습니다")
+
+
+def add_item(
+    cart_id: int,
+    product_id: int,
+    option_id: Optional[int],
+    quantity: int,
+    unit_price: Decimal,
+    discount_amount: Decimal = Decimal("0"),
+) -> int:
+    """상품 담기: 이미 있으면 수량만 더한다. 변경 후 수량 반환"""
+    line = _line_id(product_id, option_id)
+    return int(
+        _run_mutation(
+            "add", cart_id, f"{line}:q", quantity, f"{line}:p", _price_value(unit_price, discount_amount)
+        )
+    )
+
+
+def set_quantity(cart_id: int, product_id: int, option_id: Optional[int], quantity: int) -> bool:
+    """수량 변경 (0 이하이면 삭제). 해당 라인이 없으면 False"""
+    if quantity <= 0:
+        return remove_item(cart_id, product_id, option_id)
+    line = _line_id(product_id, option_id)
+    return bool(_run_mutation("set", cart_id, f"{line}:q", quantity, f"{line}:p"))
+
+
+def remove_item(cart_id: int, product_id: int, option_id: Optional[int]) -> bool:
+    line = _line_id(product_id, option_id)
+    return bool(_run_mutation("remove", cart_id, f"{line}:q", f"{line}:p"))
+
+
+def update_prices(cart_id: int, lines: Iterable[Tuple[int, Optional[int], Decimal, Decimal]]):
+    """(상품, 옵션, 단가, 할인) 목록으로 가격 스냅샷을 Redis 왕복 1번에 갱신"""
+    fields = []
+    for product_id, option_id, unit_price, discount_amount in lines:
+        fields += [f"{_line_id(product_id, option_id)}:p", _price_value(unit_price, discount_amount)]
+    if fields:
+        _run_mutation("prices", cart_id, *fields)
+
+
+def evict(cart_ids: Iterable[int]):
+    """Redis 사본 삭제 (다음 접근 시 DB에서 다시 채움). 반영 전 변경은 먼저 flush 할 것"""
+    keys = []
+    for cart_id in cart_ids:
+        keys += [cart_key(cart_id), summary_key(cart_id)]
+    if keys:
+        get_redis().delete(*keys)
+
+
+#------------------- write-behind -------------------#
+
+def _write_carts(loaded: Dict[int, bytes]):
+    """Redis 사본으로 CartItem을 다시 쓴다 (DELETE 1번 + INSERT 1번)"""
+    items = [
+        CartItem(cart_id=cart_id, **line)
+        for cart_id, raw in loaded.items()
+        for line in _parse_lines(raw)
+    ]
+    CartItem.objects.filter(cart_id__in=list(loaded)).delete()
+    CartItem.objects.bulk_create(items, batch_size=1000)
+    Cart.objects.filter(pk__in=list(loaded)).update(updated_at=timezone.now())
+
+
+def _record_failures(client, cart_ids: List[int]):
+    """실패한 장바구니만 dirty 셋에 되돌린다. CART_FLUSH_MAX_RETRIES번 실패하면 dead 셋으로 옮긴다"""
+    pipe = client.pipeline()
+    for cart_id in cart_ids:
+        pipe.hincrby(FLUSH_FAILURES, cart_id, 1)
+    counts = pipe.execute()
+    requeue = [cart_id for cart_id, count in zip(cart_ids, counts) if count < settings.CART_FLUSH_MAX_RETRIES]
+    dead = [cart_id for cart_id, count in zip(cart_ids, counts) if count >= settings.CART_FLUSH_MAX_RETRIES]
+    pipe = client.pipeline()
+    if requeue:
+        pipe.sadd(DIRTY_SET, *requeue)
+    if dead:
+        pipe.sadd(DEAD_SET, *dead)
+        pipe.hdel(FLUSH_FAILURES, *dead)
+        # 사본이 만료되면 반영 못 한 변경이 사라지므로 dead 셋에 있는 동안은 TTL을 없앤다
+        for cart_id in dead:
+            pipe.persist(cart_key(cart_id))
+    pipe.execute()
+    if dead:
+        logger.error("장바구니 DB 반영 %d회 실패, %s로 이동: cart_ids=%s", settings.CART_FLUSH_MAX_RETRIES, DEAD_SET, dead)
+
+
+def flush(cart_ids: Optional[Iterable[int]] = None, batch_size: Optional[int] = None) -> int:
+    """변경된 장바구니를 DB에 반영하고 반영한 장바구니 수를 반환
+
+    cart_ids를 주면 그 장바구니만, 아니면 dirty 셋에서 batch_size개를 꺼내 처리한다.
+    평소에는 배치 전체를 트랜잭션 1번(DELETE 1번 + INSERT 1번)으로 처리하고,
+    실패하면 장바구니마다 따로 반영해 실패한 장바구니만 dirty 셋에 되돌린다.
+    예외는 다시 던지지 않는다(flush_carts 반복이 멈추지 않도록).
+    """
+    client = get_redis()
+    if cart_ids is None:
+        popped = client.spop(DIRTY_SET, batch_size or settings.CART_FLUSH_BATCH_SIZE)
+        ids = [int(cart_id) for cart_id in popped or []]
+    else:
+        ids = [int(cart_id) for cart_id in cart_ids]
+        if ids:
+            client.srem(DIRTY_SET, *ids)
+    if not ids:
+        return 0
+
+    pipe = client.pipeline()
+    for cart_id in ids:
+        pipe.hgetall(cart_key(cart_id))
+    snapshots = dict(zip(ids, pipe.execute()))
+    # 만료되어 사라진 장바구니는 DB 내용을 그대로 둔다
+    loaded = {cart_id: raw for cart_id, raw in snapshots.items() if raw}
+    if not loaded:
+        return 0
+
+    failed = []
+    try:
+        with transaction.atomic():
+            _write_carts(loaded)
+        batch_ok = True
+    except Exception:
+        logger.warning("장바구니 배치 반영 실패, 장바구니별로 다시 시도: cart_ids=%s", list(loaded), exc_info=True)
+        batch_ok = False
+    if not batch_ok:
+        for cart_id, raw in loaded.items():
+            try:
+                with transaction.atomic():
+                    _write_carts({cart_id: raw})
+            except Exception:
+                logger.exception("장바구니 DB 반영 실패: cart_id=%s", cart_id)
+                failed.append(cart_id)
+
+    done = [cart_id for cart_id in loaded if cart_id not in failed]
+    if done:
+        client.hdel(FLUSH_FAILURES, *done)
+    if failed:
+        _record_failures(client, failed)
+    return len(done)
+
+
+def requeue_dead() -> int:
+    """dead 셋의 장바구니를 다시 dirty 셋에 넣는다 (원인을 고친 뒤 flush_carts --requeue-dead)"""
+    client = get_redis()
+    ids = [int(cart_id) for cart_id in client.smembers(DEAD_SET)]
+    if not ids:
+        return 0
+    pipe = client.pipeline()
+    pipe.sadd(DIRTY_SET, *ids)
+    pipe.srem(DEAD_SET, *ids)
+    for cart_id in ids:
+        pipe.expire(cart_key(cart_id), settings.CART_REDIS_TTL)
+    pipe.execute()
+    return len(ids)
@@ -0,0 +1,25 @@
+from django.urls import path
+
+from cart.views import (
+    CartItemAddView,
+    CartItemRemoveView,
+    CartItemUpdateView,
+    CartRepriceView,
+    CartView,
+    WishlistAddView,
+    WishlistFlagsView,
+    WishlistRemoveView,
+)
+
+app_name = "cart"
+
+urlpatterns = [
+    path("", CartView.as_view(), name="detail"),
+    path("items/add/", CartItemAddView.as_view(), name="add"),
+    path("items/update/", CartItemUpdateView.as_view(), name="update"),
+    path("items/remove/", CartItemRemoveView.as_view(), name="remove"),
+    path("reprice/", CartRepriceView.as_view(), name="reprice"),
+    path("wishlist/add/", WishlistAddView.as_view(), name="wishlist_add"),
+    path("wishlist/remove/", WishlistRemoveView.as_view(), name="wishlist_remove"),
+    path("wishlist/flags/", WishlistFlagsView.as_view(), name="wishlist_flags"),
+]
@@ -1,3 +1,173 @@
-from django.shortcuts import render
+from decimal import Decimal
 
-# Create your views here.
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpResponseBadRequest, JsonResponse
+from django.views import View
+
+from cart import store, wishlist
+from cart.pricing import price_cart, reprice_cart
+from product.models import Product, ProductOption
+
+
+def _parse_line(request):
+    """POST의 product_id/option_id/quantity 파싱. 잘못된 값이면 ValueError"""
+    product_id = int(request.POST.get("product_id", ""))
+    option_raw = request.POST.get("option_id")
+    option_id = int(option_raw) if option_raw else None
+    quantity = int(request.POST.get("quantity", "1"))
+    return product_id, option_id, quantity
+
+
+def _cart_payload(cart_id):
+    priced = price_cart(cart_id)
+    return {
+        "cart_id": cart_id,
+        "items": [
+            {
+                "product_id": line["product_id"],
+                "option_id": line["product_option_id"],
+                "quantity": line["quantity"],
+                "unit_price": float(line["unit_price"]),
+                "current_unit_price": float(line["current_unit_price"]),
+                "discount_amount": float(line["discount_amount"]),
+                "line_total": float(line["line_total"]),
+                "is_stale": line["is_stale"],
+                "is_available": line["is_available"],
+            }
+            for line in priced["items"]
+        ],
+        "count": priced["count"],
+        "subtotal": float(priced["subtotal"]),
+        "discount_total": float(priced["discount_total"]),
+        "total": float(priced["total"]),
+        "stale_count": priced["stale_count"],
+        "unavailable_count": priced["unavailable_count"],
+    }
+
+
+class CartView(View):
+    """현재 장바구니 조회"""
+
+    def get(self, request, *args, **kwargs):
+        cart_id = store.get_cart_id(request, create=False)
+        if cart_id is None:
+            return JsonResponse({"cart_id": None, "items": [], "count": 0, "total": 0})
+        return JsonResponse(_cart_payload(cart_id))
+
+
+class CartItemAddView(View):
+    """상품 담기 (담을 당시 판매가 + 옵션 추가금을 단가로 저장)"""
+
+    def post(self, request, *args, **kwargs):
+        try:
+            product_id, option_id, quantity = _parse_line(request)
+        except ValueError:
+            return HttpResponseBadRequest("invalid parameters")
+        if quantity < 1:
+            return HttpResponseBadRequest("invalid quantity")
+
+        product = (
+            Product.objects.filter(pk=product_id, is_active=True)
+            .only("price", "discount_price")
+            .first()
+        )
+        if not product:
+            return HttpResponseBadRequest("invalid product")
+        extra_price = Decimal("0")
+        if option_id:
+            option = (
+                ProductOption.objects.filter(pk=option_id, product_id=product_id, is_active=True)
+                .only("extra_price")
+                .first()
+            )
+            if not option:
+                return HttpResponseBadRequest("invalid option")
+            extra_price = option.extra_price
+
+        cart_id = store.get_cart_id(request)
+        store.add_item(cart_id, product_id, option_id, quantity, product.sale_price + extra_price)
+        return JsonResponse(_cart_payload(cart_id))
+
+
+class CartItemUpdateView(View):
+    """수량 변경 (0이면 삭제)"""
+
+    def post(self, request, *args, **kwargs):
+        try:
+            product_id, option_id, quantity = _parse_line(request)
+        except ValueError:
+            return HttpResponseBadRequest("invalid parameters")
+        cart_id = store.get_cart_id(request, create=False)
+        if cart_id is None or not store.set_quantity(cart_id, product_id, option_id, quantity):
+            return JsonResponse({"error": "not in cart"}, status=404)
+        return JsonResponse(_cart_payload(cart_id))
+
+
+class CartItemRemoveView(View):
+    """장바구니에서 삭제"""
+
+    def post(self, request, *args, **kwargs):
+        try:
+            product_id, option_id, _ = _parse_line(request)
+        except ValueError:
+            return HttpResponseBadRequest("invalid parameters")
+        cart_id = store.get_cart_id(request, create=False)
+        if cart_id is None or not store.remove_item(cart_id, product_id, option_id):
+            return JsonResponse({"error": "not in cart"}, status=404)
+        return JsonResponse(_cart_payload(cart_id))
+
+
+class CartRepriceView(View):
+    """가격이 바뀐 상품의 단가를 현재 판매가로 갱신"""
+
+    def post(self, request, *args, **kwargs):
+        cart_id = store.get_cart_id(request, create=False)
+        if cart_id is None:
+            return JsonResponse({"error": "no cart"}, status=404)
+        updated = reprice_cart(cart_id)
+        payload = _cart_payload(cart_id)
+        payload["repriced"] = updated
+        return JsonResponse(payload)
+
+
+class WishlistAddView(LoginRequiredMixin, View):
+    """찜 추가"""
+
+    def post(self, request, *args, **kwargs):
+        try:
+            product_id, option_id, _ = _parse_line(request)
+        except ValueError:
+            return HttpResponseBadRequest("invalid parameters")
+        if not Product.objects.filter(pk=product_id, is_active=True).exists():
+            return HttpResponseBadRequest("invalid product")
+        if option_id and not ProductOption.objects.filter(pk=option_id, product_id=product_id).exists():
+            return HttpResponseBadRequest("invalid option")
+        created = wishlist.add(request.user, product_id, option_id)
+        return JsonResponse({"product_id": product_id, "wishlisted": True, "created": created})
+
+
+class WishlistRemoveView(LoginRequiredMixin, View):
+    """찜 해제 (상품의 모든 옵션)"""
+
+    def post(self, request, *args, **kwargs):
+        try:
+            product_id = int(request.POST.get("product_id", ""))
+        except ValueError:
+            return HttpResponseBadRequest("invalid parameters")
+        wishlist.remove(request.user, product_id)
+        return JsonResponse({"product_id": product_id, "wishlisted": False})
+
+
+class WishlistFlagsView(View):
+    """상품 id 목록(?ids=1,2,3)의 찜 여부. 비회원은 모두 False"""
+
+    max_ids = 100
+
+    def get(self, request, *args, **kwargs):
+        try:
+            product_ids = [int(value) for value in request.GET.get("ids", "").split(",") if value]
+        except ValueError:
+            return HttpResponseBadRequest("invalid ids")
+        if len(product_ids) > self.max_ids:
+            return HttpResponseBadRequest("too many ids")
+        return JsonResponse({"flags": wishlist.flags_payload(request.user, product_ids)})
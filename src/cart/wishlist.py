@@ -0,0 +1,112 @@
+"""회원별 찜 상품 id 캐시
+
+Redis 셋 wishlist:{user_id}에 찜한 상품 id를 둔다. 목록 페이지는 한 페이지 분량의
+상품 id를 SMISMEMBER 한 번으로 확인한다. 셋이 없으면 WishlistItem에서 한 번 읽어 채우고,
+찜 추가/삭제 시그널이 셋을 갱신한다. 빈 찜 목록도 캐시되도록 센티널 멤버("0")를 넣어 둔다.
+"""
+from typing import Dict, Iterable, Optional, Set
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from cart.models import Wishlist, WishlistItem
+from common import metrics
+from common.redis_client import get_redis
+
+SENTINEL = "0" # 상품 id는 1부터 시작하므로 충돌 없음
+
+# 셋이 이미 있을 때만 반영 (없으면 다음 조회 때 DB에서 새로 채움)
+_ADD_IF_LOADED = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('SADD', KEYS[1], ARGV[1])
+    return 1
+end
+return 0
+"""
+_add_if_loaded = None
+
+
+def wishlist_key(user_id: int) -> str:
+    return f"wishlist:{user_id}"
+
+
+def load(user_id: int) -> Set[int]:
+    """DB에서 찜 상품 id를 읽어 셋을 다시 만든다"""
+    product_ids = set(
+        WishlistItem.objects.filter(wishlist__user_id=user_id)
+        .values_list("product_id", flat=True)
+        .distinct()
+    )
+    key = wishlist_key(user_id)
+    pipe = get_redis().pipeline()
+    pipe.delete(key)
+    pipe.sadd(key, SENTINEL, *product_ids)
+    pipe.expire(key, settings.WISHLIST_CACHE_TTL)
+    pipe.execute()
+    return product_ids
+
+
+def wishlisted_ids(user, product_ids: Iterable[int]) -> Set[int]:
+    """product_ids 중 user가 찜한 상품 id 집합 (Redis 1번, 캐시가 없을 때만 DB 1번)"""
+    product_ids = [int(product_id) for product_id in product_ids]
+    if not product_ids or not getattr(user, "is_authenticated", False):
+        return set()
+    key = wishlist_key(user.pk)
+    pipe = get_redis().pipeline()
+    pipe.exists(key)
+    pipe.smismember(key, product_ids)
+    loaded, flags = pipe.execute()
+    metrics.cache_result("wishlist", bool(loaded))
+    if not loaded:
+        return load(user.pk).intersection(product_ids)
+    return {product_id for product_id, flag in zip(product_ids, flags) if flag}
+
+
+def mark_added(user_id: int, product_id: int):
+    global _add_if_loaded
+    client = get_redis()
+    if _add_if_loaded is None:
+        _add_if_loaded = client.register_script(_ADD_IF_LOADED)
+    _add_if_loaded(keys=[wishlist_key(user_id)], args=[product_id])
+
+
+def mark_removed(user_id: int, product_id: int):
+    # 다른 옵션으로 같은 상품이 남아 있으면 유지
+    if not WishlistItem.objects.filter(wishlist__user_id=user_id, product_id=product_id).exists():
+        get_redis().srem(wishlist_key(user_id), product_id)
+
+
+#------------------- 찜 추가/삭제 -------------------#
+
+def get_default_wishlist(user) -> Wishlist:
+    wishlist = Wishlist.objects.filter(user=user, is_default=True).first()
+    if wishlist:
+        return wishlist
+    try:
+        with transaction.atomic():
+            return Wishlist.objects.create(user=user, is_default=True)
+    except IntegrityError:
+        # 동시 생성 시 부분 유니크 제약에 걸린 쪽은 기존 목록 사용
+        return Wishlist.objects.get(user=user, is_default=True)
+
+
+def add(user, product_id: int, option_id: Optional[int] = None) -> bool:
+    """기본 찜 목록에 추가. 새로 추가했으면 True"""
+    _, created = WishlistItem.objects.get_or_create(
+        wishlist=get_default_wishlist(user),
+        product_id=product_id,
+        product_option_id=option_id,
+    )
+    return created
+
+
+def remove(user, product_id: int) -> int:
+    """회원의 모든 찜 목록에서 상품 삭제. 삭제한 행 수 반환"""
+    deleted, _ = WishlistItem.objects.filter(wishlist__user=user, product_id=product_id).delete()
+    return deleted
+
+
+def flags_payload(user, product_ids: Iterable[int]) -> Dict[str, bool]:
+    product_ids = [int(product_id) for product_id in product_ids]
+    wishlisted = wishlisted_ids(user, product_ids)
+    return {str(product_id): product_id in wishlisted for product_id in product_ids}
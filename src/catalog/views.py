@@ -4,6 +4,7 @@ from django.db.models import DecimalField, ExpressionWrapper, F, Prefetch, Q, Va
 from django.shortcuts import render
 from django.utils import timezone
 
+from cart.wishlist import wishlisted_ids
 from common.models import Banner, Notice
 from product.models import Product, ProductImage
 
@@ -79,6 +80,9 @@ def home(request):
             .order_by("name")[:20]
         )
 
+    # 찜 표시: 화면에 그리는 상품 id를 모아 한 번에 조회
+    popular_products = list(popular_products)
+
     context = {
         "query": query,
         "banners": banners,
@@ -87,5 +91,6 @@ def home(request):
         "sale_products": sale_products,
         "search_results": search_results,
         "popular_products": popular_products,
+        "wishlisted_ids": wishlisted_ids(request.user, [product.pk for product in popular_products]),
     }
     return render(request, "home/home.html", context)
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.utils import timezone
 
 from .models import (
     Banner,
@@ -6,6 +7,7 @@ from .models import (
     FAQCategory,
     Notice,
     NoticeAttachment,
+    OutboundEmail,
     PolicyAcknowledgement,
     PolicyDocument,
     SiteSetting,
@@ -97,3 +99,22 @@ class PolicyAcknowledgementAdmin(admin.ModelAdmin):
     list_display = ("user", "policy", "agreed_at", "ip_address")
     list_filter = ("policy__policy_type", "agreed_at")
     search_fields = ("user__username", "user__email")
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "status", "attempts", "next_attempt_at", "sent_at", "created_at")
+    list_filter = ("status",)
+    search_fields = ("subject",)
+    # 본문에는 인증 코드 등이 들어가므로 관리자 화면에 보여주지 않는다
+    exclude = ("body",)
+    readonly_fields = ("subject", "from_email", "to", "attempts", "sent_at", "last_error")
+    actions = ["retry_now"]
+
+    @admin.action(description="선택한 메일 즉시 재발송")
+    def retry_now(self, request, queryset):
+        # 최종 실패한 메일은 본문을 비우므로 다시 보낼 수 없다 (인증 메일 등은 다시 요청해야 함)
+        updated = queryset.exclude(status=OutboundEmail.Status.SENT).exclude(body="").update(
+            status=OutboundEmail.Status.PENDING, attempts=0, next_attempt_at=timezone.now()
+        )
+        self.message_user(request, f"{updated}건을 발송 대기열에 넣었습니다.")
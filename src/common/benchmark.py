@@ -0,0 +1,504 @@
+"""스토어프론트 부하 테스트 구성 요소 (benchmark 명령에서 사용)
+
+- MeiliStandIn / TossStandIn: 외부 서비스 대신 쓰는 로컬 HTTP 서버.
+  검색은 DB 상품을 메모리에 올려 이름/SKU 부분 일치 + 카테고리/가격 필터 + 정렬만 흉내 낸다.
+  실제 엔진 성능이 아니라 앱 코드(뷰/쿼리/템플릿) 비용을 재기 위한 것이다.
+- serve_app: 같은 프로세스에서 스레드 WSGI 서버로 앱을 띄우고 X-DB-Queries 헤더를 붙인다.
+- run_load: 동시 작업자 스레드가 시나리오 비율(mix)대로 요청을 보내고 지연/상태/쿼리 수를 모은다.
+- summarize / compare: p50/p95/p99, RPS, 요청당 쿼리 수 집계와 이전 결과 대비 변화율
+"""
+import json
+import math
+import random
+import re
+import threading
+import time
+from bisect import bisect_right
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import accumulate
+from socketserver import ThreadingMixIn
+from typing import Callable, Dict, List, Optional, Tuple
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import requests
+from django.db import connection
+
+from common.metrics import QueryCounter
+
+SCENARIOS = ("home", "search", "detail", "autocomplete", "buy_now", "admin")
+DEFAULT_MIX = {"home": 30, "search": 25, "detail": 25, "autocomplete": 10, "buy_now": 5, "admin": 5}
+SEARCH_SORTS = ("created_at:desc", "sales_count:desc", "price:asc", "price:desc", "review_count:desc")
+
+_FILTER_EQ = re.compile(r'(\w+) = "([^"]*)"')
+_FILTER_RANGE = re.compile(r"price (>=|<=) ([\d.]+)")
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """'home=30,search=25' 형식. 알 수 없는 시나리오나 음수 비율은 ValueError"""
+    mix = {}
+    for part in filter(None, (item.strip() for item in value.split(","))):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"알 수 없는 시나리오: {name} (가능: {', '.join(SCENARIOS)})")
+        mix[name] = int(weight)
+        if mix[name] < 0:
+            raise ValueError(f"비율은 0 이상이어야 합니다: {part}")
+    if not any(mix.values()):
+        raise ValueError("비율 합이 0입니다")
+    return mix
+
+
+# ---------------------------------------------------------------------------
+# 외부 서비스 대역
+# ---------------------------------------------------------------------------
+
+class _JsonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    standin = None  # _StandIn.start()에서 지정
+
+    def log_message(self, format, *args):
+        pass
+
+    def _body(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def _send(self, status: int, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _dispatch(self):
+        status, payload = self.standin.handle(self.command, self.path.split("?")[0], self._body())
+        self._send(status, payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+
+class _StandIn:
+    def __init__(self):
+        self.server = None
+        self.url = ""
+
+    def handle(self, method: str, path: str, body) -> Tuple[int, Dict]:
+        raise NotImplementedError
+
+    def start(self, host: str = "127.0.0.1", port: int = 0):
+        handler = type(f"{type(self).__name__}Handler", (_JsonHandler,), {"standin": self})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self.url = f"http://{host}:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+class MeiliStandIn(_StandIn):
+    """Meilisearch 검색/문서 API 대역. 문서 추가/삭제는 메모리에 반영하고 작업은 바로 성공 처리"""
+
+    def __init__(self):
+        super().__init__()
+        self.docs: Dict[int, Dict] = {}
+        self._lock = threading.Lock()
+        self._task = 0
+
+    def load_products(self) -> int:
+        """상품 목록을 검색에 필요한 필드만 한 번에 읽어 온다 (상품당 옵션 쿼리 없음)"""
+        from product.models import Product
+
+        rows = Product.objects.values(
+            "id", "name", "sku", "category__slug", "price", "discount_price", "is_active",
+            "stock", "view_count", "sales_count", "review_count", "created_at",
+        ).iterator(chunk_size=5000)
+        docs = {}
+        for row in rows:
+            price = float(row["price"])
+            discount = float(row["discount_price"]) if row["discount_price"] else None
+            docs[row["id"]] = {
+                "id": row["id"],
+                "name": row["name"],
+                "sku": row["sku"],
+                "category": row["category__slug"] or "",
+                "price": price,
+                "discount_price": discount,
+                "discount_rate": round((price - discount) / price * 100, 2) if discount and price else 0.0,
+                "is_active": row["is_active"],
+                "in_stock": row["stock"] > 0,
+                "colors": [],
+                "sizes": [],
+                "view_count": row["view_count"],
+                "sales_count": row["sales_count"],
+                "review_count": row["review_count"],
+                "created_at": row["created_at"].isoformat(),
+            }
+        with self._lock:
+            self.docs = docs
+        return len(docs)
+
+    def _next_task(self, index: str, kind: str) -> Dict:
+        with self._lock:
+            self._task += 1
+            uid = self._task
+        return {"taskUid": uid, "indexUid": index, "status": "enqueued", "type": kind, "enqueuedAt": _now_iso()}
+
+    def handle(self, method, path, body):
+        parts = path.strip("/").split("/")
+        if parts[0] == "tasks" and len(parts) == 2:
+            return 200, {"uid": int(parts[1]) if parts[1].isdigit() else 0, "status": "succeeded"}
+        if parts[0] != "indexes" or len(parts) < 2:
+            return 200, {}
+        index = parts[1]
+        action = parts[2] if len(parts) > 2 else ""
+        if action == "search" and method == "POST":
+            return 200, self.search(body)
+        if action == "documents" and method in ("POST", "PUT"):
+            if len(parts) > 3:  # documents/delete-batch, documents/delete
+                ids = body if isinstance(body, list) else []
+                with self._lock:
+                    for doc_id in ids:
+                        self.docs.pop(int(doc_id), None)
+                return 202, self._next_task(index, "documentDeletion")
+            with self._lock:
+                for doc in body if isinstance(body, list) else []:
+                    self.docs[int(doc["id"])] = doc
+            return 202, self._next_task(index, "documentAdditionOrUpdate")
+        if action == "documents" and method == "DELETE":
+            if len(parts) > 3:
+                with self._lock:
+                    self.docs.pop(int(parts[3]), None)
+            else:
+                with self._lock:
+                    self.docs = {}
+            return 202, self._next_task(index, "documentDeletion")
+        if method in ("PATCH", "PUT", "POST", "DELETE"):
+            return 202, self._next_task(index, "settingsUpdate")
+        return 200, {"uid": index, "primaryKey": "id"}
+
+    def search(self, body: Dict) -> Dict:
+        started = time.perf_counter()
+        terms = str(body.get("q") or "").lower().split()
+        equals = _FILTER_EQ.findall(body.get("filter") or "")
+        ranges = _FILTER_RANGE.findall(body.get("filter") or "")
+        only_active = "is_active = true" in (body.get("filter") or "")
+        sort = (body.get("sort") or [""])[0]
+        field, _, direction = sort.partition(":")
+
+        with self._lock:
+            docs = list(self.docs.values())
+        matched = []
+        for doc in docs:
+            if only_active and not doc.get("is_active"):
+                continue
+            if terms:
+                text = f"{doc.get('name', '')} {doc.get('sku', '')}".lower()
+                if not all(term in text for term in terms):
+                    continue
+            if any(name in doc and not _filter_match(doc[name], value) for name, value in equals):
+                continue
+            if any(not _range_match(doc.get("price", 0), op, float(value)) for op, value in ranges):
+                continue
+            matched.append(doc)
+        if field:
+            matched.sort(key=lambda doc: doc.get(field) or 0, reverse=direction == "desc")
+
+        offset = int(body.get("offset") or 0)
+        limit = int(body.get("limit") or 20)
+        attributes = body.get("attributesToRetrieve")
+        hits = matched[offset:offset + limit]
+        if attributes:
+            hits = [{key: doc.get(key) for key in attributes} for doc in hits]
+        return {
+            "hits": hits,
+            "query": body.get("q") or "",
+            "offset": offset,
+            "limit": limit,
+            "estimatedTotalHits": len(matched),
+            "processingTimeMs": int((time.perf_counter() - started) * 1000),
+        }
+
+
+def _filter_match(field_value, value: str) -> bool:
+    if isinstance(field_value, list):
+        return value in field_value
+    return str(field_value) == value
+
+
+def _range_match(price: float, op: str, value: float) -> bool:
+    return price >= value if op == ">=" else price <= value
+
+
+class TossStandIn(_StandIn):
+    """토스 결제 승인 API 대역. 요청한 금액 그대로 DONE 응답"""
+
+    def handle(self, method, path, body):
+        if method == "POST" and path == "/v1/payments/confirm":
+            return 200, {
+                "paymentKey": body.get("paymentKey"),
+                "orderId": body.get("orderId"),
+                "status": "DONE",
+                "method": "카드",
+                "totalAmount": body.get("amount"),
+                "approvedAt": _now_iso(),
+            }
+        return 404, {"code": "NOT_FOUND_PAYMENT", "message": "not found"}
+
+
+def _now_iso() -> str:
+    # Meilisearch 클라이언트가 기대하는 UTC 형식
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+# ---------------------------------------------------------------------------
+# 앱 서버 (같은 프로세스)
+# ---------------------------------------------------------------------------
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def count_queries(app: Callable) -> Callable:
+    """WSGI 앱을 감싸 요청당 SQL 수를 X-DB-Queries 헤더로 붙인다 (프로파일러가 이미 붙였으면 그대로)"""
+
+    def wrapped(environ, start_response):
+        counter = QueryCounter()
+
+        def counting_start_response(status, headers, exc_info=None):
+            if not any(name.lower() == "x-db-queries" for name, _ in headers):
+                headers = list(headers) + [("X-DB-Queries", str(counter.count))]
+            return start_response(status, headers, exc_info)
+
+        with connection.execute_wrapper(counter):
+            return app(environ, counting_start_response)
+
+    return wrapped
+
+
+def serve_app(app: Callable, host: str = "127.0.0.1", port: int = 0) -> Tuple[WSGIServer, str]:
+    server = make_server(host, port, count_queries(app), server_class=_ThreadingWSGIServer, handler_class=_QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+# ---------------------------------------------------------------------------
+# 부하 실행
+# ---------------------------------------------------------------------------
+
+class Target:
+    """요청 대상과 시나리오에 쓰는 데이터 (상품 id, 검색어, 세션 쿠키)"""
+
+    def __init__(self, base_url: str, product_ids: List[int], terms: List[str],
+                 member_sessions: List[str], staff_session: Optional[str], csrf_token: str, session_cookie: str):
+        self.base_url = base_url.rstrip("/")
+        self.product_ids = product_ids
+        self.terms = terms or [""]
+        self.member_sessions = member_sessions
+        self.staff_session = staff_session
+        self.csrf_token = csrf_token
+        self.session_cookie = session_cookie
+
+
+class _Worker:
+    def __init__(self, target: Target, index: int, seed: int, samples: List):
+        self.target = target
+        self.rng = random.Random(seed)
+        self.samples = samples
+        self.anonymous = self._session(None)
+        member = target.member_sessions[index % len(target.member_sessions)] if target.member_sessions else None
+        self.member = self._session(member)
+        self.staff = self._session(target.staff_session)
+
+    def _session(self, session_key: Optional[str]) -> requests.Session:
+        http = requests.Session()
+        http.cookies.set("csrftoken", self.target.csrf_token)
+        if session_key:
+            http.cookies.set(self.target.session_cookie, session_key)
+        return http
+
+    def request(self, name: str, http: requests.Session, method: str, path: str, **kwargs):
+        started = time.perf_counter()
+        response = None
+        try:
+            response = http.request(method, self.target.base_url + path, allow_redirects=False, timeout=30, **kwargs)
+            status = response.status_code
+            queries = response.headers.get("X-DB-Queries")
+        except requests.RequestException:
+            status, queries = 0, None
+        self.samples.append(
+            (name, time.perf_counter() - started, status, int(queries) if queries and queries.isdigit() else None)
+        )
+        return response if status and status < 400 else None
+
+    def run(self, scenario: str):
+        getattr(self, f"_{scenario}")()
+
+    def _home(self):
+        self.request("home", self.anonymous, "GET", "/")
+
+    def _search(self):
+        params = {"q": self.rng.choice(self.target.terms), "sort": self.rng.choice(SEARCH_SORTS)}
+        if self.rng.random() < 0.2:
+            params["page"] = self.rng.randint(2, 5)
+        self.request("search", self.anonymous, "GET", "/products/search/", params=params)
+
+    def _detail(self):
+        product_id = self.rng.choice(self.target.product_ids)
+        self.request("detail", self.anonymous, "GET", f"/products/{product_id}/")
+
+    def _autocomplete(self):
+        term = self.rng.choice(self.target.terms)
+        self.request("autocomplete", self.anonymous, "GET", "/products/autocomplete/", params={"q": term[:3]})
+
+    def _buy_now(self):
+        response = self.request(
+            "buy_now.prepare",
+            self.member,
+            "POST",
+            "/orders/prepare/",
+            data={"product_id": self.rng.choice(self.target.product_ids), "quantity": 1},
+            headers={"X-CSRFToken": self.target.csrf_token},
+        )
+        if response is None:
+            return
+        data = response.json()
+        self.request(
+            "buy_now.confirm",
+            self.member,
+            "GET",
+            "/orders/success/",
+            params={
+                "paymentKey": f"bench_{self.rng.getrandbits(48):012x}",
+                "orderId": data["orderId"],
+                "amount": int(data["amount"]),
+            },
+        )
+
+    def _admin(self):
+        self.request("admin", self.staff, "GET", "/admin/")
+
+
+def run_load(target: Target, mix: Dict[str, int], concurrency: int, duration: float,
+             max_requests: Optional[int] = None, warmup: float = 0.0, seed: int = 0) -> Dict:
+    """시나리오를 mix 비율로 뽑아 concurrency 개 스레드가 duration초(또는 시나리오 max_requests회) 동안 실행.
+    워밍업 구간 샘플은 버린다. 반환: {"samples": [...], "elapsed": 측정 구간 초}"""
+    names = [name for name, weight in mix.items() if weight > 0]
+    cumulative = list(accumulate(mix[name] for name in names))
+    stop = threading.Event()
+    measuring = threading.Event()
+    samples_by_worker: List[List] = [[] for _ in range(concurrency)]
+    issued = [0]
+    lock = threading.Lock()
+
+    def work(index: int):
+        worker = _Worker(target, index, seed * 1000 + index, samples_by_worker[index])
+        while not stop.is_set():
+            if measuring.is_set() and max_requests is not None:
+                with lock:
+                    if issued[0] >= max_requests:
+                        break
+                    issued[0] += 1
+            pick = worker.rng.random() * cumulative[-1]
+            scenario = names[bisect_right(cumulative, pick)]
+            mark = len(worker.samples)
+            worker.run(scenario)
+            if not measuring.is_set():
+                del worker.samples[mark:]
+
+    threads = [threading.Thread(target=work, args=(index,), daemon=True) for index in range(concurrency)]
+    if not warmup:
+        measuring.set()
+    for thread in threads:
+        thread.start()
+    if warmup:
+        time.sleep(warmup)
+        measuring.set()
+    started = time.perf_counter()
+    deadline = started + duration
+    while time.perf_counter() < deadline and any(thread.is_alive() for thread in threads):
+        time.sleep(0.05)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return {"samples": [sample for samples in samples_by_worker for sample in samples], "elapsed": elapsed}
+
+
+# ---------------------------------------------------------------------------
+# 집계 / 비교
+# ---------------------------------------------------------------------------
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # nearest-rank
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def _stats(samples: List[Tuple], elapsed: float) -> Dict:
+    latencies = sorted(latency * 1000 for _, latency, _, _ in samples)
+    queries = [count for _, _, _, count in samples if count is not None]
+    errors = sum(1 for _, _, status, _ in samples if not status or status >= 400)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 50), 2),
+        "p95_ms": round(_percentile(latencies, 95), 2),
+        "p99_ms": round(_percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None,
+        "max_queries": max(queries) if queries else None,
+    }
+
+
+def summarize(result: Dict) -> Dict:
+    samples, elapsed = result["samples"], result["elapsed"]
+    by_name: Dict[str, List] = {}
+    for sample in samples:
+        by_name.setdefault(sample[0], []).append(sample)
+    return {
+        "elapsed_s": round(elapsed, 2),
+        "total": _stats(samples, elapsed),
+        "scenarios": {name: _stats(items, elapsed) for name, items in sorted(by_name.items())},
+    }
+
+
+def compare(current: Dict, baseline: Dict) -> List[Dict]:
+    """시나리오별 p50/p95/p99/RPS/쿼리 수 변화율(%). 지연/쿼리는 +가 나빠진 것, RPS는 -가 나빠진 것"""
+    rows = []
+    names = ["total"] + sorted(set(current["scenarios"]) & set(baseline.get("scenarios", {})))
+    for name in names:
+        now = current["total"] if name == "total" else current["scenarios"][name]
+        before = baseline["total"] if name == "total" else baseline["scenarios"][name]
+        row = {"scenario": name}
+        for key in ("p50_ms", "p95_ms", "p99_ms", "rps", "queries_per_request"):
+            old, new = before.get(key), now.get(key)
+            row[key] = {
+                "before": old,
+                "after": new,
+                "change_pct": round((new - old) / old * 100, 1) if old and new is not None else None,
+            }
+        rows.append(row)
+    return rows
@@ -0,0 +1,136 @@
+"""요청 스레드를 막지 않는 로깅 구성 요소 (settings.LOGGING에서 사용)
+
+- QueueListenerHandler: 레코드를 큐에 넣기만 하고 파일/콘솔 쓰기는 백그라운드 스레드가 한다.
+  큐가 가득 차면 기다리지 않고 버린다.
+- JsonFormatter: 한 줄 JSON 레코드 (extra로 넘긴 필드 포함)
+- SamplingFilter: 로거별 샘플링 비율 (ERROR 이상은 항상 통과)
+메시지 포맷팅(% 인자 치환)은 인자가 단순 값이면 백그라운드 스레드에서 한다.
+쿼리셋 등 다른 객체는 다른 스레드에서 평가되지 않도록 요청 스레드에서 미리 문자열로 만든다.
+"""
+import atexit
+import copy
+import datetime
+import decimal
+import json
+import logging
+import os
+import queue
+import random
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+_SIMPLE_TYPES = (
+    str, bytes, int, float, bool, type(None),
+    decimal.Decimal, datetime.date, datetime.datetime, datetime.time, datetime.timedelta, uuid.UUID,
+)
+_RESERVED = set(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime"}
+
+
+def _is_simple(value, depth: int = 0) -> bool:
+    if isinstance(value, _SIMPLE_TYPES):
+        return True
+    if depth < 2 and isinstance(value, (list, tuple)):
+        return all(_is_simple(item, depth + 1) for item in value)
+    if depth < 2 and isinstance(value, dict):
+        return all(_is_simple(k, depth + 1) and _is_simple(v, depth + 1) for k, v in value.items())
+    return False
+
+
+class QueueListenerHandler(QueueHandler):
+    """targets 핸들러들로 보내는 작업을 백그라운드 QueueListener에 맡기는 핸들러
+
+    LOGGING 예: {"class": "common.log.QueueListenerHandler",
+                 "targets": ["cfg://handlers.console", "cfg://handlers.daily_file"]}
+    dictConfig는 핸들러를 이름순으로 만들므로 대상 핸들러 이름이 이 핸들러보다 앞서야 한다.
+    """
+
+    def __init__(self, targets, maxsize: int = 10000):
+        super().__init__(queue.Queue(maxsize))
+        self.targets = [targets[i] for i in range(len(targets))] # ConvertingList의 cfg:// 참조 해석
+        for target in self.targets:
+            if not isinstance(target, logging.Handler):
+                raise ValueError(f"대상 핸들러가 아직 구성되지 않았습니다: {target!r}")
+        self.dropped = 0
+        self.listener = None
+        self._start()
+        atexit.register(self._stop)
+
+    def _start(self):
+        self._pid = os.getpid()
+        self.listener = QueueListener(self.queue, *self.targets, respect_handler_level=True)
+        self.listener.start()
+
+    def _stop(self):
+        if self.listener is not None and self._pid == os.getpid():
+            self.listener.stop()
+        self.listener = None
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        if record.args and not _is_simple(record.args):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record):
+        if self._pid != os.getpid():
+            # fork 된 워커에는 리스너 스레드가 따라오지 않으므로 다시 띄운다
+            self._start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        self._stop()
+        super().close()
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {
+            "time": datetime.datetime.fromtimestamp(record.created).astimezone().isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "process": record.process,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """rates: {"로거 이름(접두어)": 0~1 비율}. 가장 긴 접두어가 맞는 비율을 쓰고 없으면 default"""
+
+    def __init__(self, rates: Optional[Dict[str, float]] = None, default: float = 1.0, always_level: int = logging.ERROR):
+        super().__init__()
+        self.rates = dict(rates or {})
+        self.default = default
+        self.always_level = always_level
+        self._cache: Dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._cache.get(name)
+        if rate is None:
+            rate = self.default
+            matched = ""
+            for prefix, value in self.rates.items():
+                if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > len(matched):
+                    matched, rate = prefix, value
+            self._cache[name] = rate
+        return rate
+
+    def filter(self, record):
+        if record.levelno >= self.always_level:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1 or random.random() < rate
@@ -0,0 +1,140 @@
+"""메일 발송 큐
+
+enqueue()는 OutboundEmail 행 하나만 저장하고 바로 반환한다. send_queued_mail 워커가
+대기 메일을 SKIP LOCKED로 선점해 SMTP 연결 하나로 배치 발송하고, 실패한 메일은
+지수 백오프로 MAIL_QUEUE_MAX_ATTEMPTS번까지 다시 시도한다.
+본문에는 가입 인증 코드 같은 값이 들어가므로 발송 완료/최종 실패 시 비우고,
+발송 완료/실패 행은 MAIL_QUEUE_RETENTION_DAYS가 지나면 purge_finished()로 지운다.
+"""
+import logging
+from datetime import timedelta
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from common.models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+Status = OutboundEmail.Status
+RETRY_BASE_SECONDS = 30
+
+
+def enqueue(subject: str, body: str, to: List[str], from_email: Optional[str] = None) -> int:
+    """메일을 큐에 넣고 id 반환 (SMTP 연결 없이 INSERT 1번)"""
+    mail = OutboundEmail.objects.create(
+        subject=subject,
+        body=body,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=list(to),
+    )
+    return mail.pk
+
+
+def get_status(mail_id: int) -> Optional[str]:
+    return OutboundEmail.objects.filter(pk=mail_id).values_list("status", flat=True).first()
+
+
+def claim(limit: int) -> List[OutboundEmail]:
+    """발송 시각이 된 메일을 선점해 SENDING으로 바꾼다 (여러 워커가 동시에 실행돼도 중복 없음)"""
+    now = timezone.now()
+    with transaction.atomic():
+        queryset = OutboundEmail.objects.filter(status=Status.PENDING, next_attempt_at__lte=now).order_by(
+            "next_attempt_at", "id"
+        )
+        if connection.features.has_select_for_update_skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+        mails = list(queryset[:limit])
+        if mails:
+            OutboundEmail.objects.filter(pk__in=[mail.pk for mail in mails]).update(
+                status=Status.SENDING, attempts=F("attempts") + 1, updated_at=now
+            )
+    for mail in mails:
+        mail.attempts += 1
+    return mails
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+
+
+def send_batch(batch_size: Optional[int] = None) -> dict:
+    """한 배치를 발송하고 결과별 건수 반환"""
+    mails = claim(batch_size or settings.MAIL_QUEUE_BATCH_SIZE)
+    report = {"sent": 0, "retry": 0, "failed": 0}
+    if not mails:
+        return report
+
+    errors = {}
+    smtp = get_connection()
+    try:
+        smtp.open()
+    except Exception as exc:
+        # 연결 자체가 실패하면 이번 배치 전체를 재시도 대상으로
+        logger.exception("SMTP 연결 실패: %d건 재시도 예정", len(mails))
+        errors = {mail.pk: exc for mail in mails}
+    else:
+        try:
+            for mail in mails:
+                try:
+                    EmailMessage(mail.subject, mail.body, mail.from_email, mail.to, connection=smtp).send()
+                except Exception as exc:
+                    errors[mail.pk] = exc
+        finally:
+            smtp.close()
+
+    now = timezone.now()
+    sent_ids = [mail.pk for mail in mails if mail.pk not in errors]
+    retry, failed = [], []
+    for mail in mails:
+        if mail.pk in errors:
+            exc = errors[mail.pk]
+            mail.last_error = (str(exc) or exc.__class__.__name__)[:255]
+            (failed if mail.attempts >= settings.MAIL_QUEUE_MAX_ATTEMPTS else retry).append(mail)
+
+    if sent_ids:
+        OutboundEmail.objects.filter(pk__in=sent_ids).update(
+            status=Status.SENT, sent_at=now, last_error="", body="", updated_at=now
+        )
+    for mail in retry:
+        mail.status = Status.PENDING
+        mail.next_attempt_at = now + _retry_delay(mail.attempts)
+    for mail in failed:
+        mail.status = Status.FAILED
+        mail.body = ""  # 더 보내지 않으므로 인증 코드 등 본문을 남기지 않는다
+        logger.error("메일 발송 최종 실패: id=%s to=%s error=%s", mail.pk, mail.to, mail.last_error)
+    for mail in retry + failed:
+        mail.updated_at = now
+    if retry:
+        OutboundEmail.objects.bulk_update(
+            retry, ["status", "next_attempt_at", "last_error", "updated_at"], batch_size=500
+        )
+    if failed:
+        OutboundEmail.objects.bulk_update(
+            failed, ["status", "next_attempt_at", "last_error", "body", "updated_at"], batch_size=500
+        )
+    report.update(sent=len(sent_ids), retry=len(retry), failed=len(failed))
+    return report
+
+
+def release_stale(timeout: Optional[int] = None) -> int:
+    """SENDING 상태로 오래 남은 메일(워커 비정상 종료)을 다시 대기 상태로"""
+    timeout = timeout or settings.MAIL_QUEUE_CLAIM_TIMEOUT
+    now = timezone.now()
+    return OutboundEmail.objects.filter(
+        status=Status.SENDING, updated_at__lt=now - timedelta(seconds=timeout)
+    ).update(status=Status.PENDING, next_attempt_at=now, updated_at=now)
+
+
+def purge_finished(days: Optional[int] = None) -> int:
+    """발송 완료/최종 실패 후 days일이 지난 메일 삭제. 삭제한 수 반환"""
+    days = settings.MAIL_QUEUE_RETENTION_DAYS if days is None else days
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = OutboundEmail.objects.filter(
+        status__in=[Status.SENT, Status.FAILED], updated_at__lt=cutoff
+    ).delete()
+    return deleted
@@ -0,0 +1,254 @@
+import json
+import os
+import platform
+import subprocess
+from datetime import date, datetime
+from importlib import import_module
+
+import django
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.crypto import get_random_string
+
+from accounts.models import Account
+from common import benchmark, meili
+
+MAX_SEARCH_TERMS = 500
+
+
+def _git(*args) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+class Command(BaseCommand):
+    help = (
+        "스토어프론트 부하 테스트: Meilisearch/토스 로컬 대역을 띄우고 홈/검색/상세/자동완성/바로구매/관리자 "
+        "요청을 비율대로 보내 p50/p95/p99, RPS, 요청당 쿼리 수를 JSON으로 저장 "
+        "(바로구매 시나리오가 만든 주문은 DB에 남는다)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--duration", type=float, default=30, help="측정 시간(초, 기본 30)")
+        parser.add_argument("--requests", type=int, help="측정할 시나리오 실행 수 (지정하면 duration 전에 끝날 수 있음)")
+        parser.add_argument("--warmup", type=float, default=3, help="측정 전 워밍업 시간(초, 기본 3)")
+        parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 스레드 수 (기본 8)")
+        parser.add_argument(
+            "--mix",
+            default=",".join(f"{name}={weight}" for name, weight in benchmark.DEFAULT_MIX.items()),
+            help="시나리오 비율 (기본 %(default)s)",
+        )
+        parser.add_argument("--random-seed", type=int, default=0, help="시나리오/대상 선택 난수 시드 (기본 0)")
+        parser.add_argument(
+            "--url",
+            help="이미 띄운 서버(gunicorn 등) 주소. 없으면 이 프로세스에서 스레드 WSGI 서버를 띄운다. "
+                 "외부 서버는 MEILI_URL/TOSS_API_BASE를 출력되는 대역 주소로 지정해 띄워야 한다",
+        )
+        parser.add_argument("--meili-port", type=int, help="Meilisearch 대역 포트 (기본: --url이면 7701, 아니면 임의)")
+        parser.add_argument("--toss-port", type=int, help="토스 대역 포트 (기본: --url이면 7702, 아니면 임의)")
+        parser.add_argument("--seed", action="store_true", help="측정 전에 seed_demo_data --bulk로 데이터 생성")
+        parser.add_argument("--seed-products", type=int, default=100000, help="--seed 상품 수 (기본 100000)")
+        parser.add_argument("--seed-orders", type=int, default=1000000, help="--seed 주문 수 (기본 1000000)")
+        parser.add_argument("--seed-users", type=int, default=10000, help="--seed 회원 수 (기본 10000)")
+        parser.add_argument("--seed-categories", type=int, default=20, help="--seed 카테고리 수 (기본 20)")
+        parser.add_argument(
+            "--output",
+            help="결과 JSON 경로 (기본 BENCHMARK_RESULTS_DIR/<시각>-<커밋>.json)",
+        )
+        parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+
+    def handle(self, *args, **options):
+        try:
+            mix = benchmark.parse_mix(options["mix"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency는 1 이상이어야 합니다")
+        baseline = None
+        if options["compare"]:
+            try:
+                with open(options["compare"], encoding="utf-8") as fp:
+                    baseline = json.load(fp)
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"비교 결과를 읽을 수 없습니다: {exc}")
+
+        external = bool(options["url"])
+        search = benchmark.MeiliStandIn().start(port=options["meili_port"] or (7701 if external else 0))
+        toss = benchmark.TossStandIn().start(port=options["toss_port"] or (7702 if external else 0))
+        # 이 프로세스의 색인 신호/결제 호출도 대역으로 보낸다
+        settings.MEILI_URL = search.url
+        settings.TOSS_API_BASE = toss.url
+        meili._client = None
+        app_server = None
+        try:
+            if options["seed"]:
+                self.stdout.write("데이터 생성 중 (seed_demo_data --bulk)...")
+                call_command(
+                    "seed_demo_data",
+                    products=options["seed_products"],
+                    orders=options["seed_orders"],
+                    users=options["seed_users"],
+                    categories=options["seed_categories"],
+                    bulk=True,
+                    stdout=self.stdout,
+                )
+            loaded = search.load_products()
+            target = self._target(search, options["concurrency"])
+            self.stdout.write(f"검색 대역에 상품 {loaded}건 적재, 대상 상품 {len(target.product_ids)}건")
+
+            if external:
+                target.base_url = options["url"].rstrip("/")
+                self.stdout.write(
+                    f"외부 서버 {target.base_url} 측정. 서버 환경 변수: "
+                    f"MEILI_URL={search.url} TOSS_API_BASE={toss.url}"
+                )
+            else:
+                app_server, target.base_url = self._serve_in_process()
+                self.stdout.write(f"앱 서버 {target.base_url} (같은 프로세스, DEBUG=False)")
+
+            self.stdout.write(
+                f"측정 시작: 동시 {options['concurrency']}, {options['duration']}초"
+                + (f" 또는 시나리오 {options['requests']}회" if options["requests"] else "")
+                + f", 워밍업 {options['warmup']}초"
+            )
+            raw = benchmark.run_load(
+                target,
+                mix,
+                concurrency=options["concurrency"],
+                duration=options["duration"],
+                max_requests=options["requests"],
+                warmup=options["warmup"],
+                seed=options["random_seed"],
+            )
+        finally:
+            if app_server is not None:
+                app_server.shutdown()
+                app_server.server_close()
+            search.stop()
+            toss.stop()
+
+        report = benchmark.summarize(raw)
+        report["meta"] = self._meta(options, mix, loaded, external)
+        if baseline is not None:
+            report["compare"] = {
+                "baseline": options["compare"],
+                "baseline_commit": baseline.get("meta", {}).get("commit"),
+                "rows": benchmark.compare(report, baseline),
+            }
+        path = options["output"] or os.path.join(
+            settings.BENCHMARK_RESULTS_DIR,
+            f"{datetime.now():%Y%m%d-%H%M%S}-{report['meta']['commit'] or 'nogit'}.json",
+        )
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fp:
+            json.dump(report, fp, ensure_ascii=False, indent=2)
+
+        self._print(report)
+        self.stdout.write(self.style.SUCCESS(f"결과 저장: {path}"))
+
+    # ------------------------------------------------------------------
+
+    def _target(self, search: benchmark.MeiliStandIn, concurrency: int) -> benchmark.Target:
+        docs = [doc for doc in search.docs.values() if doc.get("is_active")]
+        if not docs:
+            raise CommandError("판매 중인 상품이 없습니다. --seed 또는 seed_demo_data로 먼저 데이터를 만드세요")
+        terms = []
+        for doc in docs[:MAX_SEARCH_TERMS]:
+            words = [word for word in doc["name"].split() if len(word) >= 2]
+            if words:
+                terms.append(words[0])
+
+        members = [self._account(f"bench_member_{index}", Account.Role.MEMBER, index) for index in range(concurrency)]
+        staff = self._account("bench_staff", Account.Role.OWNER, 9999)
+        csrf_token = get_random_string(32)
+        return benchmark.Target(
+            base_url="",
+            product_ids=[doc["id"] for doc in docs],
+            terms=terms,
+            member_sessions=[self._session(member) for member in members],
+            staff_session=self._session(staff),
+            csrf_token=csrf_token,
+            session_cookie=settings.SESSION_COOKIE_NAME,
+        )
+
+    def _account(self, username: str, role: str, index: int) -> Account:
+        account, created = Account.objects.get_or_create(
+            username=username,
+            defaults={
+                "email": f"{username}@bench.invalid",
+                "name": "벤치마크",
+                "birth_date": date(1990, 1, 1),
+                "phone": f"010-0000-{index:04d}",
+                "address": "벤치마크 주소",
+                "role": role,
+            },
+        )
+        if created:
+            account.set_unusable_password()
+            account.save(update_fields=["password"])
+        return account
+
+    def _session(self, user: Account) -> str:
+        # 로그인 폼(비밀번호 해시/요청 제한)을 거치지 않고 로그인된 세션을 바로 만든다
+        store = import_module(settings.SESSION_ENGINE).SessionStore()
+        store.create()
+        store[SESSION_KEY] = str(user.pk)
+        store[BACKEND_SESSION_KEY] = "django.contrib.auth.backends.ModelBackend"
+        store[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        store.save()
+        return store.session_key
+
+    def _serve_in_process(self):
+        # 운영과 같은 조건(DEBUG 끔, 쿼리 로그 없음)으로 재되 TLS 리다이렉트/보안 쿠키는 끈다
+        settings.DEBUG = False
+        settings.ALLOWED_HOSTS = list(settings.ALLOWED_HOSTS) + ["127.0.0.1"]
+        settings.SECURE_SSL_REDIRECT = False
+        settings.SESSION_COOKIE_SECURE = False
+        settings.CSRF_COOKIE_SECURE = False
+        from django.core.wsgi import get_wsgi_application
+
+        return benchmark.serve_app(get_wsgi_application())
+
+    def _meta(self, options, mix, products: int, external: bool) -> dict:
+        return {
+            "commit": _git("rev-parse", "--short", "HEAD"),
+            "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+            "started_at": datetime.now().astimezone().isoformat(timespec="seconds"),
+            "server": options["url"] if external else "in-process",
+            "database": settings.DATABASES["default"]["ENGINE"].rsplit(".", 1)[-1],
+            "products": products,
+            "concurrency": options["concurrency"],
+            "duration": options["duration"],
+            "max_requests": options["requests"],
+            "warmup": options["warmup"],
+            "mix": mix,
+            "random_seed": options["random_seed"],
+            "python": platform.python_version(),
+            "django": django.get_version(),
+        }
+
+    def _print(self, report: dict):
+        header = f"{'시나리오':<16}{'요청':>8}{'오류':>6}{'RPS':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'쿼리':>7}"
+        self.stdout.write(header)
+        rows = list(report["scenarios"].items()) + [("total", report["total"])]
+        for name, stat in rows:
+            queries = stat["queries_per_request"]
+            self.stdout.write(
+                f"{name:<18}{stat['requests']:>8}{stat['errors']:>6}{stat['rps']:>9.1f}"
+                f"{stat['p50_ms']:>9.1f}{stat['p95_ms']:>9.1f}{stat['p99_ms']:>9.1f}"
+                f"{queries if queries is not None else '-':>7}"
+            )
+        if "compare" in report:
+            self.stdout.write(f"\n[{report['compare']['baseline_commit'] or report['compare']['baseline']} 대비 변화율 %]")
+            for row in report["compare"]["rows"]:
+                changes = ", ".join(
+                    f"{key} {value['change_pct']:+.1f}" for key, value in row.items()
+                    if key != "scenario" and value["change_pct"] is not None
+                )
+                self.stdout.write(f"{row['scenario']}: {changes or '-'}")
@@ -0,0 +1,97 @@
+import json
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "쿼리 프로파일 로그(JSONL)를 집계해 쿼리가 많은 뷰와 N+1 호출 위치 상위 목록 출력"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=settings.QUERY_PROFILER_LOG_PATH,
+            help="프로파일 로그 경로 (기본 QUERY_PROFILER_LOG_PATH)",
+        )
+        parser.add_argument("--top", type=int, default=10, help="항목별 상위 N개 (기본 10)")
+        parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+
+    def handle(self, *args, **options):
+        views = defaultdict(lambda: {"requests": 0, "queries": 0, "max_queries": 0, "db_ms": 0.0, "duplicates": 0})
+        sites = defaultdict(lambda: {"requests": 0, "queries": 0, "ms": 0.0, "max_count": 0, "fingerprint": "", "views": set()})
+        total = 0
+        try:
+            fp = open(options["path"], encoding="utf-8")
+        except FileNotFoundError:
+            raise CommandError(f"프로파일 로그가 없습니다: {options['path']}")
+        with fp:
+            for line in fp:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if "queries" not in record:
+                    continue
+                total += 1
+                name = record.get("view") or record.get("path", "?")
+                view = views[name]
+                view["requests"] += 1
+                view["queries"] += record["queries"]
+                view["max_queries"] = max(view["max_queries"], record["queries"])
+                view["db_ms"] += record.get("db_ms", 0)
+                view["duplicates"] += record.get("duplicates", 0)
+                for item in record.get("n_plus_one", []):
+                    site = sites[item["site"]]
+                    site["requests"] += 1
+                    site["queries"] += item["count"]
+                    site["ms"] += item["ms"]
+                    site["max_count"] = max(site["max_count"], item["count"])
+                    site["fingerprint"] = item["fingerprint"]
+                    site["views"].add(name)
+
+        top = options["top"]
+        report = {
+            "requests": total,
+            "views": [
+                {
+                    "view": name,
+                    "requests": stat["requests"],
+                    "avg_queries": round(stat["queries"] / stat["requests"], 1),
+                    "max_queries": stat["max_queries"],
+                    "avg_db_ms": round(stat["db_ms"] / stat["requests"], 2),
+                    "duplicates": stat["duplicates"],
+                }
+                for name, stat in sorted(views.items(), key=lambda kv: kv[1]["queries"], reverse=True)[:top]
+            ],
+            "n_plus_one": [
+                {
+                    "site": name,
+                    "requests": stat["requests"],
+                    "queries": stat["queries"],
+                    "max_per_request": stat["max_count"],
+                    "ms": round(stat["ms"], 2),
+                    "views": sorted(stat["views"]),
+                    "fingerprint": stat["fingerprint"],
+                }
+                for name, stat in sorted(sites.items(), key=lambda kv: kv[1]["queries"], reverse=True)[:top]
+            ],
+        }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, ensure_ascii=False, indent=2))
+            return
+        self.stdout.write(f"요청 {total}건 집계")
+        self.stdout.write("\n[쿼리 많은 뷰]")
+        for item in report["views"]:
+            self.stdout.write(
+                f"{item['view']}: {item['requests']}회, 평균 {item['avg_queries']}개(최대 {item['max_queries']}), "
+                f"평균 DB {item['avg_db_ms']}ms, 중복 {item['duplicates']}개"
+            )
+        self.stdout.write("\n[N+1 의심 호출 위치]")
+        for item in report["n_plus_one"]:
+            self.stdout.write(
+                f"{item['site']}: {item['requests']}개 요청에서 쿼리 {item['queries']}개 "
+                f"(요청당 최대 {item['max_per_request']}개, {item['ms']}ms) - {', '.join(item['views'])}"
+            )
+            self.stdout.write(f"    {item['fingerprint'][:200]}")
@@ -1,7 +1,9 @@
+import os
 import random
 from datetime import timedelta
 from decimal import Decimal
 
+from django.contrib.auth.hashers import make_password
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.utils import timezone
@@ -12,6 +14,7 @@ except ImportError as exc:  # pragma: no cover - handled at runtime
     raise CommandError("Install Faker to use this command: pip install Faker") from exc
 
 from accounts.models import Account
+from common import seeding
 from cart.models import Cart, CartItem, Wishlist, WishlistItem
 from catalog.models import Category
 from common.models import (
@@ -27,11 +30,18 @@ from common.models import (
 from delivery.models import Delivery
 from notifications.models import Notification
 from order.models import Order, OrderItem
+from order.numbers import generate_order_number
+from order.state_machine import rebuild_counters
 from product.models import Product, ProductImage, ProductOption
 from social.models import Inquiry, InquiryMessage, Review, ReviewImage
 
 fake = Faker("ko_KR")
 
+SIZES = ["XS", "S", "M", "L", "XL"]
+MEMBER_PASSWORD = "User1234!"
+# --bulk 회원 아이디: seed{시드}_user{번호}
+BULK_USERNAME_REGEX = r"^seed[0-9]+_user[0-9]+$"
+
 
 class Command(BaseCommand):
     help = "Seed demo data across core models for development/testing."
@@ -46,6 +56,26 @@ class Command(BaseCommand):
             action="store_true",
             help="Remove previously seeded demo data before creating new records.",
         )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help="Fast mode for large volumes: chunked bulk_create in parallel worker processes, "
+                 "one shared password hash, search index rebuilt once at the end. "
+                 "Each chunk commits on its own instead of one transaction.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes for --bulk (default: CPU count).",
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000, help="Rows per bulk chunk (default 2000).")
+        parser.add_argument(
+            "--random-seed",
+            type=int,
+            default=0,
+            help="Seed for --bulk. The same seed produces the same data regardless of --workers.",
+        )
 
     def handle(self, *args, **options):
         categories_count = options["categories"]
@@ -57,8 +87,14 @@ class Command(BaseCommand):
         if flush:
             self.stdout.write("Clearing existing demo data...")
             self._flush_data()
+            if options["bulk"]:
+                Account.objects.filter(username__regex=BULK_USERNAME_REGEX).delete()
         fake.unique.clear()
 
+        if options["bulk"]:
+            self._handle_bulk(options)
+            return
+
         with transaction.atomic():
             owner = self._ensure_owner_account()
             members = self._create_members(user_count)
@@ -71,9 +107,81 @@ class Command(BaseCommand):
             self._create_carts_and_wishlists(products, members)
             self._create_notifications(products, members)
             self._create_orders(products, members, owner, order_count)
+            # 임의 상태로 만든 주문을 대시보드 집계에 반영
+            rebuild_counters()
 
         self.stdout.write(self.style.SUCCESS("Demo data successfully generated."))
 
+    # ------------------------------------------------------------------
+    # Bulk mode
+    # ------------------------------------------------------------------
+
+    def _handle_bulk(self, options):
+        seed = options["random_seed"]
+        chunk_size = max(1, options["chunk_size"])
+        workers = max(1, options["workers"])
+        if options["orders"] and not options["users"]:
+            raise CommandError("--orders needs at least one member (--users).")
+        if (
+            Account.objects.filter(username__startswith=f"seed{seed}_user").exists()
+            or Product.objects.filter(sku__startswith=f"SKU-{seed}-").exists()
+        ):
+            raise CommandError(f"Data for --random-seed {seed} already exists. Use --flush or another seed.")
+
+        random.seed(seed)
+        fake.seed_instance(seed)
+        with seeding.index_signals_disabled():
+            owner = self._ensure_owner_account()
+            categories = self._create_categories(options["categories"])
+            seeding.share(
+                seed=seed,
+                password=make_password(MEMBER_PASSWORD),  # 회원 전체가 같은 해시를 쓴다
+                category_ids=[category.pk for category in categories],
+                first_product_id=seeding.next_id(Product),
+                first_account_id=seeding.next_id(Account),
+                first_delivery_id=seeding.next_id(Delivery),
+                first_cart_id=seeding.next_id(Cart),
+                first_wishlist_id=seeding.next_id(Wishlist),
+                first_order_id=seeding.next_id(Order),
+            )
+
+            self._run_bulk("products", _bulk_products, options["products"], chunk_size, workers)
+            seeding.share(catalog=_load_catalog(seeding.shared["first_product_id"], options["products"]))
+            self._run_bulk("members", _bulk_members, options["users"], chunk_size, workers)
+            seeding.share(deliveries=_load_deliveries(seeding.shared["first_delivery_id"], options["users"]))
+            self._run_bulk("orders", _bulk_orders, options["orders"], chunk_size, workers)
+
+            # 소량 콘텐츠(공지/리뷰/문의)는 일반 경로로 표본 상품/회원에만 만든다
+            products = list(Product.objects.filter(pk__in=[item[0] for item in _sample(random, seeding.shared["catalog"], 50)]))
+            members = list(Account.objects.filter(username__startswith=f"seed{seed}_user")[:50])
+            with transaction.atomic():
+                self._create_site_content(owner)
+                if products and members:
+                    self._create_reviews(products, members)
+                    self._create_inquiries(products, members)
+                rebuild_counters()
+
+        indexed = seeding.reindex_products()
+        if indexed is None:
+            self.stdout.write("MEILI_URL is not set; skipped search indexing.")
+        else:
+            self.stdout.write(f"Indexed {indexed} products.")
+        self.stdout.write(self.style.SUCCESS("Demo data successfully generated (bulk)."))
+
+    def _run_bulk(self, label, func, count, chunk_size, workers):
+        if not count:
+            return
+        tasks = seeding.blocks(count, chunk_size)
+        step = max(1, len(tasks) // 10)
+
+        def progress(done, total):
+            if done == total or done % step == 0:
+                self.stdout.write(f"  {label}: {done}/{total} chunks")
+
+        self.stdout.write(f"Creating {count} {label} ({len(tasks)} chunks, {workers} workers)...")
+        rows = seeding.run_blocks(func, tasks, workers, progress)
+        self.stdout.write(f"Created {rows} {label}.")
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -176,12 +284,11 @@ class Command(BaseCommand):
                 review_count=random.randrange(0, 120),
             )
 
-            option_variants = random.randint(0, 3)
-            for _ in range(option_variants):
+            for color, size in _option_variants(random):
                 ProductOption.objects.create(
                     product=product,
-                    color=fake.safe_color_name(),
-                    size=random.choice(["XS", "S", "M", "L", "XL"]),
+                    color=color,
+                    size=size,
                     extra_price=Decimal(random.randrange(0, 15000)),
                     stock=random.randrange(0, 100),
                 )
@@ -373,7 +480,7 @@ class Command(BaseCommand):
             customer = random.choice(members)
             delivery = random.choice([d for d in deliveries if d.user == customer])
             order = Order.objects.create(
-                order_number=fake.unique.bothify(text="ORD#####"),
+                order_number=generate_order_number(),
                 user=customer,
                 delivery=delivery,
                 shipping_name=delivery.recipient_name,
@@ -415,6 +522,247 @@ class Command(BaseCommand):
         return f"010-{middle:04d}-{last:04d}"
 
     def _secondary_address(self):
-        secondary = getattr(fake, "secondary_address", None)
-        value = secondary() if callable(secondary) else f"{random.randint(101, 999)}호"
-        return str(value).replace("\n", " ")
+        return _secondary_address(random)
+
+
+# ----------------------------------------------------------------------
+# Shared generators / bulk workers (run in forked worker processes)
+# ----------------------------------------------------------------------
+
+def _option_variants(rng):
+    # (상품, 색상, 사이즈)는 유니크라 같은 조합은 건너뛴다
+    variants = []
+    for _ in range(rng.randint(0, 3)):
+        variant = (fake.safe_color_name(), rng.choice(SIZES))
+        if variant not in variants:
+            variants.append(variant)
+    return variants
+
+
+def _secondary_address(rng):
+    secondary = getattr(fake, "secondary_address", None)
+    value = secondary() if callable(secondary) else f"{rng.randint(101, 999)}호"
+    return str(value).replace("\n", " ")
+
+
+def _sample(rng, items, count):
+    return rng.sample(items, min(len(items), count))
+
+
+def _block(kind, task):
+    block, start, end = task
+    rng = seeding.block_rng(seeding.shared["seed"], kind, block)
+    fake.seed_instance(seeding.block_seed(seeding.shared["seed"], kind, block))
+    return rng, range(start, end)
+
+
+def _bulk_products(task):
+    ctx = seeding.shared
+    rng, indexes = _block("product", task)
+    month = f"{timezone.now():%Y/%m}"
+    products, options, images = [], [], []
+    for index in indexes:
+        pk = ctx["first_product_id"] + index
+        price = Decimal(rng.randrange(10000, 150000))
+        discount_price = None
+        if rng.random() < 0.5:
+            discount_price = max(price - Decimal(rng.randrange(1000, 20000)), Decimal("1000"))
+        products.append(
+            Product(
+                id=pk,
+                name=fake.catch_phrase()[:150],
+                sku=f"SKU-{ctx['seed']}-{index:07d}",
+                category_id=rng.choice(ctx["category_ids"]),
+                price=price,
+                discount_price=discount_price,
+                stock=rng.randrange(0, 300),
+                description=fake.text(max_nb_chars=250),
+                view_count=rng.randrange(0, 500),
+                sales_count=rng.randrange(0, 300),
+                review_count=rng.randrange(0, 120),
+            )
+        )
+        for color, size in _option_variants(rng):
+            options.append(
+                ProductOption(
+                    product_id=pk,
+                    color=color,
+                    size=size,
+                    extra_price=Decimal(rng.randrange(0, 15000)),
+                    stock=rng.randrange(0, 100),
+                )
+            )
+        for idx in range(rng.randint(1, 3)):
+            images.append(
+                ProductImage(
+                    product_id=pk,
+                    image=f"products/{month}/demo_{pk}_{idx}.jpg",
+                    alt_text=fake.sentence(nb_words=6),
+                    is_main=(idx == 0),
+                    display_order=idx,
+                )
+            )
+    with transaction.atomic():
+        Product.objects.bulk_create(products)
+        ProductOption.objects.bulk_create(options)
+        ProductImage.objects.bulk_create(images)
+    return len(products)
+
+
+def _load_catalog(first_id, count):
+    """[(id, 이름, SKU, 판매가, (옵션 id, ...))] - 회원/주문 워커가 fork로 물려받아 쓴다"""
+    # 옵션 id는 워커 삽입 순서에 따라 달라지므로 (색상, 사이즈) 순으로 둬야 같은 시드면 같은 옵션을 고른다
+    options = {}
+    for product_id, option_id in ProductOption.objects.filter(
+        product_id__gte=first_id, product_id__lt=first_id + count
+    ).values_list("product_id", "id").order_by("product_id", "color", "size"):
+        options.setdefault(product_id, []).append(option_id)
+    return [
+        (pk, name, sku, sale_price, tuple(options.get(pk, ())))
+        for pk, name, sku, sale_price in Product.objects.filter(
+            pk__gte=first_id, pk__lt=first_id + count
+        ).values_list("id", "name", "sku", Product.sale_price_expression()).order_by("id")
+    ]
+
+
+def _load_deliveries(first_id, count):
+    return list(
+        Delivery.objects.filter(pk__gte=first_id, pk__lt=first_id + count)
+        .values_list("id", "user_id", "recipient_name", "phone", "postcode", "address_line1", "address_line2")
+        .order_by("id")
+    )
+
+
+def _pick_option(rng, item):
+    return rng.choice(item[4]) if item[4] else None
+
+
+def _bulk_members(task):
+    ctx = seeding.shared
+    rng, indexes = _block("member", task)
+    catalog = ctx["catalog"]
+    now = timezone.now()
+    accounts, deliveries, carts, wishlists = [], [], [], []
+    cart_items, wishlist_items, notifications = [], [], []
+    for index in indexes:
+        account_id = ctx["first_account_id"] + index
+        username = f"seed{ctx['seed']}_user{index}"
+        # 010-xxxx-xxxx는 일반 시드가 쓰므로 019 대역에 회원 id로 유니크하게
+        phone = f"019-{account_id // 10000 % 10000:04d}-{account_id % 10000:04d}"
+        name = fake.name()
+        accounts.append(
+            Account(
+                id=account_id,
+                username=username,
+                email=f"{username}@example.com",
+                password=ctx["password"],
+                name=name,
+                birth_date=fake.date_of_birth(minimum_age=18, maximum_age=50),
+                phone=phone,
+                address=fake.address().replace("\n", " "),
+            )
+        )
+        deliveries.append(
+            Delivery(
+                id=ctx["first_delivery_id"] + index,
+                user_id=account_id,
+                recipient_name=name,
+                phone=phone,
+                postcode=fake.postcode(),
+                address_line1=fake.address().replace("\n", " "),
+                address_line2=_secondary_address(rng),
+                is_default=True,
+                request_note="문 앞에 놓아주세요.",
+            )
+        )
+        cart_id = ctx["first_cart_id"] + index
+        wishlist_id = ctx["first_wishlist_id"] + index
+        carts.append(Cart(id=cart_id, user_id=account_id, is_active=True))
+        wishlists.append(Wishlist(id=wishlist_id, user_id=account_id, name="기본 찜 목록", is_default=True))
+        for item in _sample(rng, catalog, 5):
+            option_id = _pick_option(rng, item)
+            cart_items.append(
+                CartItem(
+                    cart_id=cart_id,
+                    product_id=item[0],
+                    product_option_id=option_id,
+                    quantity=rng.randint(1, 3),
+                    unit_price=item[3],
+                    discount_amount=Decimal("0"),
+                )
+            )
+            wishlist_items.append(WishlistItem(wishlist_id=wishlist_id, product_id=item[0], product_option_id=option_id))
+        if catalog:
+            item = rng.choice(catalog)
+            notifications.append(
+                Notification(
+                    user_id=account_id,
+                    notification_type=rng.choice(list(Notification.NotificationType)),
+                    product_id=item[0],
+                    product_option_id=_pick_option(rng, item),
+                    channel=rng.choice(list(Notification.Channel)),
+                    status=rng.choice(list(Notification.Status)),
+                    scheduled_for=now + timedelta(days=rng.randint(1, 7)),
+                )
+            )
+    with transaction.atomic():
+        Account.objects.bulk_create(accounts)
+        Delivery.objects.bulk_create(deliveries)
+        Cart.objects.bulk_create(carts)
+        Wishlist.objects.bulk_create(wishlists)
+        CartItem.objects.bulk_create(cart_items)
+        WishlistItem.objects.bulk_create(wishlist_items)
+        Notification.objects.bulk_create(notifications)
+    return len(accounts)
+
+
+def _bulk_orders(task):
+    ctx = seeding.shared
+    rng, indexes = _block("order", task)
+    catalog, deliveries = ctx["catalog"], ctx["deliveries"]
+    statuses = list(Order.Status)
+    methods = list(Order.PaymentMethod)
+    shipping_fee = Decimal("3000")
+    orders, items = [], []
+    for index in indexes:
+        order_id = ctx["first_order_id"] + index
+        delivery_id, user_id, recipient, phone, postcode, address1, address2 = rng.choice(deliveries)
+        total = Decimal("0")
+        for item in _sample(rng, catalog, rng.randint(1, 3)):
+            quantity = rng.randint(1, 2)
+            line_total = item[3] * quantity
+            items.append(
+                OrderItem(
+                    order_id=order_id,
+                    product_id=item[0],
+                    product_name=item[1],
+                    sku=item[2],
+                    product_option_id=_pick_option(rng, item),
+                    quantity=quantity,
+                    discount_amount=Decimal("0"),
+                    total_price=line_total,
+                )
+            )
+            total += line_total
+        orders.append(
+            Order(
+                id=order_id,
+                order_number=generate_order_number(),
+                user_id=user_id,
+                delivery_id=delivery_id,
+                shipping_name=recipient,
+                shipping_phone=phone,
+                shipping_postcode=postcode,
+                shipping_address1=address1,
+                shipping_address2=address2,
+                status=rng.choice(statuses),
+                payment_method=rng.choice(methods),
+                payment_amount=total + shipping_fee,
+                shipping_fee=shipping_fee,
+                order_note=rng.choice(["", "빠른 배송 부탁드립니다."]),
+            )
+        )
+    with transaction.atomic():
+        Order.objects.bulk_create(orders)
+        OrderItem.objects.bulk_create(items)
+    return len(orders)
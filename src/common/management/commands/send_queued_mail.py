@@ -0,0 +1,51 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from common.mailqueue import purge_finished, release_stale, send_batch
+
+
+class Command(BaseCommand):
+    help = "메일 큐(OutboundEmail)의 대기 메일을 배치 발송 (실패 시 백오프 재시도)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.MAIL_QUEUE_BATCH_SIZE,
+            help="SMTP 연결 하나로 보낼 메일 수(기본 MAIL_QUEUE_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 주기적으로 발송",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=0.5,
+            help="--loop 시 보낼 메일이 없을 때 대기 간격(초, 기본 0.5)",
+        )
+
+    def handle(self, *args, **options):
+        released_at = 0.0
+        while True:
+            if time.monotonic() - released_at > 60:
+                released = release_stale()
+                released_at = time.monotonic()
+                if released:
+                    self.stdout.write(f"멈춘 메일 {released}건을 대기 상태로 되돌림")
+                purged = purge_finished()
+                if purged:
+                    self.stdout.write(f"보관 기간이 지난 메일 {purged}건 삭제")
+
+            report = send_batch(options["batch_size"])
+            if any(report.values()):
+                self.stdout.write(
+                    f"발송 {report['sent']}건, 재시도 예정 {report['retry']}건, 실패 {report['failed']}건"
+                )
+            if not options["loop"]:
+                break
+            if not any(report.values()):
+                time.sleep(options["interval"])
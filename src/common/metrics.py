@@ -0,0 +1,146 @@
+"""Prometheus 지표 (GET /metrics)
+
+핫패스(요청 처리, 검색, 주문 생성, 토스 결제 승인, 캐시 적중)의 히스토그램/카운터.
+gunicorn 여러 워커에서 쓰려면 PROMETHEUS_MULTIPROC_DIR 환경 변수를 지정한다
+(각 워커가 mmap 파일에 기록하고 /metrics가 합산, gunicorn.conf.py 참고).
+지표 기록은 값 하나 더하는 정도라 요청당 수 마이크로초 수준이다.
+"""
+import ipaddress
+import os
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+KNOWN_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
+
+REQUEST_SECONDS = Histogram(
+    "bijou_http_request_seconds", "요청 처리 시간", ["view", "method"], buckets=LATENCY_BUCKETS
+)
+DB_QUERIES = Histogram(
+    "bijou_db_queries_per_request", "요청당 SQL 쿼리 수", ["view"], buckets=QUERY_COUNT_BUCKETS
+)
+SEARCH_SECONDS = Histogram(
+    "bijou_search_seconds", "상품 검색 호출 시간(네트워크 포함)", ["result"], buckets=LATENCY_BUCKETS
+)
+SEARCH_ENGINE_SECONDS = Histogram(
+    "bijou_search_engine_seconds", "Meilisearch processingTimeMs", buckets=LATENCY_BUCKETS
+)
+CHECKOUT_SECONDS = Histogram(
+    "bijou_checkout_seconds", "주문 생성(결제 준비) 시간", ["result"], buckets=LATENCY_BUCKETS
+)
+TOSS_CONFIRM_SECONDS = Histogram(
+    "bijou_toss_confirm_seconds", "토스 결제 승인 API 호출 시간", ["result"], buckets=LATENCY_BUCKETS
+)
+CACHE_REQUESTS = Counter("bijou_cache_requests_total", "캐시 조회 수", ["cache", "result"])
+
+
+class Timing:
+    __slots__ = ("result",)
+
+    def __init__(self):
+        self.result = None
+
+
+def status_result(status_code: int) -> str:
+    """응답 상태 코드 -> result 라벨 (4xx는 잘못된 요청이라 ok/error와 따로 센다)"""
+    if status_code >= 500:
+        return "error"
+    if status_code >= 400:
+        return "invalid"
+    return "ok"
+
+
+@contextmanager
+def timed(histogram):
+    """블록 실행 시간을 result 라벨로 기록. 예외면 error, 아니면 ok
+    (블록 안에서 timing.result를 정하면 그 값, 예: status_result(response.status_code))"""
+    started = time.perf_counter()
+    timing = Timing()
+    try:
+        yield timing
+    except BaseException:
+        timing.result = "error"
+        raise
+    finally:
+        histogram.labels(timing.result or "ok").observe(time.perf_counter() - started)
+
+
+def cache_result(cache: str, hit: bool, count: int = 1):
+    if count:
+        CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc(count)
+
+
+class QueryCounter:
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class MetricsMiddleware:
+    """요청 처리 시간과 쿼리 수를 뷰 이름(URL name) 라벨로 기록"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        started = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match else "unmatched"
+        method = request.method if request.method in KNOWN_METHODS else "OTHER"
+        REQUEST_SECONDS.labels(view, method).observe(time.perf_counter() - started)
+        DB_QUERIES.labels(view).observe(counter.count)
+        return response
+
+
+def _allowed(request) -> bool:
+    """METRICS_TOKEN 베어러 토큰이 맞거나 접속 주소가 METRICS_ALLOWED_IPS 안이면 허용 (둘 다 비면 거부)
+
+    REMOTE_ADDR는 프록시 뒤에서는 프록시 주소이므로 프록시를 거치는 배포에서는 토큰을 쓴다.
+    """
+    token = settings.METRICS_TOKEN
+    if token:
+        header = request.META.get("HTTP_AUTHORIZATION", "")
+        if header.startswith("Bearer ") and constant_time_compare(header[len("Bearer "):], token):
+            return True
+    allowed = settings.METRICS_ALLOWED_IPS
+    if not allowed:
+        return False
+    try:
+        address = ipaddress.ip_address(request.META.get("REMOTE_ADDR", ""))
+    except ValueError:
+        return False
+    return any(address in ipaddress.ip_network(network, strict=False) for network in allowed)
+
+
+def metrics_view(request):
+    if not _allowed(request):
+        return HttpResponseForbidden()
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
@@ -217,3 +217,32 @@ class PolicyAcknowledgement(TimeStampedModel):
 
     def __str__(self) -> str:
         return f"{self.user} agreed to {self.policy}"
+
+
+class OutboundEmail(TimeStampedModel):
+    """발송 대기 메일 큐 (요청 처리 중에는 저장만 하고 send_queued_mail 워커가 발송)"""
+
+    class Status(models.TextChoices):
+        PENDING = "PENDING", "대기"
+        SENDING = "SENDING", "발송 중"
+        SENT = "SENT", "발송 완료"
+        FAILED = "FAILED", "실패"
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255)
+    to = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="outbound_email_due_idx"),
+        ]
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"{self.subject} -> {', '.join(self.to)}"
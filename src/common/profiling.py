@@ -0,0 +1,147 @@
+"""요청 단위 SQL 프로파일러 / N+1 탐지 미들웨어
+
+QUERY_PROFILER_ENABLED이면 모든 요청, QUERY_PROFILER_ALLOW_HEADER이면
+X-Profile-Queries: 1 헤더가 있는 요청만 connection.execute_wrapper로 쿼리를 기록한다.
+- 쿼리 수 / DB 시간 / 완전히 같은 쿼리(SQL+파라미터) 반복
+- 같은 형태(fingerprint)의 쿼리가 같은 호출 위치에서 임계값 이상 반복되면 N+1로 표시
+결과는 X-DB-* 응답 헤더와 common.profiling 로거(JSONL 파일)로 남기고
+query_report 명령으로 모아 본다. 꺼져 있을 때는 설정/헤더 확인만 한다.
+"""
+import logging
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from typing import Dict, List
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+HEADER = "HTTP_X_PROFILE_QUERIES"
+MAX_HEADER_SITES = 3
+
+_IN_LIST = re.compile(r"\bIN \((?:%s, )*%s\)")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+\b")
+_SPACES = re.compile(r"\s+")
+
+_PROJECT_ROOT = str(settings.BASE_DIR) + os.sep
+_THIS_FILE = os.path.abspath(__file__)
+
+
+def fingerprint(sql: str) -> str:
+    """파라미터/리터럴을 지운 쿼리 형태 (IN 목록 길이도 무시)"""
+    sql = _IN_LIST.sub("IN (...)", sql)
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    return _SPACES.sub(" ", sql).strip()
+
+
+def _call_site() -> str:
+    """쿼리를 부른 프로젝트 코드 위치 (site-packages/Django 내부 프레임은 건너뜀)"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(_PROJECT_ROOT)
+            and filename != _THIS_FILE
+            and "site-packages" not in filename
+        ):
+            return f"{os.path.relpath(filename, _PROJECT_ROOT)}:{frame.f_lineno} ({frame.f_code.co_name})"
+        frame = frame.f_back
+    return "?"
+
+
+class QueryProfile:
+    def __init__(self):
+        self.queries: List[Dict] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                {
+                    "sql": sql,
+                    "params": repr(params),
+                    "ms": (time.perf_counter() - started) * 1000,
+                    "site": _call_site(),
+                }
+            )
+
+    def summary(self, threshold: int) -> Dict:
+        exact = Counter((query["sql"], query["params"]) for query in self.queries)
+        by_site = defaultdict(list)
+        for query in self.queries:
+            by_site[(fingerprint(query["sql"]), query["site"])].append(query["ms"])
+        # 같은 위치에서 같은 형태의 쿼리가 임계값 이상 반복되면 N+1. 위치별로 합쳐 보고
+        sites: Dict[str, Dict] = {}
+        for (shape, site), times in by_site.items():
+            if len(times) < threshold:
+                continue
+            item = sites.setdefault(site, {"site": site, "fingerprint": shape, "count": 0, "ms": 0.0})
+            item["count"] += len(times)
+            item["ms"] = round(item["ms"] + sum(times), 2)
+        n_plus_one = sorted(sites.values(), key=lambda item: item["count"], reverse=True)
+        return {
+            "queries": len(self.queries),
+            "db_ms": round(sum(query["ms"] for query in self.queries), 2),
+            "duplicates": sum(count - 1 for count in exact.values() if count > 1),
+            "n_plus_one": n_plus_one,
+        }
+
+
+def _enabled(request) -> bool:
+    if settings.QUERY_PROFILER_ENABLED:
+        return True
+    return settings.QUERY_PROFILER_ALLOW_HEADER and request.META.get(HEADER) == "1"
+
+
+class QueryProfilerMiddleware:
+    """MIDDLEWARE 맨 앞에 두어 세션/인증 쿼리까지 포함해 잰다"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not _enabled(request):
+            return self.get_response(request)
+
+        profile = QueryProfile()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(profile))
+            response = self.get_response(request)
+        summary = profile.summary(settings.QUERY_PROFILER_NPLUSONE_THRESHOLD)
+
+        response["X-DB-Queries"] = str(summary["queries"])
+        response["X-DB-Time"] = f"{summary['db_ms']:.1f}ms"
+        response["X-DB-Duplicates"] = str(summary["duplicates"])
+        if summary["n_plus_one"]:
+            response["X-DB-NPlusOne"] = "; ".join(
+                f"{item['site']} x{item['count']}" for item in summary["n_plus_one"][:MAX_HEADER_SITES]
+            )
+
+        match = getattr(request, "resolver_match", None)
+        logger.info(
+            "쿼리 프로파일 %s %s: %s개 %.1fms",
+            request.method,
+            request.path,
+            summary["queries"],
+            summary["db_ms"],
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "view": match.view_name if match else "",
+                "status": response.status_code,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+                **summary,
+            },
+        )
+        return response
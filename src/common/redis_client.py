@@ -0,0 +1,19 @@
+import redis
+from django.conf import settings
+
+_client = None
+
+
+def get_redis():
+    # 해시/셋/스크립트 등 캐시 API로 표현하기 어려운 자료구조용 Redis 클라이언트
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+def new_async_redis():
+    # asyncio 클라이언트는 이벤트 루프에 묶이므로 요청(스트림)마다 만들고 닫는다
+    import redis.asyncio
+
+    return redis.asyncio.Redis.from_url(settings.REDIS_URL)
@@ -0,0 +1,92 @@
+"""대량 시드 데이터 생성 도구 (seed_demo_data / seed_products --bulk)
+
+- 행을 chunk_size 단위 블록으로 나누고 블록마다 (시드, 종류, 블록 번호)로 정한 난수를 써서
+  워커 수와 상관없이 같은 시드면 같은 데이터가 나온다.
+- 블록은 fork 한 워커 프로세스가 bulk_create + 트랜잭션 1번으로 넣는다.
+- 다른 행이 참조하는 행(회원, 상품, 주문 등)은 미리 정한 id 구간을 직접 채워
+  bulk_create가 pk를 돌려주지 않는 MySQL에서도 참조를 바로 만들 수 있다.
+- 상품 색인 신호는 끄고 마지막에 product.search.bulk_index로 한 번에 색인한다.
+"""
+import hashlib
+import multiprocessing
+import random
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Max
+from django.db.models.signals import post_delete, post_save
+
+# 워커가 읽는 공유 데이터. fork 전에 share()로 넣으면 자식 프로세스에 그대로 복사된다
+shared: Dict = {}
+
+
+def share(**values):
+    shared.update(values)
+
+
+def block_seed(seed: int, kind: str, block: int) -> int:
+    digest = hashlib.sha256(f"{seed}:{kind}:{block}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def block_rng(seed: int, kind: str, block: int) -> random.Random:
+    return random.Random(block_seed(seed, kind, block))
+
+
+def blocks(total: int, chunk_size: int) -> List[Tuple[int, int, int]]:
+    """[(블록 번호, 시작 인덱스, 끝 인덱스)]"""
+    return [(number, start, min(start + chunk_size, total)) for number, start in enumerate(range(0, total, chunk_size))]
+
+
+def next_id(model) -> int:
+    return (model.objects.aggregate(last=Max("pk"))["last"] or 0) + 1
+
+
+@contextmanager
+def index_signals_disabled():
+    """상품 저장/삭제 시 Meilisearch 색인 신호를 잠시 끈다"""
+    from product.models import Product
+    from product.signals import on_product_delete, on_product_save
+
+    post_save.disconnect(on_product_save, sender=Product)
+    post_delete.disconnect(on_product_delete, sender=Product)
+    try:
+        yield
+    finally:
+        post_save.connect(on_product_save, sender=Product)
+        post_delete.connect(on_product_delete, sender=Product)
+
+
+def run_blocks(func: Callable, tasks: List[Tuple], workers: int,
+               progress: Optional[Callable[[int, int], None]] = None) -> int:
+    """func(task)를 워커 프로세스에서 실행하고 반환값(행 수) 합계를 돌려준다.
+    fork를 못 쓰는 환경이거나 workers가 1이면 이 프로세스에서 차례로 실행.
+    워커의 주문번호 노드 번호는 order.numbers가 fork 후 Redis에서 따로 임대한다."""
+    total = 0
+    if workers <= 1 or len(tasks) <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        for done, task in enumerate(tasks, 1):
+            total += func(task)
+            if progress:
+                progress(done, len(tasks))
+        return total
+
+    context = multiprocessing.get_context("fork")
+    # 부모 DB 연결을 자식과 나눠 쓰지 않도록 fork 전에 닫는다
+    connections.close_all()
+    with context.Pool(min(workers, len(tasks))) as pool:
+        for done, rows in enumerate(pool.imap_unordered(func, tasks), 1):
+            total += rows
+            if progress:
+                progress(done, len(tasks))
+    return total
+
+
+def reindex_products() -> Optional[int]:
+    """MEILI_URL이 설정돼 있으면 전체 상품을 한 번에 색인. 색인한 수(미설정이면 None)"""
+    if not settings.MEILI_URL:
+        return None
+    from product.search import bulk_index
+
+    return bulk_index()
@@ -0,0 +1,174 @@
+"""Redis 세션 엔진 (SESSION_ENGINE = "common.sessions")
+
+세션 1개 = Redis 문자열 1개(session:{key}), 값은 압축 JSON이다.
+- 요청당 세션 읽기는 GET 1번. 저장은 내용이 실제로 바뀐 경우만 파이프라인 1번
+  (modified 표시만 되고 값이 같으면 쓰지 않는다)
+- 로그인 세션은 회원별 셋(session:user:{id})에 모아 두어 중복 로그인 차단이나
+  회원 세션 종료 시 세션 전체를 훑지 않는다
+- 접속 중 회원 수는 회원별 최종 만료 시각을 담은 정렬 셋(session:active)으로 센다
+Redis가 저장소이므로 값은 서명하지 않는다(Django 캐시 세션과 같음).
+"""
+import json
+import time
+import zlib
+from typing import Iterable, List, Optional, Set
+
+from django.contrib.auth import SESSION_KEY
+from django.contrib.sessions.backends.base import CreateError, SessionBase, UpdateError
+
+from common.redis_client import get_redis
+
+ACTIVE_USERS = "session:active"
+COMPRESS_MIN_BYTES = 512 # 이보다 큰 세션만 zlib 압축
+_PLAIN, _ZLIB = b"j", b"z"
+
+
+def session_key_name(session_key: str) -> str:
+    return f"session:{session_key}"
+
+
+def _user_key(user_id) -> str:
+    return f"session:user:{user_id}"
+
+
+def dumps(data: dict) -> bytes:
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+    if len(raw) >= COMPRESS_MIN_BYTES:
+        return _ZLIB + zlib.compress(raw)
+    return _PLAIN + raw
+
+
+def loads(payload: bytes) -> dict:
+    marker, body = payload[:1], payload[1:]
+    if marker == _ZLIB:
+        body = zlib.decompress(body)
+    return json.loads(body)
+
+
+class SessionStore(SessionBase):
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self._loaded_payload = None
+
+    def load(self):
+        payload = None
+        if self.session_key:
+            payload = get_redis().get(session_key_name(self.session_key))
+        if payload is None:
+            self._session_key = None
+            return {}
+        try:
+            data = loads(payload)
+        except (ValueError, zlib.error):
+            self._session_key = None
+            return {}
+        self._loaded_payload = payload
+        return data
+
+    def exists(self, session_key):
+        return bool(get_redis().exists(session_key_name(session_key)))
+
+    @classmethod
+    def existing_keys(cls, session_keys: Iterable[str]) -> Set[str]:
+        """유효한 세션 키만 반환 (파이프라인 1번)"""
+        session_keys = list(session_keys)
+        pipe = get_redis().pipeline(transaction=False)
+        for session_key in session_keys:
+            pipe.exists(session_key_name(session_key))
+        return {key for key, found in zip(session_keys, pipe.execute()) if found}
+
+    def create(self):
+        for _ in range(10000):
+            self._session_key = self._get_new_session_key()
+            try:
+                self.save(must_create=True)
+            except CreateError:
+                continue
+            self.modified = True
+            return
+        raise RuntimeError("세션 키를 만들 수 없습니다. Redis 상태를 확인해 주세요.")
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+        data = self._get_session(no_load=must_create)
+        payload = dumps(data)
+        if not must_create and payload == self._loaded_payload:
+            return
+        age = self.get_expiry_age()
+        pipe = get_redis().pipeline()
+        if must_create:
+            pipe.set(session_key_name(self.session_key), payload, ex=age, nx=True)
+        else:
+            pipe.set(session_key_name(self.session_key), payload, ex=age, xx=True)
+        user_id = data.get(SESSION_KEY)
+        if user_id:
+            pipe.sadd(_user_key(user_id), self.session_key)
+            pipe.expire(_user_key(user_id), age, gt=True)
+            pipe.expire(_user_key(user_id), age, nx=True)
+            pipe.zadd(ACTIVE_USERS, {user_id: time.time() + age}, gt=True)
+        if not pipe.execute()[0]:
+            raise CreateError if must_create else UpdateError
+        self._loaded_payload = payload
+
+    def delete(self, session_key=None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        client = get_redis()
+        payload = client.getdel(session_key_name(session_key))
+        if payload:
+            try:
+                user_id = loads(payload).get(SESSION_KEY)
+            except (ValueError, zlib.error):
+                user_id = None
+            if user_id:
+                _forget(user_id, [session_key])
+        if session_key == self.session_key:
+            self._loaded_payload = None
+
+    @classmethod
+    def clear_expired(cls):
+        # 세션은 Redis TTL로 사라지므로 접속자 셋의 만료 항목만 정리
+        get_redis().zremrangebyscore(ACTIVE_USERS, "-inf", time.time())
+
+
+def _forget(user_id, session_keys: List[str]):
+    """회원 셋에서 세션을 빼고, 남은 세션이 없으면 접속자 셋에서도 뺀다"""
+    pipe = get_redis().pipeline()
+    pipe.srem(_user_key(user_id), *session_keys)
+    pipe.scard(_user_key(user_id))
+    if pipe.execute()[1] == 0:
+        get_redis().zrem(ACTIVE_USERS, user_id)
+
+
+def user_session_keys(user_id) -> List[str]:
+    """회원의 유효한 세션 키 목록 (만료된 키는 셋에서 정리)"""
+    members = [key.decode() for key in get_redis().smembers(_user_key(user_id))]
+    live = SessionStore.existing_keys(members)
+    expired = [key for key in members if key not in live]
+    if expired:
+        _forget(user_id, expired)
+    return [key for key in members if key in live]
+
+
+def delete_user_sessions(user_id, exclude: Optional[str] = None) -> int:
+    """회원의 다른 세션을 모두 종료하고 종료한 수를 반환"""
+    targets = [key for key in user_session_keys(user_id) if key != exclude]
+    if not targets:
+        return 0
+    pipe = get_redis().pipeline()
+    for session_key in targets:
+        pipe.delete(session_key_name(session_key))
+    pipe.execute()
+    _forget(user_id, targets)
+    return len(targets)
+
+
+def count_active_users() -> int:
+    """세션이 살아 있는 로그인 회원 수"""
+    client = get_redis()
+    now = time.time()
+    client.zremrangebyscore(ACTIVE_USERS, "-inf", now)
+    return client.zcard(ACTIVE_USERS)
@@ -4,15 +4,17 @@ import logging
 
 from django.contrib.admin import AdminSite
 from django.db.models import F, Sum
-from django.db.models.functions import TruncDate
 from django.utils import timezone
 from django.shortcuts import redirect
 
 from accounts.models import Account
 from order.models import Order, OrderItem
+from order import state_machine
 
-#활성 세션 모델 임포트
-from django.contrib.sessions.models import Session
+#활성 세션(접속 회원) 집계
+from common import sessions
+
+logger = logging.getLogger(__name__)
 
 # 프로젝트 전용 AdminSite 정의
 class BijouAdminSite(AdminSite):
@@ -34,14 +36,7 @@ class BijouAdminSite(AdminSite):
     #일반함수처럼 쓰기 위해서, staticmethod 데코레이터 사용, self 인자 제거
     @staticmethod
     def count_active_sessions():
-        active_sessions = Session.objects.filter(expire_date__gte=timezone.now())
-        user_ids = []
-        for session in active_sessions:
-            data = session.get_decoded()
-            uid = data.get("_auth_user_id")
-            if uid:
-                user_ids.append(uid)
-        return len(set(user_ids))
+        return sessions.count_active_users()
 
     # 대시보드에 표시할 통계 데이터 생성 딕셔너리로 돌려주는 내부 헬퍼
     def _build_dashboard_context(self):
@@ -60,10 +55,6 @@ class BijouAdminSite(AdminSite):
         end_of_week = (start_of_week + timedelta(days=7)).replace(
             hour=0, minute=0, second=0, microsecond=0
         )
-        #이번달 주문들
-        monthly_orders = Order.objects.filter(
-            placed_at__gte=start_of_month, placed_at__lt=start_next_month
-        )
         #활성 사용자 수
         active_user_count = self.count_active_sessions()
 
@@ -79,34 +70,26 @@ class BijouAdminSite(AdminSite):
             Order.Status.SHIPPED,
             Order.Status.DELIVERED,
         ]
-        #이번달 통계
-        total_orders = monthly_orders.count()
+        #이번달 통계 (주문일·상태별 집계 행 합산, 주문 테이블 COUNT 없음)
+        monthly_totals = state_machine.status_totals(start_of_month.date(), start_next_month.date())
+        total_orders = sum(entry["count"] for entry in monthly_totals.values())
         #취소된 주문
-        canceled_orders = monthly_orders.filter(status__in=canceled_statuses).count()
+        canceled_orders = sum(
+            monthly_totals.get(status, {}).get("count", 0) for status in canceled_statuses
+        )
         #확정된 주문
-        confirmed_orders = monthly_orders.filter(status=confirmed_status).count()
+        confirmed_orders = monthly_totals.get(confirmed_status, {}).get("count", 0)
         #매출 합계
-        monthly_sales_total = (
-            monthly_orders.filter(status__in=sales_statuses).aggregate(
-                total=Sum("payment_amount")
-            )["total"]
-            or Decimal("0")
+        monthly_sales_total = sum(
+            (monthly_totals.get(status, {}).get("amount", Decimal("0")) for status in sales_statuses),
+            Decimal("0"),
         )
-        #이번주 일별 매출 집계 쿼리셋
-        weekly_sales_queryset = (
-            Order.objects.filter(
-                placed_at__gte=start_of_week,
-                placed_at__lt=end_of_week,
-                status__in=sales_statuses,
-            )
-            .annotate(day=TruncDate("placed_at"))
-            .values("day")
-            .annotate(total=Sum("payment_amount"))
-            .order_by("day")
+        #이번주 일별 매출 딕셔너리
+        sales_by_day = state_machine.daily_amounts(
+            start_of_week.date(), end_of_week.date(), sales_statuses
         )
-        logging.info("이번주 매출"+str(weekly_sales_queryset))
-        #일별 매출 딕셔너리로 변환
-        sales_by_day = {entry["day"]: entry["total"] for entry in weekly_sales_queryset}
+        # 문자열은 실제로 기록될 때만 (백그라운드 스레드에서) 만든다
+        logger.info("이번주 매출 %s", sales_by_day)
         #그래프에 넘길 컨테이너
         weekly_sales_series = []
         for offset in range(7):
@@ -2,6 +2,7 @@ from pathlib import Path
 import environ
 from datetime import timedelta
 import os
+import tempfile
 from django.urls import reverse_lazy
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -44,6 +45,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # 요청별 SQL 프로파일 (QUERY_PROFILER_* 설정으로 켤 때만 동작)
+    'common.profiling.QueryProfilerMiddleware',
+    # 요청 시간/쿼리 수 Prometheus 지표 (/metrics)
+    'common.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -67,6 +72,8 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'cart.context_processors.cart_badge',
+                'notifications.context_processors.unread_badge',
             ],
         },
     },
@@ -108,6 +115,29 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+#------------------- 비밀번호 해시 -------------------#
+# argon2(기본) 또는 pbkdf2. 비용은 bench_password_hashing 명령으로 측정 후 조정
+PASSWORD_HASHER_STRATEGY = env("PASSWORD_HASHER_STRATEGY", default="argon2")
+PASSWORD_ARGON2_TIME_COST = env.int("PASSWORD_ARGON2_TIME_COST", default=2)
+PASSWORD_ARGON2_MEMORY_COST = env.int("PASSWORD_ARGON2_MEMORY_COST", default=19 * 1024)  # KiB
+PASSWORD_ARGON2_PARALLELISM = env.int("PASSWORD_ARGON2_PARALLELISM", default=1)
+PASSWORD_PBKDF2_ITERATIONS = env.int("PASSWORD_PBKDF2_ITERATIONS", default=1_000_000)
+# 로그인 시 재해시(비용/전략 변경분)를 응답 후 백그라운드 스레드에서 처리
+PASSWORD_REHASH_ASYNC = env.bool("PASSWORD_REHASH_ASYNC", default=True)
+PASSWORD_REHASH_WORKERS = env.int("PASSWORD_REHASH_WORKERS", default=2)
+
+# 첫 번째 해셔로 새 비밀번호를 저장하고, 나머지는 기존 해시 검증(다음 로그인 때 재해시)용
+_TUNED_HASHERS = {
+    "argon2": "accounts.hashers.TunedArgon2PasswordHasher",
+    "pbkdf2": "accounts.hashers.TunedPBKDF2PasswordHasher",
+}
+PASSWORD_HASHERS = [
+    _TUNED_HASHERS[PASSWORD_HASHER_STRATEGY],
+    *[path for name, path in _TUNED_HASHERS.items() if name != PASSWORD_HASHER_STRATEGY],
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -145,6 +175,15 @@ RECAPTCHA_PRIVATE_KEY = env("RECAPTCHA_PRIVATE_KEY", default="")
 AXES_FAILURE_LIMIT = 5  # 허용할 최대 로그인 실패 횟수
 AXES_COOLOFF_TIME = timedelta(minutes=5)  # 로그인 제한 시간 (시간 단위)
 # AXES_LOCKOUT_TEMPLATE = 'accounts/lockout.html'  # 잠금 화면
+# 실패 카운터/잠금은 Redis 슬라이딩 윈도우로 처리하고 잠금 이벤트만 DB에 기록 (accounts/throttle.py)
+AXES_HANDLER = "accounts.throttle.RedisAxesHandler"
+# IP당 로그인 요청(POST) 수 제한
+LOGIN_RATE_LIMIT = env.int("LOGIN_RATE_LIMIT", default=5)
+LOGIN_RATE_WINDOW = env.int("LOGIN_RATE_WINDOW", default=60)  # 초
+# 실패 누적 잠금 (아이디 기준은 AXES_FAILURE_LIMIT, IP 기준은 공유 IP를 고려해 더 넉넉하게)
+# 아이디 기준 잠금은 남이 틀린 비밀번호를 보내 계정을 잠글 수 있다는 뜻이기도 하다 (accounts/throttle.py 참고)
+LOGIN_FAILURE_WINDOW = env.int("LOGIN_FAILURE_WINDOW", default=15 * 60)  # 초
+LOGIN_IP_FAILURE_LIMIT = env.int("LOGIN_IP_FAILURE_LIMIT", default=20)
 
 
 
@@ -171,7 +210,30 @@ else:
     SECURE_HSTS_SECONDS = 0
 
 
+#------------------- SQL 프로파일러 -------------------#
+# 켜면 모든 요청, ALLOW_HEADER이면 X-Profile-Queries: 1 요청만 쿼리 수/시간/N+1을 기록 (query_report 명령으로 집계)
+QUERY_PROFILER_ENABLED = env.bool("QUERY_PROFILER_ENABLED", default=False)
+QUERY_PROFILER_ALLOW_HEADER = env.bool("QUERY_PROFILER_ALLOW_HEADER", default=DEBUG)
+QUERY_PROFILER_NPLUSONE_THRESHOLD = env.int("QUERY_PROFILER_NPLUSONE_THRESHOLD", default=3)
+QUERY_PROFILER_LOG_PATH = env("QUERY_PROFILER_LOG_PATH", default=str(BASE_DIR / "logs" / "query_profile.jsonl"))
+
+#------------------- 지표(Prometheus) -------------------#
+# /metrics 접근: Authorization: Bearer <METRICS_TOKEN> 이거나 REMOTE_ADDR가 METRICS_ALLOWED_IPS 안일 때만 허용
+# (둘 다 비어 있으면 모두 거부). 프록시 뒤에서는 REMOTE_ADDR가 프록시 주소이므로 토큰을 쓸 것.
+# gunicorn 워커 합산은 PROMETHEUS_MULTIPROC_DIR 환경 변수로
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+METRICS_ALLOWED_IPS = env.list("METRICS_ALLOWED_IPS", default=[])
+
+#------------------- 벤치마크 -------------------#
+# benchmark 명령 결과(JSON) 저장 위치. 커밋 간 비교는 --compare 로
+BENCHMARK_RESULTS_DIR = env("BENCHMARK_RESULTS_DIR", default=str(BASE_DIR.parent / "benchmarks"))
+
 #----------------------log설정-------------------------#
+# 로거는 큐에 넣기만 하고 파일/콘솔 쓰기는 백그라운드 스레드가 처리 (common/log.py)
+LOG_FORMAT = env("LOG_FORMAT", default="text")  # 파일 로그 형식: text / json
+LOG_QUEUE_SIZE = env.int("LOG_QUEUE_SIZE", default=10000)  # 가득 차면 대기하지 않고 버림
+# 로거별 샘플링 비율 (예: LOG_SAMPLE_RATES=accounts.audit=0.1,django.server=0.01). ERROR 이상은 항상 기록
+LOG_SAMPLE_RATES = env.dict("LOG_SAMPLE_RATES", cast={"value": float}, default={})
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -180,6 +242,15 @@ LOGGING = {
             "format": "%(asctime)s [%(levelname)s] %(name)s:%(lineno)d %(message)s",
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
+        "json": {
+            "()": "common.log.JsonFormatter",
+        },
+    },
+    "filters": {
+        "sampling": {
+            "()": "common.log.SamplingFilter",
+            "rates": LOG_SAMPLE_RATES,
+        },
     },
     "handlers": {
         "daily_file": {
@@ -189,26 +260,50 @@ LOGGING = {
             "interval": 1,
             "backupCount": 7,            # 7일치만 보관 (필요에 맞게 조절)
             "encoding": "utf-8",
-            "formatter": "verbose",
+            "formatter": "json" if LOG_FORMAT == "json" else "verbose",
         },
         "console": {
             "class": "logging.StreamHandler",
             "formatter": "verbose",
         },
+        # 이름순으로 구성되므로 대상 핸들러(console, daily_file)보다 뒤에 오는 이름이어야 함
+        "queued": {
+            "class": "common.log.QueueListenerHandler",
+            "targets": ["cfg://handlers.console", "cfg://handlers.daily_file"],
+            "maxsize": LOG_QUEUE_SIZE,
+            "filters": ["sampling"],
+        },
+        "profile_file": {
+            "class": "logging.FileHandler",
+            "filename": QUERY_PROFILER_LOG_PATH,
+            "encoding": "utf-8",
+            "delay": True,               # 프로파일러를 켰을 때만 파일 생성
+            "formatter": "json",
+        },
+        "queued_profile": {
+            "class": "common.log.QueueListenerHandler",
+            "targets": ["cfg://handlers.profile_file"],
+            "maxsize": LOG_QUEUE_SIZE,
+        },
     },
     "loggers": {
         "django": {
-            "handlers": ["daily_file", "console"],
+            "handlers": ["queued"],
             "level": "INFO",
             "propagate": False,
         },
         "accounts": {
-            "handlers": ["daily_file", "console"],
+            "handlers": ["queued"],
             "level": "DEBUG",
             "propagate": False,
         },
+        "common.profiling": {
+            "handlers": ["queued_profile"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "root": {
-            "handlers": ["daily_file", "console"],
+            "handlers": ["queued"],
             "level": "INFO",
         },
     },
@@ -234,16 +329,64 @@ EMAIL_HOST_USER = env("EMAIL_HOST_USER", default="")
 EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD", default="")
 EMAIL_USE_TLS = env.bool("EMAIL_USE_TLS", default=True)
 EMAIL_TIMEOUT = env.int("EMAIL_TIMEOUT", default=10)
+# 메일 큐: 요청에서는 OutboundEmail에 저장만 하고 send_queued_mail 워커가 발송
+MAIL_QUEUE_BATCH_SIZE = env.int("MAIL_QUEUE_BATCH_SIZE", default=50)
+MAIL_QUEUE_MAX_ATTEMPTS = env.int("MAIL_QUEUE_MAX_ATTEMPTS", default=5)
+MAIL_QUEUE_CLAIM_TIMEOUT = env.int("MAIL_QUEUE_CLAIM_TIMEOUT", default=300)
+# 발송 완료/실패 메일 보관 기간(일). send_queued_mail이 지난 행을 삭제 (본문은 발송 완료 시 바로 비움)
+MAIL_QUEUE_RETENTION_DAYS = env.int("MAIL_QUEUE_RETENTION_DAYS", default=7)
+
+#------------------- 알림 발송 -------------------#
+# dispatch_notifications 명령이 채널별 백엔드로 배치 발송
+NOTIFICATION_BACKENDS = {
+    "IN_APP": "notifications.backends.InAppBackend",
+    "EMAIL": "notifications.backends.EmailBackend",
+    "SMS": "notifications.backends.LogSmsBackend",
+}
+NOTIFICATION_BATCH_SIZE = env.int("NOTIFICATION_BATCH_SIZE", default=200)
+# 채널별 초당 발송 한도 (모든 워커 합산, 0이면 무제한)
+NOTIFICATION_RATE_LIMITS = {
+    "IN_APP": env.int("NOTIFICATION_IN_APP_RATE", default=0),
+    "EMAIL": env.int("NOTIFICATION_EMAIL_RATE", default=20),
+    "SMS": env.int("NOTIFICATION_SMS_RATE", default=5),
+}
+# PROCESSING 상태로 이 시간(초) 넘게 남은 알림은 워커 시작 시 PENDING으로 되돌림
+NOTIFICATION_CLAIM_TIMEOUT = env.int("NOTIFICATION_CLAIM_TIMEOUT", default=600)
+# compact_notifications 명령: 생성 후 N일이 지난 종료 알림을 일별 집계로 압축
+NOTIFICATION_RETENTION_DAYS = env.int("NOTIFICATION_RETENTION_DAYS", default=90)
+
+#------------------- 유출 비밀번호 확인 -------------------#
+# build_pwned_index 명령으로 만든 오프라인 인덱스가 있으면 API 없이 판정
+PWNED_INDEX_PATH = env("PWNED_INDEX_PATH", default="")
+PWNED_API_URL = env("PWNED_API_URL", default="https://api.pwnedpasswords.com/range/")
+PWNED_API_TIMEOUT = env.float("PWNED_API_TIMEOUT", default=2.0)
+PWNED_CACHE_DIR = env("PWNED_CACHE_DIR", default=os.path.join(tempfile.gettempdir(), "bijou-pwned"))
+PWNED_CACHE_TTL = env.int("PWNED_CACHE_TTL", default=60 * 60 * 24 * 7)  # 7일
 
 
 #------------------- 캐시 설정 -------------------#
+REDIS_URL = env("REDIS_URL", default="redis://127.0.0.1:6379/1")
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.redis.RedisCache",
-        "LOCATION": "redis://127.0.0.1:6379/1",
+        "LOCATION": REDIS_URL,
     }
 }
 
+#------------------- 세션(Redis) -------------------#
+# 요청당 Redis GET 1번으로 세션을 읽고, 값이 바뀐 경우에만 저장 (common/sessions.py)
+SESSION_ENGINE = "common.sessions"
+
+#------------------- 장바구니(Redis) -------------------#
+# 장바구니는 Redis 해시에서 읽고 쓰며, flush_carts 명령이 DB(Cart/CartItem)로 모아서 반영
+CART_REDIS_TTL = env.int("CART_REDIS_TTL", default=60 * 60 * 24 * 7)  # 7일
+CART_FLUSH_BATCH_SIZE = env.int("CART_FLUSH_BATCH_SIZE", default=200)
+CART_FLUSH_MAX_RETRIES = env.int("CART_FLUSH_MAX_RETRIES", default=10)  # 넘으면 cart:dead 셋으로 이동
+# gc_carts 명령: N일 동안 변경이 없는 장바구니 삭제 (비활성/세션 만료 장바구니는 기간과 무관하게 삭제)
+CART_GC_DAYS = env.int("CART_GC_DAYS", default=90)
+# 회원별 찜 상품 id 셋(wishlist:{user_id}) 유지 시간
+WISHLIST_CACHE_TTL = env.int("WISHLIST_CACHE_TTL", default=60 * 60 * 24)  # 1일
+
 #------------------- 검색 설정(Meilisearch) -------------------#
 MEILI_URL = env("MEILI_URL", default="")
 MEILI_API_KEY = env("MEILI_API_KEY", default="")
@@ -254,5 +397,14 @@ MEILI_PRODUCT_INDEX = env("MEILI_PRODUCT_INDEX", default="products")
 #------------------토스 결제--------------------#
 TOSS_CLIENT_KEY = env("TOSS_CLIENT_KEY", default="")
 TOSS_SECRET_KEY = env("TOSS_SECRET_KEY", default="")
+# 결제 승인 API 주소 (benchmark 명령은 로컬 대역 서버 주소로 바꿔 쓴다)
+TOSS_API_BASE = env("TOSS_API_BASE", default="https://api.tosspayments.com")
 TOSS_SUCCESS_URL = env("TOSS_SUCCESS_URL", default="http://127.0.0.1:8000/orders/success/")
 TOSS_FAIL_URL = env("TOSS_FAIL_URL", default="http://127.0.0.1:8000/orders/fail/")
+
+#------------------주문 보관--------------------#
+# 배송 완료/취소/환불 후 N개월이 지난 주문은 archive_orders 명령으로 보관 테이블로 이동
+ORDER_ARCHIVE_MONTHS = env.int("ORDER_ARCHIVE_MONTHS", default=6)
+# 주문번호 노드 번호(0~1023). 지정하지 않으면 Redis에서 비어 있는 번호를 임대하고(order:node:*),
+# Redis를 쓸 수 없을 때만 호스트명+PID 해시로 계산
+ORDER_NODE_ID = env.int("ORDER_NODE_ID", default=None)
@@ -1,12 +1,16 @@
 from django.contrib import admin
 from django.urls import path, include
 from catalog import views
+from common.metrics import metrics_view
 urlpatterns = [
     path('admin/', admin.site.urls),
     path("", views.home, name="home"),
     path("accounts/", include("accounts.urls", namespace="accounts")),
     path("products/", include("product.urls", namespace="product")),
     path("orders/", include("order.urls", namespace="order")),
+    path("cart/", include("cart.urls", namespace="cart")),
+    path("notifications/", include("notifications.urls", namespace="notifications")),
+    path("metrics", metrics_view, name="metrics"),
     # path("axes/", include("axes.urls"))
     
 ]
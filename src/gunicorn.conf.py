@@ -0,0 +1,20 @@
+# gunicorn 설정 (src에서 gunicorn config.wsgi 실행 시 자동으로 읽음)
+# 워커별 Prometheus 지표를 합산하려면 PROMETHEUS_MULTIPROC_DIR에 빈 디렉터리를 지정한다.
+import glob
+import os
+
+
+def on_starting(server):
+    # 이전 실행에서 남은 지표 파일 정리
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for path in glob.glob(os.path.join(directory, "*.db")):
+            os.remove(path)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
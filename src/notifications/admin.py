@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import Notification
+from .models import Notification, NotificationDailySummary
 
 
 @admin.register(Notification)
@@ -16,3 +16,16 @@ class NotificationAdmin(admin.ModelAdmin):
     )
     list_filter = ("notification_type", "channel", "status")
     search_fields = ("user__username", "user__email", "product__name")
+
+
+@admin.register(NotificationDailySummary)
+class NotificationDailySummaryAdmin(admin.ModelAdmin):
+    list_display = ("day", "notification_type", "channel", "status", "notification_count", "read_count")
+    list_filter = ("notification_type", "channel", "status")
+    date_hierarchy = "day"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class NotificationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'notifications'
+
+    def ready(self):
+        # 가격 인하/재입고 감지 후 찜한 회원에게 알림 생성
+        import notifications.signals  # noqa: F401
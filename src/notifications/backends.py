@@ -0,0 +1,96 @@
+"""채널별 알림 발송 백엔드
+
+send_batch(notifications)는 알림 id -> 오류 메시지(성공이면 "") 딕셔너리를 반환한다.
+채널과 백엔드 클래스의 매핑은 settings.NOTIFICATION_BACKENDS에서 바꿀 수 있다.
+"""
+import logging
+from typing import Dict, List
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils.module_loading import import_string
+
+from notifications import inbox
+from notifications.messages import render_message
+from notifications.models import Notification
+
+logger = logging.getLogger(__name__)
+
+
+class BaseBackend:
+    def send_batch(self, notifications: List[Notification]) -> Dict[int, str]:
+        raise NotImplementedError
+
+    def on_sent(self, notifications: List[Notification]):
+        """SENT 기록 후 호출 (성공한 알림만)"""
+
+
+class InAppBackend(BaseBackend):
+    """앱 알림은 SENT로 표시되는 것으로 전달 완료. 기록 후 알림함 카운터/실시간 채널 갱신"""
+
+    def send_batch(self, notifications):
+        return {notification.pk: "" for notification in notifications}
+
+    def on_sent(self, notifications):
+        inbox.push(notifications)
+
+
+class EmailBackend(BaseBackend):
+    """배치 전체를 SMTP 연결 하나로 발송"""
+
+    def send_batch(self, notifications):
+        results = {}
+        messages = []
+        for notification in notifications:
+            if not notification.user.email:
+                results[notification.pk] = "이메일 주소 없음"
+                continue
+            subject, body = render_message(notification)
+            messages.append(
+                (notification.pk, EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [notification.user.email]))
+            )
+        if not messages:
+            return results
+
+        connection = get_connection()
+        try:
+            connection.open()
+            sent = connection.send_messages([message for _, message in messages])
+        except Exception as exc:
+            logger.exception("알림 이메일 일괄 발송 실패: %d건", len(messages))
+            error = str(exc)[:255] or exc.__class__.__name__
+            results.update({pk: error for pk, _ in messages})
+            return results
+        finally:
+            connection.close()
+
+        if sent == len(messages):
+            results.update({pk: "" for pk, _ in messages})
+        else:
+            # 일부만 나간 경우 어느 메일인지 알 수 없으므로 전부 실패 처리 (중복 발송 방지)
+            results.update({pk: "일부 발송 실패" for pk, _ in messages})
+        return results
+
+
+class LogSmsBackend(BaseBackend):
+    """문자 발송 업체 연동 전까지 로그로만 남기는 백엔드"""
+
+    def send_batch(self, notifications):
+        results = {}
+        for notification in notifications:
+            if not notification.user.phone:
+                results[notification.pk] = "전화번호 없음"
+                continue
+            _, body = render_message(notification)
+            logger.info("SMS -> %s: %s", notification.user.phone, body)
+            results[notification.pk] = ""
+        return results
+
+
+_backends = {}
+
+
+def get_backend(channel: str) -> BaseBackend:
+    if channel not in _backends:
+        _backends[channel] = import_string(settings.NOTIFICATION_BACKENDS[channel])()
+    return _backends[channel]
@@ -0,0 +1,15 @@
+from django.utils.functional import SimpleLazyObject
+
+from notifications.inbox import unread_count
+
+
+def unread_badge(request):
+    """헤더 알림 배지. 템플릿에서 쓸 때만 Redis 카운터를 읽는다"""
+    user = getattr(request, "user", None)
+    if user is None:
+        return {}
+    return {
+        "unread_notifications": SimpleLazyObject(
+            lambda: unread_count(user.pk) if user.is_authenticated else 0
+        )
+    }
@@ -0,0 +1,135 @@
+"""알림 발송 워커
+
+1) 채널별로 남은 초당 발송 한도만큼 PENDING 알림을 SELECT ... FOR UPDATE SKIP LOCKED로
+   골라 PROCESSING으로 바꾸고 커밋한다 (다른 워커는 잠긴 행을 건너뛰므로 중복 발송 없음).
+2) 트랜잭션 밖에서 채널 백엔드로 배치 발송한다.
+3) 결과를 성공/실패별 일괄 UPDATE로 기록한다.
+워커가 발송 중에 죽으면 PROCESSING으로 남은 알림은 일정 시간 후 PENDING으로 되돌린다.
+"""
+import logging
+import time
+from collections import Counter
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from notifications.backends import get_backend
+from notifications.models import Notification
+
+logger = logging.getLogger(__name__)
+
+Status = Notification.Status
+
+
+#------------------- 채널별 발송 한도 -------------------#
+
+def acquire_quota(channel: str, wanted: int) -> int:
+    """현재 1초 구간에서 채널에 남은 발송 한도 중 최대 wanted건을 예약하고 예약한 건수 반환
+
+    카운터를 공유 캐시(Redis)에 두므로 워커 프로세스가 여러 개여도 합산 한도가 지켜진다.
+    """
+    limit = settings.NOTIFICATION_RATE_LIMITS.get(channel)
+    if not limit:
+        return wanted
+    key = f"notif:rate:{channel}:{int(time.time())}"
+    cache.add(key, 0, timeout=5)
+    used = cache.incr(key, wanted)
+    return max(0, min(wanted, limit - (used - wanted)))
+
+
+#------------------- 선점/발송/기록 -------------------#
+
+def _due_filter(now) -> Q:
+    return Q(status=Status.PENDING) & (Q(scheduled_for__lte=now) | Q(scheduled_for__isnull=True))
+
+
+def claim(channel: str, limit: int) -> List[int]:
+    """발송할 알림을 선점해 PROCESSING으로 바꾸고 id 목록 반환"""
+    now = timezone.now()
+    with transaction.atomic():
+        queryset = (
+            Notification.objects.filter(_due_filter(now), channel=channel)
+            .order_by("scheduled_for", "id")
+        )
+        if connection.features.has_select_for_update_skip_locked:
+            queryset = queryset.select_for_update(skip_locked=True)
+        ids = list(queryset.values_list("id", flat=True)[:limit])
+        if ids:
+            Notification.objects.filter(pk__in=ids).update(status=Status.PROCESSING, updated_at=now)
+    return ids
+
+
+def _record_results(results: Dict[int, str]):
+    now = timezone.now()
+    sent_ids = [pk for pk, error in results.items() if not error]
+    if sent_ids:
+        Notification.objects.filter(pk__in=sent_ids, status=Status.PROCESSING).update(
+            status=Status.SENT, sent_at=now, error_message="", updated_at=now
+        )
+    failed = [
+        Notification(pk=pk, status=Status.FAILED, error_message=error[:255], updated_at=now)
+        for pk, error in results.items()
+        if error
+    ]
+    if failed:
+        Notification.objects.bulk_update(failed, ["status", "error_message", "updated_at"], batch_size=500)
+
+
+def dispatch_channel(channel: str, batch_size: int) -> Counter:
+    report = Counter()
+    allowed = acquire_quota(channel, batch_size)
+    if not allowed:
+        report["throttled"] += 1
+        return report
+    ids = claim(channel, allowed)
+    if not ids:
+        return report
+    notifications = list(
+        Notification.objects.filter(pk__in=ids)
+        .select_related("user", "product")
+        .order_by("id")
+    )
+    backend = get_backend(channel)
+    try:
+        results = backend.send_batch(notifications)
+    except Exception as exc:
+        logger.exception("알림 발송 실패: channel=%s count=%d", channel, len(ids))
+        results = {pk: str(exc)[:255] or exc.__class__.__name__ for pk in ids}
+    # 백엔드가 결과를 돌려주지 않은 알림은 실패로 기록
+    for pk in ids:
+        results.setdefault(pk, "발송 결과 없음")
+    _record_results(results)
+    sent_notifications = [notification for notification in notifications if not results[notification.pk]]
+    if sent_notifications:
+        try:
+            backend.on_sent(sent_notifications)
+        except Exception:
+            # 발송 자체는 끝났으므로 후처리 실패는 기록만 한다
+            logger.exception("알림 발송 후처리 실패: channel=%s", channel)
+    sent = len(sent_notifications)
+    report.update(sent=sent, failed=len(results) - sent)
+    return +report # 0건 항목 제거
+
+
+def dispatch_once(channels: Optional[Iterable[str]] = None, batch_size: Optional[int] = None) -> Counter:
+    """채널별로 한 배치씩 발송하고 채널/결과별 건수 반환"""
+    batch_size = batch_size or settings.NOTIFICATION_BATCH_SIZE
+    report = Counter()
+    for channel in channels or Notification.Channel.values:
+        for key, value in dispatch_channel(channel, batch_size).items():
+            report[f"{channel}:{key}"] += value
+    return report
+
+
+def release_stale(timeout: Optional[int] = None) -> int:
+    """PROCESSING 상태로 오래 남은 알림(워커 비정상 종료)을 PENDING으로 되돌림"""
+    timeout = timeout or settings.NOTIFICATION_CLAIM_TIMEOUT
+    cutoff = timezone.now() - timedelta(seconds=timeout)
+    return Notification.objects.filter(status=Status.PROCESSING, updated_at__lt=cutoff).update(
+        status=Status.PENDING, updated_at=timezone.now()
+    )
@@ -0,0 +1,229 @@
+"""찜 기반 가격 인하/재입고 알림 생성
+
+상품 한 개당 WishlistItem(product) 인덱스 + Wishlist PK 조인 쿼리 1번으로 대상 회원 id를
+스트리밍하고, PENDING 알림을 chunk 단위 bulk_create로 넣는다. 회원별 루프에서
+쿼리를 날리지 않으므로 인기 상품(찜 10만 명)도 몇 초 안에 끝난다.
+실제 발송은 알림 발송 워커가 처리한다.
+
+상품 저장 요청(관리자 화면 등)에서는 enqueue_price_drop/enqueue_restock로 Redis 리스트
+notif:fanout에 작업만 넣고, dispatch_notifications 워커가 run_queued()로 꺼내 생성한다.
+"""
+import json
+import logging
+import uuid
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from cart.models import WishlistItem
+from common.redis_client import get_redis
+from notifications.models import Notification
+from product.models import Product
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 2000
+FANOUT_QUEUE = "notif:fanout"
+MAX_JOB_ATTEMPTS = 3
+
+# 같은 상품으로 아직 발송이 끝나지 않은(발송 중 포함) 알림이 있으면 새로 만들지 않는다
+UNSENT_STATUSES = (
+    Notification.Status.PENDING,
+    Notification.Status.SCHEDULED,
+    Notification.Status.PROCESSING,
+)
+# 큐 작업 id를 extra_payload에 남겨 같은 작업을 다시 실행해도 이미 만든 회원은 건너뛴다
+JOB_ID_FIELD = "fanout_job"
+
+
+def _chunks(values: Iterable[int], size: int) -> Iterator[List[int]]:
+    chunk = []
+    for value in values:
+        chunk.append(value)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _target_user_ids(
+    product_id: int,
+    notification_type: str,
+    option_id: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    job_id: Optional[str] = None,
+) -> Iterator[int]:
+    items = WishlistItem.objects.filter(product_id=product_id)
+    if option_id:
+        # 해당 옵션을 찜했거나 옵션 없이 상품을 찜한 회원
+        items = items.filter(Q(product_option_id=option_id) | Q(product_option__isnull=True))
+    already = Q(status__in=UNSENT_STATUSES)
+    if job_id:
+        # 같은 작업으로 만든 알림은 상태와 상관없이 (재시도 시 이미 발송된 회원 포함)
+        already |= Q(**{f"extra_payload__{JOB_ID_FIELD}": job_id})
+    pending = Notification.objects.filter(
+        already,
+        user_id=OuterRef("wishlist__user_id"),
+        product_id=product_id,
+        notification_type=notification_type,
+    )
+    return (
+        items.filter(~Exists(pending))
+        .order_by()
+        .values_list("wishlist__user_id", flat=True)
+        .distinct()
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def fan_out(
+    product_id: int,
+    notification_type: str,
+    payload: Dict,
+    option_id: Optional[int] = None,
+    chunk_size: int = CHUNK_SIZE,
+    job_id: Optional[str] = None,
+) -> int:
+    """찜한 회원들에게 PENDING 알림 생성. 생성한 알림 수 반환"""
+    now = timezone.now()
+    created = 0
+    if job_id:
+        payload = {**payload, JOB_ID_FIELD: job_id}
+    user_ids = _target_user_ids(product_id, notification_type, option_id, chunk_size, job_id)
+    for chunk in _chunks(user_ids, chunk_size):
+        Notification.objects.bulk_create(
+            [
+                Notification(
+                    user_id=user_id,
+                    notification_type=notification_type,
+                    product_id=product_id,
+                    product_option_id=option_id,
+                    status=Notification.Status.PENDING,
+                    scheduled_for=now,
+                    extra_payload=payload,
+                )
+                for user_id in chunk
+            ],
+            batch_size=chunk_size,
+        )
+        created += len(chunk)
+    logger.info(
+        "찜 알림 생성: type=%s product=%s option=%s count=%d",
+        notification_type,
+        product_id,
+        option_id,
+        created,
+    )
+    return created
+
+
+def notify_price_drop(
+    product_id: int, product_name: str, old_price: Decimal, new_price: Decimal, job_id: Optional[str] = None
+) -> int:
+    return fan_out(
+        product_id,
+        Notification.NotificationType.PRICE_DROP,
+        {
+            "product_name": product_name,
+            "old_price": str(old_price),
+            "new_price": str(new_price),
+        },
+        job_id=job_id,
+    )
+
+
+def notify_restock(
+    product_id: int,
+    option_id: int,
+    product_name: str,
+    option_label: str,
+    stock: int,
+    job_id: Optional[str] = None,
+) -> int:
+    return fan_out(
+        product_id,
+        Notification.NotificationType.RESTOCK,
+        {
+            "product_name": product_name,
+            "option": option_label,
+            "stock": stock,
+        },
+        option_id=option_id,
+        job_id=job_id,
+    )
+
+
+#------------------- 작업 큐 -------------------#
+
+def _enqueue(kind: str, **params):
+    job = {"id": uuid.uuid4().hex, "kind": kind, "params": params, "attempts": 0}
+    get_redis().rpush(FANOUT_QUEUE, json.dumps(job))
+
+
+def enqueue_price_drop(product_id: int, product_name: str, old_price: Decimal, new_price: Decimal):
+    _enqueue(
+        Notification.NotificationType.PRICE_DROP,
+        product_id=product_id,
+        product_name=product_name,
+        old_price=str(old_price),
+        new_price=str(new_price),
+    )
+
+
+def enqueue_restock(product_id: int, option_id: int, option_label: str, stock: int):
+    # 상품명은 워커에서 조회한다 (저장 요청에서 쿼리를 늘리지 않도록)
+    _enqueue(
+        Notification.NotificationType.RESTOCK,
+        product_id=product_id,
+        option_id=option_id,
+        option_label=option_label,
+        stock=stock,
+    )
+
+
+def _run_job(job: Dict) -> int:
+    params = job["params"]
+    if job["kind"] == Notification.NotificationType.PRICE_DROP:
+        return notify_price_drop(
+            params["product_id"],
+            params["product_name"],
+            Decimal(params["old_price"]),
+            Decimal(params["new_price"]),
+            job_id=job.get("id"),
+        )
+    product_name = (
+        Product.objects.filter(pk=params["product_id"]).values_list("name", flat=True).first() or ""
+    )
+    return notify_restock(
+        params["product_id"],
+        params["option_id"],
+        product_name,
+        params["option_label"],
+        params["stock"],
+        job_id=job.get("id"),
+    )
+
+
+def run_queued(limit: int = 100) -> int:
+    """큐에 쌓인 알림 생성 작업을 최대 limit개 실행하고 실행한 작업 수 반환
+
+    실패한 작업은 MAX_JOB_ATTEMPTS번까지 큐 뒤에 다시 넣는다. 다시 실행하면 같은 작업 id로
+    이미 알림을 만든 회원은 (발송 여부와 상관없이) 건너뛰므로 중복 알림이 생기지 않는다.
+    """
+    client = get_redis()
+    raw_jobs = client.lpop(FANOUT_QUEUE, limit) or []
+    for raw in raw_jobs:
+        job = json.loads(raw)
+        try:
+            _run_job(job)
+        except Exception:
+            job["attempts"] += 1
+            if job["attempts"] < MAX_JOB_ATTEMPTS:
+                logger.exception("찜 알림 생성 실패, 다시 시도: %s", job)
+                client.rpush(FANOUT_QUEUE, json.dumps(job))
+            else:
+                logger.exception("찜 알림 생성 최종 실패: %s", job)
+    return len(raw_jobs)
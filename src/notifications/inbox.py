@@ -0,0 +1,170 @@
+"""앱 알림함
+
+회원별로 Redis에 두 가지를 유지한다.
+  notif:unread:{user_id}  읽지 않은 앱 알림 수 (헤더 배지)
+  notif:recent:{user_id}  최근 알림 JSON 리스트 (최대 RECENT_SIZE개)
+키가 없을 때만 DB에서 한 번 계산해 채우고, 이후에는 발송/읽음 처리 때 Redis만 갱신하므로
+배지 표시에 MySQL 조회가 들지 않는다. 새 알림은 notif:events:{user_id} 채널로도 발행해
+SSE 스트림으로 실시간 전달한다.
+"""
+import json
+from typing import Dict, Iterable, List, Optional
+
+from django.utils import timezone
+
+from common import metrics
+from common.redis_client import get_redis
+from notifications.messages import render_message
+from notifications.models import Notification
+
+RECENT_SIZE = 20
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 50
+CACHE_TTL = 60 * 60 * 24 * 7 # 7일
+
+# 키가 이미 있을 때만 갱신 (없으면 다음 조회 때 DB에서 정확한 값으로 채움)
+_PUSH_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('INCRBY', KEYS[1], ARGV[1])
+end
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    for i = 3, #ARGV do
+        redis.call('LPUSH', KEYS[2], ARGV[i])
+    end
+    redis.call('LTRIM', KEYS[2], 0, tonumber(ARGV[2]) - 1)
+end
+return 1
+"""
+_DECR_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    local value = redis.call('DECRBY', KEYS[1], ARGV[1])
+    if value < 0 then
+        redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+    end
+end
+return 1
+"""
+_scripts = {}
+
+
+def _script(name: str, source: str):
+    if name not in _scripts:
+        _scripts[name] = get_redis().register_script(source)
+    return _scripts[name]
+
+
+def unread_key(user_id: int) -> str:
+    return f"notif:unread:{user_id}"
+
+
+def recent_key(user_id: int) -> str:
+    return f"notif:recent:{user_id}"
+
+
+def events_channel(user_id: int) -> str:
+    return f"notif:events:{user_id}"
+
+
+def _inbox_queryset(user_id: int):
+    return Notification.objects.filter(
+        user_id=user_id,
+        channel=Notification.Channel.IN_APP,
+        status=Notification.Status.SENT,
+    )
+
+
+def serialize(notification: Notification) -> Dict:
+    title, body = render_message(notification)
+    return {
+        "id": notification.pk,
+        "type": notification.notification_type,
+        "title": title,
+        "body": body,
+        "product_id": notification.product_id,
+        "sent_at": notification.sent_at.isoformat() if notification.sent_at else None,
+        "read": notification.read_at is not None,
+    }
+
+
+#------------------- 발송 시 -------------------#
+
+def push(notifications: Iterable[Notification]):
+    """발송된 앱 알림을 회원별 카운터/최근 목록에 반영하고 실시간 채널로 발행"""
+    by_user: Dict[int, List[str]] = {}
+    now = timezone.now()
+    for notification in notifications:
+        notification.sent_at = notification.sent_at or now
+        by_user.setdefault(notification.user_id, []).append(json.dumps(serialize(notification), ensure_ascii=False))
+    if not by_user:
+        return
+    script = _script("push", _PUSH_SCRIPT)
+    pipe = get_redis().pipeline()
+    for user_id, items in by_user.items():
+        script(keys=[unread_key(user_id), recent_key(user_id)], args=[len(items), RECENT_SIZE, *items], client=pipe)
+        for item in items:
+            pipe.publish(events_channel(user_id), item)
+    pipe.execute()
+
+
+#------------------- 조회 -------------------#
+
+def unread_count(user_id: int) -> int:
+    client = get_redis()
+    cached = client.get(unread_key(user_id))
+    metrics.cache_result("notification_unread", cached is not None)
+    if cached is not None:
+        return int(cached)
+    count = _inbox_queryset(user_id).filter(read_at__isnull=True).count()
+    # 그 사이 push로 생긴 키는 덮어쓰지 않는다
+    client.set(unread_key(user_id), count, ex=CACHE_TTL, nx=True)
+    return count
+
+
+def recent(user_id: int) -> List[Dict]:
+    client = get_redis()
+    key = recent_key(user_id)
+    pipe = client.pipeline()
+    pipe.exists(key)
+    pipe.lrange(key, 0, RECENT_SIZE - 1)
+    loaded, raw = pipe.execute()
+    if loaded:
+        return [json.loads(item) for item in raw]
+    items = [serialize(n) for n in _inbox_queryset(user_id).order_by("-id")[:RECENT_SIZE]]
+    if items:
+        pipe = client.pipeline()
+        pipe.delete(key)
+        pipe.rpush(key, *[json.dumps(item, ensure_ascii=False) for item in items])
+        pipe.expire(key, CACHE_TTL)
+        pipe.execute()
+    return items
+
+
+def fetch_page(user_id: int, cursor: Optional[int] = None, limit: int = PAGE_SIZE) -> Dict:
+    """알림함 한 페이지 (id 내림차순 키셋)"""
+    queryset = _inbox_queryset(user_id)
+    if cursor:
+        queryset = queryset.filter(id__lt=cursor)
+    rows = list(queryset.select_related("product").order_by("-id")[: limit + 1])
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "notifications": [serialize(row) for row in rows],
+        "next_cursor": rows[-1].pk if has_next else None,
+        "unread_count": unread_count(user_id),
+    }
+
+
+#------------------- 읽음 처리 -------------------#
+
+def mark_read(user_id: int, ids: Optional[Iterable[int]] = None) -> int:
+    """지정한 알림(없으면 전체)을 읽음 처리하고 처리한 수 반환"""
+    queryset = _inbox_queryset(user_id).filter(read_at__isnull=True)
+    if ids is not None:
+        queryset = queryset.filter(pk__in=list(ids))
+    updated = queryset.update(read_at=timezone.now())
+    if updated:
+        client = get_redis()
+        _script("decr", _DECR_SCRIPT)(keys=[unread_key(user_id)], args=[updated])
+        # 최근 목록의 읽음 표시는 다음 조회 때 DB에서 다시 만든다
+        client.delete(recent_key(user_id))
+    return updated
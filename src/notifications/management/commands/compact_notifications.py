@@ -0,0 +1,38 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from notifications.retention import compact
+
+
+class Command(BaseCommand):
+    help = "보존 기간이 지난 종료 알림을 일별 집계로 압축하고 원본 삭제"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.NOTIFICATION_RETENTION_DAYS,
+            help="생성 후 N일이 지난 알림을 압축 (기본 NOTIFICATION_RETENTION_DAYS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 트랜잭션에서 처리할 알림 수(기본 1000)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="삭제하지 않고 대상 알림 수만 출력",
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        count = compact(cutoff, batch_size=options["batch_size"], dry_run=options["dry_run"])
+        if options["dry_run"]:
+            self.stdout.write(f"압축 대상 알림: {count}건 (기준 {cutoff:%Y-%m-%d})")
+            return
+        self.stdout.write(self.style.SUCCESS(f"알림 {count}건 압축 완료 (기준 {cutoff:%Y-%m-%d})"))
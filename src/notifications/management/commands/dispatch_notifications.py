@@ -0,0 +1,64 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from notifications.dispatch import dispatch_once, release_stale
+from notifications.fanout import run_queued
+from notifications.models import Notification
+
+
+class Command(BaseCommand):
+    help = (
+        "찜 알림 생성 작업(notif:fanout)을 처리하고 대기 중인 알림을 채널별로 배치 발송 "
+        "(여러 프로세스로 동시 실행 가능)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.NOTIFICATION_BATCH_SIZE,
+            help="채널별로 한 번에 선점할 알림 수(기본 NOTIFICATION_BATCH_SIZE)",
+        )
+        parser.add_argument(
+            "--channel",
+            action="append",
+            choices=Notification.Channel.values,
+            help="발송할 채널 (여러 번 지정 가능, 기본 전체)",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="종료하지 않고 주기적으로 발송",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="--loop 시 보낼 알림이 없을 때 대기 간격(초, 기본 1)",
+        )
+
+    def handle(self, *args, **options):
+        released_at = 0.0
+        while True:
+            if time.monotonic() - released_at > 60:
+                released = release_stale()
+                released_at = time.monotonic()
+                if released:
+                    self.stdout.write(f"멈춘 알림 {released}건을 대기 상태로 되돌림")
+
+            jobs = run_queued()
+            if jobs:
+                self.stdout.write(f"찜 알림 생성 작업 {jobs}건 처리")
+            report = dispatch_once(options["channel"], options["batch_size"])
+            processed = {key: value for key, value in report.items() if not key.endswith(":throttled")}
+            if processed:
+                self.stdout.write(", ".join(f"{key} {value}" for key, value in sorted(processed.items())))
+            if not options["loop"]:
+                break
+            if len(processed) < len(report):
+                # 한도에 걸린 채널이 있으면 다음 1초 구간까지 잠시 대기
+                time.sleep(0.2)
+            elif not processed and not jobs:
+                time.sleep(options["interval"])
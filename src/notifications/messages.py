@@ -0,0 +1,27 @@
+from typing import Tuple
+
+from notifications.models import Notification
+
+
+def render_message(notification: Notification) -> Tuple[str, str]:
+    """알림 종류별 제목/본문"""
+    payload = notification.extra_payload or {}
+    product_name = payload.get("product_name") or (
+        notification.product.name if notification.product_id else ""
+    )
+    Type = Notification.NotificationType
+    if notification.notification_type == Type.PRICE_DROP:
+        return (
+            f"[Bijou] 찜한 상품 가격이 내려갔어요: {product_name}",
+            f"{product_name} 가격이 {payload.get('old_price')}원에서 {payload.get('new_price')}원으로 내려갔습니다.",
+        )
+    if notification.notification_type == Type.RESTOCK:
+        option = f" ({payload['option']})" if payload.get("option") else ""
+        return (
+            f"[Bijou] 찜한 상품이 재입고되었어요: {product_name}",
+            f"{product_name}{option} 상품이 다시 입고되었습니다.",
+        )
+    return (
+        payload.get("title") or "[Bijou] 새 소식",
+        payload.get("body") or product_name,
+    )
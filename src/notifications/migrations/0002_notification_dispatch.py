@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:47
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+        ('product', '0002_product_review_count_product_sales_count_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='status',
+            field=models.CharField(choices=[('PENDING', '대기'), ('SCHEDULED', '예약됨'), ('PROCESSING', '발송 중'), ('SENT', '발송 완료'), ('CANCELED', '취소'), ('FAILED', '실패')], default='PENDING', max_length=12),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['status', 'scheduled_for'], name='notif_status_sched_idx'),
+        ),
+    ]
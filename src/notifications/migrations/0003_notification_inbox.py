@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_notification_dispatch'),
+        ('product', '0002_product_review_count_product_sales_count_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='read_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'channel', 'status', 'id'], name='notif_inbox_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_notification_inbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationDailySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('notification_type', models.CharField(choices=[('RESTOCK', '재입고 알림'), ('PRICE_DROP', '가격 변동 알림'), ('PROMOTION', '프로모션 알림')], max_length=20)),
+                ('channel', models.CharField(choices=[('IN_APP', '앱 알림'), ('EMAIL', '이메일'), ('SMS', '문자')], max_length=10)),
+                ('status', models.CharField(choices=[('PENDING', '대기'), ('SCHEDULED', '예약됨'), ('PROCESSING', '발송 중'), ('SENT', '발송 완료'), ('CANCELED', '취소'), ('FAILED', '실패')], max_length=12)),
+                ('notification_count', models.IntegerField(default=0)),
+                ('read_count', models.IntegerField(default=0)),
+            ],
+            options={
+                'ordering': ['-day', 'notification_type', 'channel', 'status'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'notification_type', 'channel', 'status'), name='notif_summary_unique_day')],
+            },
+        ),
+    ]
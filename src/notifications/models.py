@@ -15,6 +15,7 @@ class Notification(TimeStampedModel):
     class Status(models.TextChoices): #알람처리
         PENDING = "PENDING", "대기"
         SCHEDULED = "SCHEDULED", "예약됨"
+        PROCESSING = "PROCESSING", "발송 중"
         SENT = "SENT", "발송 완료"
         CANCELED = "CANCELED", "취소"
         FAILED = "FAILED", "실패"
@@ -59,6 +60,7 @@ class Notification(TimeStampedModel):
     )
     scheduled_for = models.DateTimeField(null=True, blank=True)
     sent_at = models.DateTimeField(null=True, blank=True)
+    read_at = models.DateTimeField(null=True, blank=True)
     error_message = models.CharField(max_length=255, blank=True)
     extra_payload = models.JSONField(blank=True, default=dict)
 
@@ -67,8 +69,38 @@ class Notification(TimeStampedModel):
             models.Index(fields=["user", "status"]),
             models.Index(fields=["notification_type", "status"]),
             models.Index(fields=["scheduled_for"]),
+            # 발송 워커가 대기 알림을 예약 시각 순으로 가져갈 때 사용
+            models.Index(fields=["status", "scheduled_for"], name="notif_status_sched_idx"),
+            # 알림함: 회원의 앱 알림을 최신순 키셋 페이지로 조회
+            models.Index(fields=["user", "channel", "status", "id"], name="notif_inbox_idx"),
         ]
         ordering = ["-created_at"]
 
     def __str__(self) -> str:
         return f"{self.get_notification_type_display()} -> {self.user}"
+
+
+class NotificationDailySummary(models.Model):
+    """보존 기간이 지난 알림의 일별(생성일, 현지 날짜) 종류·채널·상태별 집계
+
+    compact_notifications 명령이 원본 알림을 지우면서 이 행에 건수를 더한다.
+    """
+
+    day = models.DateField()
+    notification_type = models.CharField(max_length=20, choices=Notification.NotificationType.choices)
+    channel = models.CharField(max_length=10, choices=Notification.Channel.choices)
+    status = models.CharField(max_length=12, choices=Notification.Status.choices)
+    notification_count = models.IntegerField(default=0)
+    read_count = models.IntegerField(default=0)
+
+    class Meta:
+        ordering = ["-day", "notification_type", "channel", "status"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "notification_type", "channel", "status"],
+                name="notif_summary_unique_day",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.day} {self.notification_type}/{self.channel}/{self.status}: {self.notification_count}"
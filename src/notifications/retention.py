@@ -0,0 +1,94 @@
+"""알림 보존/압축
+
+보존 기간이 지난 종료 상태(SENT/CANCELED/FAILED) 알림을 일별 집계 행에 더한 뒤
+id 키셋 배치로 삭제해 Notification 테이블 크기를 일정하게 유지한다.
+"""
+import logging
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from common.redis_client import get_redis
+from notifications import inbox
+from notifications.models import Notification, NotificationDailySummary
+
+logger = logging.getLogger(__name__)
+
+Status = Notification.Status
+CLOSED_STATUSES = (Status.SENT, Status.CANCELED, Status.FAILED)
+
+SummaryKey = Tuple[date, str, str, str]
+
+
+def _add_summary(key: SummaryKey, count: int, read_count: int):
+    # 집계 행이 있으면 증분 UPDATE, 없으면 생성 (동시 생성 충돌 시 UPDATE 재시도)
+    day, notification_type, channel, status = key
+    lookup = dict(day=day, notification_type=notification_type, channel=channel, status=status)
+    increments = dict(
+        notification_count=F("notification_count") + count,
+        read_count=F("read_count") + read_count,
+    )
+    if NotificationDailySummary.objects.filter(**lookup).update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            NotificationDailySummary.objects.create(notification_count=count, read_count=read_count, **lookup)
+    except IntegrityError:
+        NotificationDailySummary.objects.filter(**lookup).update(**increments)
+
+
+def compact(cutoff: datetime, *, batch_size: int = 1000, dry_run: bool = False) -> int:
+    """cutoff 이전에 생성된 종료 알림을 집계 후 삭제하고 삭제한 수를 반환"""
+    base = Notification.objects.filter(status__in=CLOSED_STATUSES, created_at__lt=cutoff)
+    if dry_run:
+        return base.count()
+
+    deleted = 0
+    last_id = 0
+    while True:
+        rows = list(
+            base.filter(pk__gt=last_id)
+            .order_by("pk")
+            .values("id", "user_id", "notification_type", "channel", "status", "created_at", "read_at")[:batch_size]
+        )
+        if not rows:
+            break
+        last_id = rows[-1]["id"]
+        deleted += _compact_batch(rows)
+        logger.info("알림 압축 진행: %d건 (last_id=%d)", deleted, last_id)
+    return deleted
+
+
+def _compact_batch(rows) -> int:
+    counts: Dict[SummaryKey, int] = Counter()
+    reads: Dict[SummaryKey, int] = Counter()
+    unread_users = set()
+    for row in rows:
+        key = (
+            timezone.localdate(row["created_at"]),
+            row["notification_type"],
+            row["channel"],
+            row["status"],
+        )
+        counts[key] += 1
+        if row["read_at"]:
+            reads[key] += 1
+        elif row["channel"] == Notification.Channel.IN_APP and row["status"] == Status.SENT:
+            unread_users.add(row["user_id"])
+
+    with transaction.atomic():
+        for key, count in counts.items():
+            _add_summary(key, count, reads[key])
+        Notification.objects.filter(pk__in=[row["id"] for row in rows]).delete()
+
+    if unread_users:
+        # 읽지 않은 알림이 지워진 회원은 알림함 캐시를 다시 계산하게 한다
+        get_redis().delete(
+            *[inbox.unread_key(user_id) for user_id in unread_users],
+            *[inbox.recent_key(user_id) for user_id in unread_users],
+        )
+    return len(rows)
@@ -0,0 +1,90 @@
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_init, post_save, pre_save
+from django.dispatch import receiver
+
+from notifications.fanout import enqueue_price_drop, enqueue_restock
+from product.models import Product, ProductOption
+
+logger = logging.getLogger(__name__)
+
+PRICE_FIELDS = {"price", "discount_price"}
+
+
+def _tracks(update_fields, fields) -> bool:
+    return update_fields is None or bool(fields.intersection(update_fields))
+
+
+def _on_commit_enqueue(func, *args):
+    def enqueue():
+        # 큐(Redis) 장애로 이미 커밋된 상품 저장 요청이 실패하지 않도록 기록만 한다
+        try:
+            func(*args)
+        except Exception:
+            logger.exception("찜 알림 작업 등록 실패: %s%s", func.__name__, args)
+
+    transaction.on_commit(enqueue)
+
+
+# 읽어 온 값을 기억해 두었다가 저장 후 비교 (가격 인하 / 품절 -> 재입고).
+# 조회 시점 값을 쓰므로 저장 전에 SELECT를 다시 하지 않는다. 값이 지연 로딩(defer/only)이라
+# 기억하지 못한 경우에만 pre_save에서 DB를 읽는다.
+@receiver(post_init, sender=Product)
+def snapshot_product_price(sender, instance, **kwargs):
+    values = instance.__dict__
+    instance._sale_price_loaded = None
+    if instance.pk and "price" in values and "discount_price" in values:
+        instance._sale_price_loaded = instance.sale_price
+
+
+@receiver(pre_save, sender=Product)
+def remember_product_price(sender, instance, update_fields=None, **kwargs):
+    instance._sale_price_before = None
+    if not instance.pk or not _tracks(update_fields, PRICE_FIELDS):
+        return
+    instance._sale_price_before = getattr(instance, "_sale_price_loaded", None)
+    if instance._sale_price_before is None:
+        instance._sale_price_before = (
+            Product.objects.filter(pk=instance.pk)
+            .values_list(Product.sale_price_expression(), flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Product)
+def detect_price_drop(sender, instance, created, update_fields=None, **kwargs):
+    old_price = getattr(instance, "_sale_price_before", None)
+    new_price = instance.sale_price
+    if _tracks(update_fields, PRICE_FIELDS):
+        instance._sale_price_loaded = new_price  # 같은 인스턴스를 다시 저장할 때의 기준값
+    if created or old_price is None or not instance.is_active or new_price >= old_price:
+        return
+    _on_commit_enqueue(enqueue_price_drop, instance.pk, instance.name, old_price, new_price)
+
+
+@receiver(post_init, sender=ProductOption)
+def snapshot_option_stock(sender, instance, **kwargs):
+    instance._stock_loaded = instance.__dict__.get("stock") if instance.pk else None
+
+
+@receiver(pre_save, sender=ProductOption)
+def remember_option_stock(sender, instance, update_fields=None, **kwargs):
+    instance._stock_before = None
+    if not instance.pk or not _tracks(update_fields, {"stock"}):
+        return
+    instance._stock_before = getattr(instance, "_stock_loaded", None)
+    if instance._stock_before is None:
+        instance._stock_before = (
+            ProductOption.objects.filter(pk=instance.pk).values_list("stock", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=ProductOption)
+def detect_restock(sender, instance, created, update_fields=None, **kwargs):
+    if _tracks(update_fields, {"stock"}):
+        instance._stock_loaded = instance.stock
+    if created or getattr(instance, "_stock_before", None) != 0 or instance.stock <= 0 or not instance.is_active:
+        return
+    label = ", ".join(filter(None, [instance.color, instance.size]))
+    _on_commit_enqueue(enqueue_restock, instance.product_id, instance.pk, label, instance.stock)
@@ -0,0 +1,12 @@
+from django.urls import path
+
+from notifications.views import InboxReadView, InboxRecentView, InboxView, inbox_stream
+
+app_name = "notifications"
+
+urlpatterns = [
+    path("", InboxView.as_view(), name="inbox"),
+    path("recent/", InboxRecentView.as_view(), name="recent"),
+    path("read/", InboxReadView.as_view(), name="read"),
+    path("stream/", inbox_stream, name="stream"),
+]
@@ -1,3 +1,82 @@
-from django.shortcuts import render
+import json
+import time
 
-# Create your views here.
+from asgiref.sync import sync_to_async
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import HttpResponseBadRequest, JsonResponse, StreamingHttpResponse
+from django.views import View
+
+from common.redis_client import new_async_redis
+from notifications import inbox
+
+STREAM_LIFETIME = 60 * 5 # 연결 유지 최대 시간(초). 이후 브라우저 EventSource가 재접속
+HEARTBEAT_INTERVAL = 15
+
+
+class InboxView(LoginRequiredMixin, View):
+    """앱 알림함 JSON (?cursor=&limit=)"""
+
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = min(inbox.MAX_PAGE_SIZE, max(1, int(request.GET.get("limit", inbox.PAGE_SIZE))))
+            cursor = int(request.GET["cursor"]) if request.GET.get("cursor") else None
+        except ValueError:
+            return HttpResponseBadRequest("invalid parameters")
+        return JsonResponse(inbox.fetch_page(request.user.pk, cursor, limit))
+
+
+class InboxRecentView(LoginRequiredMixin, View):
+    """헤더 드롭다운용 최근 알림 + 읽지 않은 수 (Redis만 조회)"""
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse(
+            {
+                "notifications": inbox.recent(request.user.pk),
+                "unread_count": inbox.unread_count(request.user.pk),
+            }
+        )
+
+
+class InboxReadView(LoginRequiredMixin, View):
+    """읽음 처리 (ids=1,2,3 / 없으면 전체)"""
+
+    def post(self, request, *args, **kwargs):
+        raw = request.POST.get("ids", "")
+        try:
+            ids = [int(value) for value in raw.split(",") if value] if raw else None
+        except ValueError:
+            return HttpResponseBadRequest("invalid ids")
+        updated = inbox.mark_read(request.user.pk, ids)
+        return JsonResponse({"updated": updated, "unread_count": inbox.unread_count(request.user.pk)})
+
+
+async def _event_stream(user_id: int):
+    client = new_async_redis()
+    pubsub = client.pubsub()
+    await pubsub.subscribe(inbox.events_channel(user_id))
+    try:
+        unread = await sync_to_async(inbox.unread_count)(user_id)
+        yield f"event: unread\ndata: {json.dumps({'unread_count': unread})}\n\n"
+        deadline = time.monotonic() + STREAM_LIFETIME
+        while time.monotonic() < deadline:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=HEARTBEAT_INTERVAL)
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: notification\ndata: {message['data'].decode()}\n\n"
+    finally:
+        # 클라이언트가 연결을 끊으면 제너레이터가 취소되며 여기서 구독 해제
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
+        await client.aclose()
+
+
+async def inbox_stream(request):
+    """새 앱 알림 실시간 전달 (Server-Sent Events, ASGI 서버에서 실행)"""
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({"error": "login required"}, status=401)
+    response = StreamingHttpResponse(_event_stream(user.pk), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no" # nginx 버퍼링 해제
+    return response
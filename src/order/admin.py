@@ -1,6 +1,17 @@
-from django.contrib import admin
+from datetime import date
 
-from .models import Order, OrderItem
+from django.contrib import admin, messages
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
+from django.shortcuts import redirect
+from django.urls import path, reverse
+from django.utils import timezone
+from django.utils.html import format_html, format_html_join
+
+from .archive import find_archived
+from .export import csv_chunks, gzip_chunks, iter_export_rows, jsonl_chunks
+from .models import ArchivedOrder, Order, OrderItem
+from .state_machine import InvalidTransition, change_amount, record_created, transition
 
 
 class OrderItemInline(admin.TabularInline):
@@ -12,15 +23,17 @@ class OrderItemInline(admin.TabularInline):
 
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
+    change_list_template = "admin/order/change_list.html"
     list_display = (
         "order_number",
         "user",
         "status",
         "payment_amount",
+        "payment_review_required",
         "placed_at",
         "updated_at",
     )
-    list_filter = ("status", "payment_method", "placed_at")
+    list_filter = ("status", "payment_review_required", "payment_method", "placed_at")
     search_fields = (
         "order_number",
         "user__username",
@@ -32,6 +45,123 @@ class OrderAdmin(admin.ModelAdmin):
     autocomplete_fields = ("user", "delivery")
     inlines = [OrderItemInline]
     list_select_related = ("user", "delivery")
+    # 상태/시각 필드는 상태 전이 액션으로만 변경
+    readonly_fields = (
+        "status",
+        "paid_at",
+        "shipped_at",
+        "delivered_at",
+        "canceled_at",
+        "refunded_at",
+    )
+    actions = [
+        "mark_as_preparing",
+        "mark_as_shipped",
+        "mark_as_delivered",
+        "mark_as_canceled",
+        "mark_as_refunded",
+    ]
+
+    def save_model(self, request, obj, form, change):
+        if change and "payment_amount" in form.changed_data:
+            # 결제 금액 변경은 집계 금액도 함께 옮기도록 change_amount로 저장
+            new_amount = obj.payment_amount
+            obj.payment_amount = form.initial["payment_amount"]
+            super().save_model(request, obj, form, change)
+            change_amount(obj, new_amount)
+            return
+        super().save_model(request, obj, form, change)
+        if not change:
+            record_created(obj)
+
+    def _transition_selected(self, request, queryset, to_status):
+        done, failed = 0, []
+        for order in queryset:
+            try:
+                transition(order, to_status)
+                done += 1
+            except InvalidTransition:
+                failed.append(order.order_number)
+        label = Order.Status(to_status).label
+        if done:
+            self.message_user(request, f"{done}건의 주문을 '{label}' 상태로 변경했습니다.")
+        if failed:
+            self.message_user(
+                request,
+                f"'{label}'(으)로 변경할 수 없는 주문: {', '.join(failed)}",
+                level=messages.WARNING,
+            )
+
+    @admin.action(description="선택 주문 상품 준비중 처리")
+    def mark_as_preparing(self, request, queryset):
+        self._transition_selected(request, queryset, Order.Status.PREPARING)
+
+    @admin.action(description="선택 주문 배송중 처리")
+    def mark_as_shipped(self, request, queryset):
+        self._transition_selected(request, queryset, Order.Status.SHIPPED)
+
+    @admin.action(description="선택 주문 배송 완료 처리")
+    def mark_as_delivered(self, request, queryset):
+        self._transition_selected(request, queryset, Order.Status.DELIVERED)
+
+    @admin.action(description="선택 주문 취소 처리")
+    def mark_as_canceled(self, request, queryset):
+        self._transition_selected(request, queryset, Order.Status.CANCELED)
+
+    @admin.action(description="선택 주문 환불 처리")
+    def mark_as_refunded(self, request, queryset):
+        self._transition_selected(request, queryset, Order.Status.REFUNDED)
+
+    def get_urls(self):
+        urls = [
+            path(
+                "export/",
+                self.admin_site.admin_view(self.export_view),
+                name="order_order_export",
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def changelist_view(self, request, extra_context=None):
+        extra_context = extra_context or {}
+        extra_context["export_statuses"] = Order.Status.choices
+        return super().changelist_view(request, extra_context=extra_context)
+
+    def export_view(self, request):
+        """주문/주문상품 CSV·JSONL 스트리밍 내보내기 (?start=&end=&status=&format=&gzip=)"""
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+        try:
+            start = date.fromisoformat(request.GET["start"]) if request.GET.get("start") else None
+            end = date.fromisoformat(request.GET["end"]) if request.GET.get("end") else None
+        except ValueError:
+            return HttpResponseBadRequest("invalid date")
+        status = request.GET.get("status") or None
+        if status and status not in Order.Status.values:
+            return HttpResponseBadRequest("invalid status")
+        export_format = request.GET.get("format", "csv")
+        if export_format not in ("csv", "jsonl"):
+            return HttpResponseBadRequest("invalid format")
+
+        rows = iter_export_rows(start=start, end=end, status=status)
+        chunks = csv_chunks(rows) if export_format == "csv" else jsonl_chunks(rows)
+        filename = f"orders-{timezone.localdate():%Y%m%d}.{export_format}"
+        if request.GET.get("gzip") == "1":
+            response = StreamingHttpResponse(gzip_chunks(chunks), content_type="application/gzip")
+            filename += ".gz"
+        else:
+            content_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+            response = StreamingHttpResponse(chunks, content_type=f"{content_type}; charset=utf-8")
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    def change_view(self, request, object_id, form_url="", extra_context=None):
+        # 보관된 주문이면 보관 주문 상세로 연결 (읽기 경로)
+        if object_id.isdigit() and not Order.objects.filter(pk=object_id).exists():
+            archived = find_archived(int(object_id))
+            if archived:
+                return redirect(reverse("admin:order_archivedorder_change", args=[archived.pk]))
+        return super().change_view(request, object_id, form_url, extra_context)
 
 
 @admin.register(OrderItem)
@@ -40,3 +170,48 @@ class OrderItemAdmin(admin.ModelAdmin):
     list_filter = ("order__status",)
     search_fields = ("order__order_number", "product_name", "sku")
     autocomplete_fields = ("order", "product", "product_option")
+
+
+@admin.register(ArchivedOrder)
+class ArchivedOrderAdmin(admin.ModelAdmin):
+    list_display = (
+        "order_number",
+        "user",
+        "status",
+        "payment_amount",
+        "placed_at",
+        "archived_at",
+    )
+    list_filter = ("status",)
+    search_fields = ("order_number",)
+    date_hierarchy = "placed_at"
+    list_select_related = ("user",)
+    show_full_result_count = False
+    readonly_fields = ("items_table",)
+    exclude = ("items",)
+
+    def items_table(self, obj):
+        if not obj.items:
+            return "-"
+        rows = format_html_join(
+            "",
+            "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>",
+            (
+                (item.get("product_name"), item.get("sku"), item.get("quantity"), item.get("total_price"))
+                for item in obj.items
+            ),
+        )
+        return format_html(
+            "<table><thead><tr><th>상품명</th><th>SKU</th><th>수량</th><th>금액</th></tr></thead>"
+            "<tbody>{}</tbody></table>",
+            rows,
+        )
+
+    items_table.short_description = "주문 상품"
+
+    # 보관 주문은 조회 전용
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class OrderConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'order'
+
+    def ready(self):
+        # 주문 변경 시 주문 내역 캐시 무효화
+        import order.signals  # noqa: F401
@@ -0,0 +1,251 @@
+import gzip
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection, transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from order.models import ArchivedOrder, Order, OrderItem
+
+logger = logging.getLogger(__name__)
+
+# 보관 대상: 더 이상 상태가 바뀌지 않는 주문
+ARCHIVABLE_STATUSES = (
+    Order.Status.DELIVERED,
+    Order.Status.CANCELED,
+    Order.Status.REFUNDED,
+)
+
+# ArchivedOrder 컬럼으로 옮기는 필드 (나머지는 order_data JSON으로 보관)
+SUMMARY_FIELDS = (
+    "id",
+    "order_number",
+    "user_id",
+    "status",
+    "payment_method",
+    "payment_amount",
+    "shipping_fee",
+    "placed_at",
+)
+DETAIL_FIELDS = (
+    "delivery_id",
+    "shipping_name",
+    "shipping_phone",
+    "shipping_postcode",
+    "shipping_address1",
+    "shipping_address2",
+    "order_note",
+    "tracking_number",
+    "courier_name",
+    "paid_at",
+    "shipped_at",
+    "delivered_at",
+    "canceled_at",
+    "refunded_at",
+    "updated_at",
+)
+ITEM_FIELDS = (
+    "id",
+    "order_id",
+    "product_id",
+    "product_option_id",
+    "product_name",
+    "sku",
+    "quantity",
+    "discount_amount",
+    "total_price",
+    "created_at",
+)
+
+
+def months_ago(now: datetime, months: int) -> datetime:
+    """now 기준 months개월 전 같은 날짜(말일 보정) 반환"""
+    month_index = now.year * 12 + (now.month - 1) - months
+    year, month = divmod(month_index, 12)
+    month += 1
+    day = now.day
+    while True:
+        try:
+            return now.replace(year=year, month=month, day=day)
+        except ValueError:
+            day -= 1
+
+
+def _to_json(data: Dict) -> Dict:
+    # Decimal/datetime을 JSON 호환 값으로 변환
+    return json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+
+
+def _closed_at(row: Dict) -> Optional[datetime]:
+    return row["delivered_at"] or row["refunded_at"] or row["canceled_at"]
+
+
+def archive_orders(
+    cutoff: datetime,
+    *,
+    batch_size: int = 500,
+    export_path: Optional[str] = None,
+    dry_run: bool = False,
+) -> int:
+    """cutoff 이전에 생성된 종료 주문을 보관 테이블로 옮긴다.
+
+    id 기준 키셋 페이지로 batch_size씩 처리하며, 배치마다 짧은 트랜잭션 안에서
+    보관 행 생성과 원본 주문/주문상품 삭제를 함께 수행한다.
+    export_path를 주면 같은 내용을 JSONL.gz로도 기록한다. 처리한 주문 수를 반환.
+    """
+    base = Order.objects.filter(status__in=ARCHIVABLE_STATUSES, placed_at__lt=cutoff)
+    if dry_run:
+        return base.count()
+
+    export_file = gzip.open(export_path, "at", encoding="utf-8") if export_path else None
+    archived = 0
+    last_id = 0
+    try:
+        while True:
+            ids = list(
+                base.filter(pk__gt=last_id)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            last_id = ids[-1]
+            archived += _archive_batch(ids, export_file)
+            logger.info("주문 보관 진행: %d건 (last_id=%d)", archived, last_id)
+    finally:
+        if export_file:
+            export_file.close()
+    return archived
+
+
+def _archive_batch(ids: List[int], export_file=None) -> int:
+    with transaction.atomic():
+        # 잠금 후 상태를 다시 확인해 그 사이 상태가 바뀐 주문은 건너뛴다
+        rows = list(
+            Order.objects.select_for_update()
+            .filter(pk__in=ids, status__in=ARCHIVABLE_STATUSES)
+            .order_by("pk")
+            .values(*SUMMARY_FIELDS, *DETAIL_FIELDS)
+        )
+        if not rows:
+            return 0
+        order_ids = [row["id"] for row in rows]
+
+        items_by_order = defaultdict(list)
+        for item in OrderItem.objects.filter(order_id__in=order_ids).order_by("id").values(*ITEM_FIELDS):
+            items_by_order[item["order_id"]].append(_to_json(item))
+
+        archives = []
+        for row in rows:
+            items = items_by_order.get(row["id"], [])
+            order_data = _to_json({field: row[field] for field in DETAIL_FIELDS})
+            archives.append(
+                ArchivedOrder(
+                    order_id=row["id"],
+                    order_number=row["order_number"],
+                    user_id=row["user_id"],
+                    status=row["status"],
+                    payment_method=row["payment_method"],
+                    payment_amount=row["payment_amount"],
+                    shipping_fee=row["shipping_fee"],
+                    placed_at=row["placed_at"],
+                    closed_at=_closed_at(row),
+                    order_data=order_data,
+                    items=items,
+                )
+            )
+            if export_file:
+                line = {field: row[field] for field in SUMMARY_FIELDS}
+                line.update(order_data)
+                line["items"] = items
+                export_file.write(json.dumps(line, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n")
+
+        ArchivedOrder.objects.bulk_create(archives, batch_size=len(archives))
+        OrderItem.objects.filter(order_id__in=order_ids).delete()
+        Order.objects.filter(pk__in=order_ids).delete()
+    return len(rows)
+
+
+def find_archived(order_id: int) -> Optional[ArchivedOrder]:
+    """원본 주문 PK로 보관 주문 조회 (관리자 읽기 경로)"""
+    return ArchivedOrder.objects.filter(order_id=order_id).first()
+
+
+#------------------- MySQL 파티셔닝 -------------------#
+
+def _partition_name(month_start: datetime) -> str:
+    return f"p{month_start:%Y%m}"
+
+
+def _month_starts(start: datetime, end: datetime) -> List[datetime]:
+    months = []
+    current = start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    while current <= end:
+        months.append(current)
+        current = (current + timedelta(days=32)).replace(day=1)
+    return months
+
+
+def _partition_clause(month_start: datetime) -> str:
+    # 월별 파티션: 다음 달 1일 미만
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    return (
+        f"PARTITION {_partition_name(month_start)} "
+        f"VALUES LESS THAN (TO_DAYS('{next_month:%Y-%m-%d}'))"
+    )
+
+
+def ensure_archive_partitions(months_ahead: int = 3) -> List[str]:
+    """보관 테이블을 placed_at 월 단위 RANGE 파티션으로 유지한다 (MySQL 전용).
+
+    최초 실행 시 PK를 (id, placed_at)으로 바꾼 뒤 파티셔닝하고, 이후에는
+    pmax 파티션을 쪼개 앞으로 months_ahead개월치 파티션을 미리 만든다.
+    지원하지 않는 DB에서는 아무것도 하지 않고 빈 목록을 반환한다.
+    """
+    if connection.vendor != "mysql":
+        return []
+
+    table = ArchivedOrder._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT PARTITION_NAME FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s "
+            "AND PARTITION_NAME IS NOT NULL",
+            [table],
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+
+        now = timezone.now()
+        horizon = (now + timedelta(days=31 * months_ahead))
+        if not existing:
+            # ORM 집계로 읽어야 aware datetime이 된다 (raw 커서 값은 naive라 horizon과 비교 불가)
+            oldest = ArchivedOrder.objects.aggregate(oldest=Min("placed_at"))["oldest"] or now
+            months = _month_starts(oldest, horizon)
+            clauses = [_partition_clause(m) for m in months]
+            clauses.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+            cursor.execute(
+                f"ALTER TABLE `{table}` DROP PRIMARY KEY, ADD PRIMARY KEY (`id`, `placed_at`)"
+            )
+            cursor.execute(
+                f"ALTER TABLE `{table}` PARTITION BY RANGE (TO_DAYS(`placed_at`)) "
+                f"({', '.join(clauses)})"
+            )
+            return [_partition_name(m) for m in months]
+
+        missing = [
+            m for m in _month_starts(now, horizon)
+            if _partition_name(m) not in existing
+        ]
+        if not missing:
+            return []
+        clauses = [_partition_clause(m) for m in missing]
+        clauses.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+        cursor.execute(
+            f"ALTER TABLE `{table}` REORGANIZE PARTITION pmax INTO ({', '.join(clauses)})"
+        )
+        return [_partition_name(m) for m in missing]
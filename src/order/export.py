@@ -0,0 +1,149 @@
+import csv
+import json
+import zlib
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, Iterator, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from order.models import Order, OrderItem
+
+ORDER_COLUMNS = (
+    "id",
+    "order_number",
+    "user_id",
+    "user__username",
+    "status",
+    "payment_method",
+    "payment_amount",
+    "shipping_fee",
+    "shipping_name",
+    "shipping_phone",
+    "shipping_postcode",
+    "shipping_address1",
+    "shipping_address2",
+    "tracking_number",
+    "courier_name",
+    "placed_at",
+    "paid_at",
+    "shipped_at",
+    "delivered_at",
+    "canceled_at",
+    "refunded_at",
+)
+ITEM_COLUMNS = (
+    "order_id",
+    "product_id",
+    "product_option_id",
+    "product_name",
+    "sku",
+    "quantity",
+    "discount_amount",
+    "total_price",
+)
+# 내보내기 헤더 (주문 컬럼 + item_ 접두사가 붙은 주문상품 컬럼)
+HEADER = [
+    "order_id" if column == "id" else "username" if column == "user__username" else column
+    for column in ORDER_COLUMNS
+] + [f"item_{column}" for column in ITEM_COLUMNS if column != "order_id"]
+
+
+def _local_day_start(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def iter_export_rows(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    status: Optional[str] = None,
+    batch_size: int = 1000,
+) -> Iterator[Dict]:
+    """주문상품 1개당 1행으로 주문/주문상품을 이어 붙여 반환 (end 날짜 포함)
+
+    주문 id 키셋 페이지로 batch_size씩 .values()를 읽고, 페이지마다 주문상품을
+    한 번에 조회하므로 전체 기간을 내보내도 메모리 사용량이 일정하다.
+    """
+    queryset = Order.objects.all()
+    if start:
+        queryset = queryset.filter(placed_at__gte=_local_day_start(start))
+    if end:
+        queryset = queryset.filter(placed_at__lt=_local_day_start(end + timedelta(days=1)))
+    if status:
+        queryset = queryset.filter(status=status)
+
+    last_id = 0
+    while True:
+        orders = list(
+            queryset.filter(pk__gt=last_id)
+            .order_by("pk")
+            .values(*ORDER_COLUMNS)[:batch_size]
+        )
+        if not orders:
+            return
+        last_id = orders[-1]["id"]
+
+        items_by_order = defaultdict(list)
+        items = (
+            OrderItem.objects.filter(order_id__in=[order["id"] for order in orders])
+            .order_by("order_id", "id")
+            .values(*ITEM_COLUMNS)
+        )
+        for item in items:
+            items_by_order[item["order_id"]].append(item)
+
+        for order in orders:
+            base = [order[column] for column in ORDER_COLUMNS]
+            lines = items_by_order.get(order["id"]) or [None]
+            for item in lines:
+                values = base + [
+                    item[column] if item else None
+                    for column in ITEM_COLUMNS
+                    if column != "order_id"
+                ]
+                yield dict(zip(HEADER, values))
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 버퍼"""
+
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return timezone.localtime(value).isoformat()
+    return value
+
+
+def csv_chunks(rows: Iterable[Dict]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+    yield "\ufeff" + writer.writerow(HEADER)
+    for row in rows:
+        yield writer.writerow([_csv_value(row[column]) for column in HEADER])
+
+
+def jsonl_chunks(rows: Iterable[Dict]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False) + "\n"
+
+
+def gzip_chunks(chunks: Iterable[str], flush_bytes: int = 64 * 1024) -> Iterator[bytes]:
+    """문자열 청크를 gzip 포맷으로 압축하며 스트리밍 (flush_bytes마다 내보냄)"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) # wbits=31: gzip 헤더 포함
+    pending = 0
+    for chunk in chunks:
+        data = chunk.encode("utf-8")
+        pending += len(data)
+        out = compressor.compress(data)
+        if pending >= flush_bytes:
+            out += compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+        if out:
+            yield out
+    yield compressor.flush()
@@ -0,0 +1,124 @@
+from datetime import datetime, timezone as dt_timezone
+from typing import Dict, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db.models import Prefetch, Q
+
+from common import metrics
+from order.models import Order, OrderItem
+
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 50
+FIRST_PAGE_TTL = 60 * 5 # 첫 페이지 캐시 5분 (주문 변경 시 즉시 무효화)
+
+
+def first_page_cache_key(user_id: int) -> str:
+    return f"order:history:{user_id}"
+
+
+def invalidate_first_page(user_id: int):
+    cache.delete(first_page_cache_key(user_id))
+
+
+def encode_cursor(placed_at: datetime, order_id: int) -> str:
+    micros = int(placed_at.timestamp() * 1_000_000)
+    return f"{micros}.{order_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """잘못된 커서는 ValueError"""
+    micros, order_id = cursor.split(".", 1)
+    placed_at = datetime.fromtimestamp(int(micros) / 1_000_000, tz=dt_timezone.utc)
+    return placed_at, int(order_id)
+
+
+def _serialize(order: Order) -> Dict:
+    return {
+        "order_number": order.order_number,
+        "status": order.status,
+        "status_label": order.get_status_display(),
+        "payment_amount": float(order.payment_amount),
+        "shipping_fee": float(order.shipping_fee),
+        "placed_at": order.placed_at.isoformat(),
+        "tracking_number": order.tracking_number,
+        "courier_name": order.courier_name,
+        "items": [
+            {
+                "product_id": item.product_id,
+                "product_option_id": item.product_option_id,
+                "product_name": item.product_name,
+                "quantity": item.quantity,
+                "total_price": float(item.total_price),
+            }
+            for item in order.items.all()
+        ],
+    }
+
+
+def fetch_page(user_id: int, cursor: Optional[str] = None, limit: int = PAGE_SIZE) -> Dict:
+    """회원 주문 내역 한 페이지 (최신순, (placed_at, id) 키셋 페이지)
+
+    1) (user, placed_at, id) 인덱스만으로 해당 페이지의 주문 id를 고르고
+    2) 그 id들만 PK로 읽은 뒤 3) 주문상품을 한 번에 prefetch 한다.
+    주문이 수천 건이어도 OFFSET이나 filesort 없이 페이지당 쿼리 3개로 끝난다.
+    """
+    keys = Order.objects.filter(user_id=user_id)
+    if cursor:
+        placed_at, order_id = decode_cursor(cursor)
+        keys = keys.filter(Q(placed_at__lt=placed_at) | Q(placed_at=placed_at, id__lt=order_id))
+    page_keys: List[Tuple[int, datetime]] = list(
+        keys.order_by("-placed_at", "-id").values_list("id", "placed_at")[: limit + 1]
+    )
+    has_next = len(page_keys) > limit
+    page_keys = page_keys[:limit]
+
+    orders = []
+    if page_keys:
+        orders = list(
+            Order.objects.filter(pk__in=[pk for pk, _ in page_keys])
+            .only(
+                "order_number",
+                "status",
+                "payment_amount",
+                "shipping_fee",
+                "placed_at",
+                "tracking_number",
+                "courier_name",
+            )
+            .prefetch_related(
+                Prefetch(
+                    "items",
+                    queryset=OrderItem.objects.only(
+                        "order",
+                        "product",
+                        "product_option",
+                        "product_name",
+                        "quantity",
+                        "total_price",
+                    ),
+                )
+            )
+            .order_by("-placed_at", "-id")
+        )
+
+    next_cursor = None
+    if has_next:
+        last_id, last_placed_at = page_keys[-1]
+        next_cursor = encode_cursor(last_placed_at, last_id)
+    return {
+        "orders": [_serialize(order) for order in orders],
+        "next_cursor": next_cursor,
+    }
+
+
+def get_history(user_id: int, cursor: Optional[str] = None, limit: int = PAGE_SIZE) -> Dict:
+    """첫 페이지(기본 크기)는 회원별로 캐시, 나머지는 DB에서 바로 조회"""
+    if cursor or limit != PAGE_SIZE:
+        return fetch_page(user_id, cursor, limit)
+    key = first_page_cache_key(user_id)
+    page = cache.get(key)
+    metrics.cache_result("order_history", page is not None)
+    if page is None:
+        page = fetch_page(user_id, None, limit)
+        cache.set(key, page, FIRST_PAGE_TTL)
+    return page
@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from order.archive import archive_orders, ensure_archive_partitions, months_ago
+
+
+class Command(BaseCommand):
+    help = "오래된 종료 주문(배송 완료/취소/환불)을 보관 테이블로 이동"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=settings.ORDER_ARCHIVE_MONTHS,
+            help="생성 후 N개월이 지난 주문을 보관 (기본 ORDER_ARCHIVE_MONTHS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 트랜잭션에서 처리할 주문 수(기본 500)",
+        )
+        parser.add_argument(
+            "--export",
+            dest="export_path",
+            help="보관 주문을 JSONL.gz 파일로도 기록할 경로",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="이동하지 않고 대상 주문 수만 출력",
+        )
+        parser.add_argument(
+            "--partition",
+            action="store_true",
+            help="보관 테이블 월별 파티션 생성/연장 (MySQL)",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="--partition 시 미리 만들어 둘 파티션 개월 수(기본 3)",
+        )
+
+    def handle(self, *args, **options):
+        if options["partition"]:
+            created = ensure_archive_partitions(options["months_ahead"])
+            if created:
+                self.stdout.write(f"파티션 생성: {', '.join(created)}")
+            else:
+                self.stdout.write("추가할 파티션이 없거나 파티셔닝을 지원하지 않는 DB입니다.")
+
+        cutoff = months_ago(timezone.now(), options["months"])
+        count = archive_orders(
+            cutoff,
+            batch_size=options["batch_size"],
+            export_path=options["export_path"],
+            dry_run=options["dry_run"],
+        )
+        if options["dry_run"]:
+            self.stdout.write(f"보관 대상 주문: {count}건 (기준 {cutoff:%Y-%m-%d})")
+            return
+        self.stdout.write(self.style.SUCCESS(f"{count}건 보관 완료 (기준 {cutoff:%Y-%m-%d})"))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from order.state_machine import rebuild_counters
+
+
+class Command(BaseCommand):
+    help = "주문일·상태별 주문 집계(OrderStatusCounter) 재계산"
+
+    def handle(self, *args, **options):
+        rows = rebuild_counters()
+        self.stdout.write(self.style.SUCCESS(f"집계 행 {rows}개 재생성 완료"))
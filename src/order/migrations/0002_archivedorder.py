@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedOrder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('order_id', models.BigIntegerField(db_index=True)),
+                ('order_number', models.CharField(max_length=32)),
+                ('status', models.CharField(choices=[('PENDING', '주문 대기'), ('PAID', '결제 완료'), ('PREPARING', '상품 준비중'), ('SHIPPED', '배송중'), ('DELIVERED', '배송 완료'), ('CANCELED', '취소'), ('REFUNDED', '환불 완료')], max_length=20)),
+                ('payment_method', models.CharField(choices=[('CARD', '신용/체크카드'), ('BANK_TRANSFER', '계좌 이체'), ('VIRTUAL_ACCOUNT', '가상계좌'), ('MOBILE', '모바일 결제'), ('ETC', '기타')], max_length=20)),
+                ('payment_amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('shipping_fee', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('placed_at', models.DateTimeField()),
+                ('closed_at', models.DateTimeField(blank=True, null=True)),
+                ('order_data', models.JSONField(default=dict)),
+                ('items', models.JSONField(default=list)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='archived_orders', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-placed_at'],
+                'indexes': [models.Index(fields=['order_number'], name='order_archi_order_n_6431b8_idx'), models.Index(fields=['placed_at'], name='order_archi_placed__0187f5_idx'), models.Index(fields=['user', 'placed_at'], name='order_archi_user_id_68061e_idx')],
+            },
+        ),
+    ]
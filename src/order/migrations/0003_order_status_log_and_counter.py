@@ -0,0 +1,73 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_counters(apps, schema_editor):
+    # 기존 주문을 집계에 반영 (state_machine.rebuild_counters와 같은 방식)
+    from decimal import Decimal
+
+    from django.db.models import Count, Sum
+    from django.db.models.functions import TruncDate
+
+    OrderStatusCounter = apps.get_model("order", "OrderStatusCounter")
+    totals = {}
+    for model_name in ("Order", "ArchivedOrder"):
+        rows = (
+            apps.get_model("order", model_name).objects.annotate(day=TruncDate("placed_at"))
+            .values("day", "status")
+            .annotate(count=Count("id"), amount=Sum("payment_amount"))
+            .order_by()
+        )
+        for row in rows:
+            key = (row["day"], row["status"])
+            count, amount = totals.get(key, (0, Decimal("0")))
+            totals[key] = (count + row["count"], amount + (row["amount"] or Decimal("0")))
+    OrderStatusCounter.objects.bulk_create(
+        [
+            OrderStatusCounter(day=day, status=status, order_count=count, amount=amount)
+            for (day, status), (count, amount) in totals.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0002_archivedorder'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderStatusCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.CharField(choices=[('PENDING', '주문 대기'), ('PAID', '결제 완료'), ('PREPARING', '상품 준비중'), ('SHIPPED', '배송중'), ('DELIVERED', '배송 완료'), ('CANCELED', '취소'), ('REFUNDED', '환불 완료')], max_length=20)),
+                ('order_count', models.IntegerField(default=0)),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+            ],
+            options={
+                'ordering': ['-day', 'status'],
+                'constraints': [models.UniqueConstraint(fields=('day', 'status'), name='order_status_counter_unique_day')],
+            },
+        ),
+        migrations.CreateModel(
+            name='OrderStatusLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, max_length=20)),
+                ('to_status', models.CharField(choices=[('PENDING', '주문 대기'), ('PAID', '결제 완료'), ('PREPARING', '상품 준비중'), ('SHIPPED', '배송중'), ('DELIVERED', '배송 완료'), ('CANCELED', '취소'), ('REFUNDED', '환불 완료')], max_length=20)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('order', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='status_logs', to='order.order')),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['created_at'], name='order_order_created_8661ad_idx')],
+            },
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-19 11:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('delivery', '0001_initial'),
+        ('order', '0003_order_status_log_and_counter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', 'placed_at', 'id'], name='order_order_user_id_b4ec3b_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 12:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0004_order_user_placed_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='payment_review_required',
+            field=models.BooleanField(default=False),
+        ),
+    ]
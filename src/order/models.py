@@ -55,6 +55,8 @@ class Order(models.Model):
         default=0,
     )
     order_note = models.CharField(max_length=255, blank=True) # 주문 메모
+    # 결제 승인 후 주문 상태를 바꾸지 못한 주문 (환불/확인 필요)
+    payment_review_required = models.BooleanField(default=False)
     tracking_number = models.CharField(max_length=40, blank=True) # 운송장 번호
     courier_name = models.CharField(max_length=40, blank=True)  # 택배사 이름
     placed_at = models.DateTimeField(auto_now_add=True) # 주문 생성 시각
@@ -71,6 +73,8 @@ class Order(models.Model):
             models.Index(fields=["order_number"]),
             models.Index(fields=["status"]),
             models.Index(fields=["placed_at"]),
+            # 회원별 주문 내역 키셋 페이지 (user, placed_at, id) 커버링 인덱스
+            models.Index(fields=["user", "placed_at", "id"]),
         ]
 
     def __str__(self) -> str:
@@ -118,3 +122,87 @@ class OrderItem(models.Model):
 
     def __str__(self) -> str:
         return f"{self.order.order_number} - {self.product_name}"
+
+
+class ArchivedOrder(models.Model):
+    """보관 처리된 주문 (배송 완료/취소/환불 후 일정 기간이 지난 주문)
+
+    주문 상품은 items(JSON)에 함께 저장해 주문 1건 = 1행으로 유지한다.
+    MySQL RANGE 파티셔닝(placed_at 기준)이 가능하도록 외래키 제약과
+    order_number 유니크 제약을 두지 않는다.
+    """
+
+    order_id = models.BigIntegerField(db_index=True) # 원본 주문 PK
+    order_number = models.CharField(max_length=32)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="archived_orders",
+    )
+    status = models.CharField(max_length=20, choices=Order.Status.choices)
+    payment_method = models.CharField(max_length=20, choices=Order.PaymentMethod.choices)
+    payment_amount = models.DecimalField(max_digits=12, decimal_places=2)
+    shipping_fee = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    placed_at = models.DateTimeField() # 원본 주문 생성 시각 (파티션 키)
+    closed_at = models.DateTimeField(null=True, blank=True) # 배송 완료/취소/환불 시각
+    order_data = models.JSONField(default=dict) # 배송지/운송장 등 나머지 주문 필드
+    items = models.JSONField(default=list) # 주문 상품 목록
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-placed_at"]
+        indexes = [
+            models.Index(fields=["order_number"]),
+            models.Index(fields=["placed_at"]),
+            models.Index(fields=["user", "placed_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"ArchivedOrder {self.order_number}"
+
+
+class OrderStatusLog(models.Model):
+    """주문 상태 전이 이력 (보관 후에도 남도록 외래키 제약 없음)"""
+
+    order = models.ForeignKey(
+        Order,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="status_logs",
+    )
+    from_status = models.CharField(max_length=20, blank=True) # 생성 시에는 빈 값
+    to_status = models.CharField(max_length=20, choices=Order.Status.choices)
+    amount = models.DecimalField(max_digits=12, decimal_places=2) # 전이 시점 결제 금액
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["created_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.order_id}: {self.from_status or '-'} -> {self.to_status}"
+
+
+class OrderStatusCounter(models.Model):
+    """주문일(현지 날짜)·현재 상태별 주문 수/금액 집계
+
+    주문 생성·상태 전이와 같은 트랜잭션에서 갱신되며, 대시보드는
+    COUNT(*) 대신 이 행들을 합산해 읽는다.
+    """
+
+    day = models.DateField()
+    status = models.CharField(max_length=20, choices=Order.Status.choices)
+    order_count = models.IntegerField(default=0)
+    amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+    class Meta:
+        ordering = ["-day", "status"]
+        constraints = [
+            models.UniqueConstraint(fields=["day", "status"], name="order_status_counter_unique_day"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.day} {self.status}: {self.order_count}"
@@ -0,0 +1,149 @@
+import logging
+import os
+import secrets
+import socket
+import threading
+import time
+import zlib
+
+from django.conf import settings
+
+from common.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Crockford Base32: ASCII 순서와 값 순서가 같아 문자열 정렬 = 시간 정렬
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+TIME_CHARS = 10 # 밀리초 타임스탬프 50비트
+NODE_CHARS = 2 # 노드(프로세스) 번호 10비트
+SEQ_CHARS = 4 # 같은 밀리초 내 순번 20비트
+
+NODE_MAX = 32 ** NODE_CHARS
+SEQ_MAX = 32 ** SEQ_CHARS
+
+# 노드 번호 임대: order:node:{번호} 키를 SET NX로 잡고 TTL 안에 갱신한다
+NODE_LEASE_KEY = "order:node:{}"
+NODE_CURSOR_KEY = "order:node:next"
+NODE_LEASE_TTL = 600  # 초
+NODE_LEASE_REFRESH = NODE_LEASE_TTL // 3
+
+# 값이 같을 때만 만료 연장 (다른 프로세스가 이어받은 번호는 건드리지 않음)
+_REFRESH_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_lock = threading.Lock()
+_last_ms = 0
+_seq = 0
+_node_id = None
+_lease_owner = None
+_lease_at = 0.0
+_forked = False
+
+
+def _encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, rem = divmod(value, 32)
+        chars.append(ALPHABET[rem])
+    return "".join(reversed(chars))
+
+
+def _claim_node_lease():
+    """Redis에서 비어 있는 노드 번호를 임대해 반환. 모두 사용 중이면 None"""
+    global _lease_owner, _lease_at
+    client = get_redis()
+    owner = f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}"
+    start = client.incr(NODE_CURSOR_KEY)
+    for offset in range(NODE_MAX):
+        node_id = (start + offset) % NODE_MAX
+        if client.set(NODE_LEASE_KEY.format(node_id), owner, nx=True, ex=NODE_LEASE_TTL):
+            _lease_owner, _lease_at = owner, time.monotonic()
+            return node_id
+    return None
+
+
+def _refresh_node_lease():
+    """임대 만료 전에 연장하고, 잃었으면 새 번호를 임대한다"""
+    global _node_id, _lease_at
+    try:
+        client = get_redis()
+        refreshed = client.eval(
+            _REFRESH_SCRIPT, 1, NODE_LEASE_KEY.format(_node_id), _lease_owner, NODE_LEASE_TTL
+        )
+        if refreshed:
+            _lease_at = time.monotonic()
+            return
+        logger.warning("주문번호 노드 %s 임대를 잃어 새로 임대합니다", _node_id)
+        node_id = _claim_node_lease()
+        if node_id is not None:
+            _node_id = node_id
+    except Exception:
+        # Redis 장애 중에는 지금 번호를 계속 쓰고 다음 주문에서 다시 시도
+        logger.exception("주문번호 노드 임대 갱신 실패")
+        _lease_at = time.monotonic()
+
+
+def get_node_id() -> int:
+    """ORDER_NODE_ID 설정값 > Redis 임대 번호 > 호스트명+PID 해시 순으로 정한 프로세스 번호
+
+    해시는 프로세스가 수십 개만 돼도 번호가 겹칠 수 있어 Redis를 쓸 수 없을 때만 쓴다.
+    fork 한 자식은 설정값을 형제 프로세스와 같이 쓰게 되므로 설정값 대신 임대 번호를 쓴다.
+    """
+    global _node_id
+    if _node_id is None:
+        configured = getattr(settings, "ORDER_NODE_ID", None)
+        if configured is not None and not _forked:
+            _node_id = int(configured) % NODE_MAX
+        else:
+            try:
+                _node_id = _claim_node_lease()
+            except Exception:
+                logger.exception("주문번호 노드 임대 실패, 호스트명+PID 해시로 대체")
+            if _node_id is None:
+                seed = f"{socket.gethostname()}:{os.getpid()}".encode()
+                _node_id = zlib.crc32(seed) % NODE_MAX
+    elif _lease_owner and time.monotonic() - _lease_at > NODE_LEASE_REFRESH:
+        _refresh_node_lease()
+    return _node_id
+
+
+def _reset_after_fork():
+    # fork 한 자식(gunicorn --preload 워커, 시드 워커 등)은 부모 번호를 물려받지 않고 새로 임대한다
+    global _node_id, _lease_owner, _last_ms, _seq, _forked
+    _node_id = _lease_owner = None
+    _last_ms = _seq = 0
+    _forked = True
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def generate_order_number() -> str:
+    """시간순 정렬되는 16자리 주문번호 생성 (DB 조회 없음)
+
+    [밀리초 타임스탬프 10자][노드 2자][순번 4자] 구성이라 새 주문번호는 항상
+    유니크 인덱스의 오른쪽 끝에 붙는다. 같은 밀리초 안에서는 프로세스 내 순번을
+    올리고, 시계가 뒤로 가면 마지막 시각을 그대로 이어 쓴다.
+    """
+    global _last_ms, _seq
+    with _lock:
+        now_ms = int(time.time() * 1000)
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _seq = 0
+        else:
+            _seq += 1
+            if _seq >= SEQ_MAX:
+                # 순번 소진 시 다음 밀리초로 넘어감
+                _last_ms += 1
+                _seq = 0
+        return (
+            _encode(_last_ms, TIME_CHARS)
+            + _encode(get_node_id(), NODE_CHARS)
+            + _encode(_seq, SEQ_CHARS)
+        )
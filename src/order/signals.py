@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from order.history import invalidate_first_page
+from order.models import Order
+
+
+# 주문 저장/삭제 시 회원 주문 내역 첫 페이지 캐시 무효화
+# (주문상품 교체까지 끝난 뒤 지우도록 커밋 이후 실행)
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+def on_order_change(sender, instance, **kwargs):
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_first_page(user_id))
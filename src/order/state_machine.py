@@ -0,0 +1,196 @@
+import logging
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from order.models import ArchivedOrder, Order, OrderStatusCounter, OrderStatusLog
+
+logger = logging.getLogger(__name__)
+
+Status = Order.Status
+
+# 허용되는 상태 전이
+TRANSITIONS = {
+    Status.PENDING: {Status.PAID, Status.CANCELED},
+    Status.PAID: {Status.PREPARING, Status.CANCELED, Status.REFUNDED},
+    Status.PREPARING: {Status.SHIPPED, Status.CANCELED, Status.REFUNDED},
+    Status.SHIPPED: {Status.DELIVERED, Status.REFUNDED},
+    Status.DELIVERED: {Status.REFUNDED},
+    Status.CANCELED: set(),
+    Status.REFUNDED: set(),
+}
+
+# 상태 진입 시 기록할 시각 필드
+TIMESTAMP_FIELDS = {
+    Status.PAID: "paid_at",
+    Status.SHIPPED: "shipped_at",
+    Status.DELIVERED: "delivered_at",
+    Status.CANCELED: "canceled_at",
+    Status.REFUNDED: "refunded_at",
+}
+
+
+class InvalidTransition(ValueError):
+    """허용되지 않은 주문 상태 전이"""
+
+    def __init__(self, from_status, to_status):
+        self.from_status = from_status
+        self.to_status = to_status
+        super().__init__(f"{from_status} -> {to_status} 전이는 허용되지 않습니다.")
+
+
+def can_transition(from_status: str, to_status: str) -> bool:
+    return to_status in TRANSITIONS.get(from_status, set())
+
+
+def _order_day(order: Order) -> date:
+    return timezone.localdate(order.placed_at)
+
+
+def _bump_counter(day: date, status: str, count: int, amount: Decimal):
+    # 집계 행이 있으면 증분 UPDATE, 없으면 생성 (동시 생성 충돌 시 UPDATE 재시도)
+    updated = OrderStatusCounter.objects.filter(day=day, status=status).update(
+        order_count=F("order_count") + count,
+        amount=F("amount") + amount,
+    )
+    if updated:
+        return
+    if count < 0 or amount < 0:
+        # 집계에 없던 주문(집계 도입 전 주문 등)을 빼려는 경우: 음수 행을 만들지 않고 기록만 한다
+        logger.warning(
+            "주문 집계 행이 없어 차감을 건너뜀: day=%s status=%s count=%s amount=%s (rebuild_order_counters로 보정)",
+            day,
+            status,
+            count,
+            amount,
+        )
+        return
+    try:
+        with transaction.atomic():
+            OrderStatusCounter.objects.create(day=day, status=status, order_count=count, amount=amount)
+    except IntegrityError:
+        OrderStatusCounter.objects.filter(day=day, status=status).update(
+            order_count=F("order_count") + count,
+            amount=F("amount") + amount,
+        )
+
+
+def record_created(order: Order):
+    """새 주문을 로그/집계에 반영 (주문 생성과 같은 트랜잭션에서 호출)"""
+    with transaction.atomic():
+        OrderStatusLog.objects.create(order=order, from_status="", to_status=order.status, amount=order.payment_amount)
+        _bump_counter(_order_day(order), order.status, 1, order.payment_amount)
+
+
+def change_amount(order: Order, amount: Decimal):
+    """결제 금액 변경 (재사용되는 PENDING 주문 등) 및 집계 금액 보정"""
+    with transaction.atomic():
+        delta = amount - order.payment_amount
+        order.payment_amount = amount
+        order.save(update_fields=["payment_amount", "updated_at"])
+        if delta:
+            _bump_counter(_order_day(order), order.status, 0, delta)
+
+
+def transition(order: Order, to_status: str, *, extra_fields: Iterable[str] = ()) -> Order:
+    """주문 상태를 to_status로 전이한다.
+
+    행 잠금 후 전이 가능 여부를 검증하고, *_at 시각 기록, 이력 추가,
+    일자·상태별 집계 이동을 한 트랜잭션으로 처리한다.
+    extra_fields는 호출자가 order에 함께 설정한 필드(운송장 번호 등)로, 같이 저장된다.
+    """
+    with transaction.atomic():
+        current = (
+            Order.objects.select_for_update()
+            .only("status", "placed_at", "payment_amount")
+            .get(pk=order.pk)
+        )
+        from_status = current.status
+        if not can_transition(from_status, to_status):
+            raise InvalidTransition(from_status, to_status)
+
+        now = timezone.now()
+        update_fields = ["status", "updated_at", *extra_fields]
+        order.status = to_status
+        timestamp_field = TIMESTAMP_FIELDS.get(to_status)
+        if timestamp_field:
+            setattr(order, timestamp_field, now)
+            update_fields.append(timestamp_field)
+        order.save(update_fields=update_fields)
+
+        amount = current.payment_amount
+        OrderStatusLog.objects.create(order=order, from_status=from_status, to_status=to_status, amount=amount)
+        day = _order_day(current)
+        _bump_counter(day, from_status, -1, -amount)
+        _bump_counter(day, to_status, 1, amount)
+    return order
+
+
+#------------------- 집계 조회 -------------------#
+
+def status_totals(start: date, end: date) -> Dict[str, Dict]:
+    """[start, end) 주문일 구간의 상태별 주문 수/금액"""
+    rows = (
+        OrderStatusCounter.objects.filter(day__gte=start, day__lt=end)
+        .values("status")
+        .annotate(count=Sum("order_count"), amount=Sum("amount"))
+    )
+    return {
+        row["status"]: {"count": row["count"] or 0, "amount": row["amount"] or Decimal("0")}
+        for row in rows
+    }
+
+
+def daily_amounts(start: date, end: date, statuses: Iterable[str]) -> Dict[date, Decimal]:
+    """[start, end) 구간의 주문일별 금액 합계 (statuses 상태만)"""
+    rows = (
+        OrderStatusCounter.objects.filter(day__gte=start, day__lt=end, status__in=list(statuses))
+        .values("day")
+        .annotate(total=Sum("amount"))
+    )
+    return {row["day"]: row["total"] or Decimal("0") for row in rows}
+
+
+def transition_rollup(start, end, to_status: Optional[str] = None):
+    """이력 재생: 전이 발생일·도착 상태별 전이 횟수와 금액 (롤업/리포트용)"""
+    queryset = OrderStatusLog.objects.filter(created_at__gte=start, created_at__lt=end)
+    if to_status:
+        queryset = queryset.filter(to_status=to_status)
+    return (
+        queryset.annotate(day=TruncDate("created_at"))
+        .values("day", "to_status")
+        .annotate(count=Count("id"), amount=Sum("amount"))
+        .order_by("day", "to_status")
+    )
+
+
+def rebuild_counters() -> int:
+    """주문/보관 주문 테이블에서 집계 행을 다시 계산 (초기 적재·보정용)"""
+    totals = {}
+    for model in (Order, ArchivedOrder):
+        rows = (
+            model.objects.annotate(day=TruncDate("placed_at"))
+            .values("day", "status")
+            .annotate(count=Count("id"), amount=Sum("payment_amount"))
+            .order_by()
+        )
+        for row in rows:
+            key = (row["day"], row["status"])
+            count, amount = totals.get(key, (0, Decimal("0")))
+            totals[key] = (count + row["count"], amount + (row["amount"] or Decimal("0")))
+
+    with transaction.atomic():
+        OrderStatusCounter.objects.all().delete()
+        OrderStatusCounter.objects.bulk_create(
+            [
+                OrderStatusCounter(day=day, status=status, order_count=count, amount=amount)
+                for (day, status), (count, amount) in totals.items()
+            ],
+            batch_size=1000,
+        )
+    return len(totals)
@@ -1,3 +1,184 @@
-from django.test import TestCase
+from datetime import date
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.admin import site
+from django.forms.models import model_to_dict
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from accounts.models import Account
+from delivery.models import Delivery
+from order import state_machine
+from order.models import Order, OrderStatusCounter, OrderStatusLog
+from order.numbers import generate_order_number
+
+
+class OrderTestMixin:
+    def setUp(self):
+        self.user = Account.objects.create_user(
+            username="buyer",
+            email="buyer@example.com",
+            password="pw-123456!",
+            name="구매자",
+            birth_date=date(1990, 1, 1),
+            phone="010-1234-5678",
+            address="서울",
+        )
+        self.delivery = Delivery.objects.create(
+            user=self.user,
+            recipient_name="구매자",
+            phone="010-1234-5678",
+            postcode="00000",
+            address_line1="서울",
+        )
+
+    def make_order(self, status=Order.Status.PENDING, amount=Decimal("10000")):
+        order = Order.objects.create(
+            order_number=generate_order_number(),
+            user=self.user,
+            delivery=self.delivery,
+            shipping_name="구매자",
+            shipping_phone="010-1234-5678",
+            shipping_postcode="00000",
+            shipping_address1="서울",
+            status=status,
+            payment_amount=amount,
+        )
+        state_machine.record_created(order)
+        return order
+
+
+class StateMachineTests(OrderTestMixin, TestCase):
+    def test_can_transition(self):
+        self.assertTrue(state_machine.can_transition(Order.Status.PENDING, Order.Status.PAID))
+        self.assertTrue(state_machine.can_transition(Order.Status.PAID, Order.Status.REFUNDED))
+        self.assertFalse(state_machine.can_transition(Order.Status.SHIPPED, Order.Status.PAID))
+        self.assertFalse(state_machine.can_transition(Order.Status.CANCELED, Order.Status.PAID))
+
+    def test_transition_records_timestamp_log_and_counters(self):
+        order = self.make_order()
+        state_machine.transition(order, Order.Status.PAID)
+
+        order.refresh_from_db()
+        self.assertEqual(order.status, Order.Status.PAID)
+        self.assertIsNotNone(order.paid_at)
+        self.assertTrue(
+            OrderStatusLog.objects.filter(
+                order=order, from_status=Order.Status.PENDING, to_status=Order.Status.PAID
+            ).exists()
+        )
+        counters = {c.status: c for c in OrderStatusCounter.objects.all()}
+        self.assertEqual(counters[Order.Status.PENDING].order_count, 0)
+        self.assertEqual(counters[Order.Status.PENDING].amount, Decimal("0"))
+        self.assertEqual(counters[Order.Status.PAID].order_count, 1)
+        self.assertEqual(counters[Order.Status.PAID].amount, Decimal("10000"))
+
+    def test_invalid_transition_leaves_order_unchanged(self):
+        order = self.make_order(status=Order.Status.SHIPPED)
+        with self.assertRaises(state_machine.InvalidTransition):
+            state_machine.transition(order, Order.Status.PAID)
+
+        order.refresh_from_db()
+        self.assertEqual(order.status, Order.Status.SHIPPED)
+        self.assertIsNone(order.paid_at)
+        self.assertEqual(OrderStatusLog.objects.filter(order=order).count(), 1)  # 생성 기록만
+
+    def test_transition_of_uncounted_order_does_not_create_negative_counter(self):
+        order = self.make_order()
+        OrderStatusCounter.objects.all().delete()  # 집계 도입 전 주문
+        with self.assertLogs("order.state_machine", "WARNING"):
+            state_machine.transition(order, Order.Status.PAID)
+
+        counters = {c.status: c for c in OrderStatusCounter.objects.all()}
+        self.assertNotIn(Order.Status.PENDING, counters)
+        self.assertEqual(counters[Order.Status.PAID].order_count, 1)
+
+    def test_change_amount_moves_counter_amount(self):
+        order = self.make_order()
+        state_machine.change_amount(order, Decimal("15000"))
+
+        counter = OrderStatusCounter.objects.get(status=Order.Status.PENDING)
+        self.assertEqual(counter.order_count, 1)
+        self.assertEqual(counter.amount, Decimal("15000"))
+
+
+@mock.patch("order.views.requests.post")
+class TossSuccessViewTests(OrderTestMixin, TestCase):
+    def confirm(self, post, order):
+        post.return_value.json.return_value = {
+            "paymentKey": "pay_1",
+            "orderId": order.order_number,
+            "status": "DONE",
+            "method": "카드",
+            "totalAmount": int(order.payment_amount),
+        }
+        return self.client.get(
+            reverse("order:success"),
+            {"paymentKey": "pay_1", "orderId": order.order_number, "amount": int(order.payment_amount)},
+        )
+
+    def test_pending_order_becomes_paid(self, post):
+        order = self.make_order()
+        response = self.confirm(post, order)
+
+        self.assertEqual(response.status_code, 200)
+        order.refresh_from_db()
+        self.assertEqual(order.status, Order.Status.PAID)
+        self.assertFalse(order.payment_review_required)
+        post.assert_called_once()
+
+    def test_already_paid_order_is_left_alone(self, post):
+        order = self.make_order()
+        state_machine.transition(order, Order.Status.PAID)
+        response = self.confirm(post, order)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(OrderStatusLog.objects.filter(order=order, to_status=Order.Status.PAID).count(), 1)
+
+    def test_order_that_cannot_be_paid_is_flagged_for_review(self, post):
+        order = self.make_order(status=Order.Status.SHIPPED)
+        with self.assertLogs("order.views", "ERROR"):
+            response = self.confirm(post, order)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "주문 상태를 확인하고 있습니다")
+        order.refresh_from_db()
+        self.assertEqual(order.status, Order.Status.SHIPPED)
+        self.assertTrue(order.payment_review_required)
+
+    def test_missing_parameters(self, post):
+        response = self.client.get(reverse("order:success"), {"paymentKey": "pay_1"})
+
+        self.assertEqual(response.status_code, 400)
+        post.assert_not_called()
+
+
+class OrderAdminTests(OrderTestMixin, TestCase):
+    def test_amount_edit_updates_counter(self):
+        order = self.make_order()
+        admin_user = Account.objects.create_superuser(
+            username="admin",
+            email="admin@example.com",
+            password="pw-123456!",
+            name="관리자",
+            birth_date=date(1990, 1, 1),
+            phone="010-0000-0000",
+            address="서울",
+        )
+        model_admin = site._registry[Order]
+        request = RequestFactory().post("/")
+        request.user = admin_user
+        form_class = model_admin.get_form(request, order, change=True)
+        data = model_to_dict(order, fields=form_class.base_fields)
+        data.update({key: "" for key, value in data.items() if value is None})
+        data["payment_amount"] = "12000"
+        form = form_class(data, instance=order)
+        self.assertTrue(form.is_valid(), form.errors)
+        model_admin.save_model(request, form.save(commit=False), form, change=True)
+
+        order.refresh_from_db()
+        self.assertEqual(order.payment_amount, Decimal("12000"))
+        counter = OrderStatusCounter.objects.get(status=Order.Status.PENDING)
+        self.assertEqual(counter.order_count, 1)
+        self.assertEqual(counter.amount, Decimal("12000"))
@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import PrepareOrderView, TossSuccessView, TossFailView
+from .views import OrderHistoryView, PrepareOrderView, TossSuccessView, TossFailView
 
 app_name = "order"
 
@@ -7,4 +7,5 @@ urlpatterns = [
     path("prepare/", PrepareOrderView.as_view(), name="prepare"),
     path("success/", TossSuccessView.as_view(), name="success"),
     path("fail/", TossFailView.as_view(), name="fail"),
+    path("history/", OrderHistoryView.as_view(), name="history"),
 ]
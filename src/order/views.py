@@ -1,18 +1,25 @@
-import uuid
+import logging
+
 import requests
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.mixins import LoginRequiredMixin
 from django.http import JsonResponse, HttpResponseBadRequest
-from django.utils import timezone
 from django.views import View
 from django.views.generic import TemplateView
 import base64
 
 from product.models import Product, ProductOption
 from order.models import Order, OrderItem
+from order import state_machine
+from order.history import MAX_PAGE_SIZE, PAGE_SIZE, get_history
+from order.numbers import generate_order_number
+from common import metrics
 from delivery.models import Delivery
 
-from django.db import transaction
+from django.db import IntegrityError, transaction
+
+logger = logging.getLogger(__name__)
 
 def encode_key(secret_key: str) -> str:
     """Base64로 인코딩된 Basic Auth 토큰 생성 (secret:)"""
@@ -24,6 +31,12 @@ class PrepareOrderView(View):
     """바로구매 시 주문 생성 후 토스 결제 위젯에 넘길 데이터 반환"""
 
     def post(self, request, *args, **kwargs):
+        with metrics.timed(metrics.CHECKOUT_SECONDS) as timing:
+            response = self._prepare(request)
+            timing.result = metrics.status_result(response.status_code)
+        return response
+
+    def _prepare(self, request):
         product_id = request.POST.get("product_id")
         option_id = request.POST.get("option_id")
         quantity_raw = request.POST.get("quantity", "1")
@@ -70,25 +83,13 @@ class PrepareOrderView(View):
                     .first()
                 )
             if not order:
-                order_number = uuid.uuid4().hex[:16]
-                order = Order.objects.create(
-                    order_number=order_number,
-                    user=user,
-                    delivery=delivery,
-                    shipping_name="테스트",
-                    shipping_phone="010-0000-0000",
-                    shipping_postcode="00000",
-                    shipping_address1="테스트 주소",
-                    shipping_address2="",
-                    payment_amount=amount,
-                    status=Order.Status.PENDING,
-                    payment_method=Order.PaymentMethod.CARD,
-                )
+                order = self._create_order(user, delivery, amount)
+                state_machine.record_created(order)
             else:
                 # 재사용 시 금액/배송만 갱신하고 기존 아이템을 비움
-                order.payment_amount = amount
                 order.delivery = delivery
-                order.save(update_fields=["payment_amount", "delivery", "updated_at"])
+                order.save(update_fields=["delivery", "updated_at"])
+                state_machine.change_amount(order, amount)
                 OrderItem.objects.filter(order=order).delete()
 
             OrderItem.objects.create(
@@ -113,6 +114,30 @@ class PrepareOrderView(View):
         )
 
 
+    @staticmethod
+    def _create_order(user, delivery, amount, attempts=3):
+        # 주문번호 충돌(다른 노드와 같은 번호)은 세이브포인트로 되돌린 뒤 새 번호로 재시도
+        for attempt in range(attempts):
+            try:
+                with transaction.atomic():
+                    return Order.objects.create(
+                        order_number=generate_order_number(),
+                        user=user,
+                        delivery=delivery,
+                        shipping_name="테스트",
+                        shipping_phone="010-0000-0000",
+                        shipping_postcode="00000",
+                        shipping_address1="테스트 주소",
+                        shipping_address2="",
+                        payment_amount=amount,
+                        status=Order.Status.PENDING,
+                        payment_method=Order.PaymentMethod.CARD,
+                    )
+            except IntegrityError:
+                if attempt == attempts - 1:
+                    raise
+
+
 class TossSuccessView(TemplateView):
     template_name = "order/toss_success.html"
 
@@ -127,19 +152,31 @@ class TossSuccessView(TemplateView):
         auth_token = encode_key(settings.TOSS_SECRET_KEY)
         headers = {"Authorization": f"Basic {auth_token}"}
 
-        res = requests.post(
-            "https://api.tosspayments.com/v1/payments/confirm",
-            json={"paymentKey": payment_key, "orderId": order_id, "amount": int(amount)},
-            headers=headers,
-            timeout=10,
-        )
-        res.raise_for_status()
+        with metrics.timed(metrics.TOSS_CONFIRM_SECONDS):
+            res = requests.post(
+                f"{settings.TOSS_API_BASE}/v1/payments/confirm",
+                json={"paymentKey": payment_key, "orderId": order_id, "amount": int(amount)},
+                headers=headers,
+                timeout=10,
+            )
+            res.raise_for_status()
         data = res.json()
 
         order = Order.objects.get(order_number=order_id)
-        order.status = Order.Status.PAID
-        order.paid_at = timezone.now()
-        order.save()
+        # 새로고침 등으로 이미 결제 완료 처리된 주문은 그대로 둔다
+        if order.status != Order.Status.PAID:
+            try:
+                state_machine.transition(order, Order.Status.PAID)
+            except state_machine.InvalidTransition as exc:
+                # 결제는 이미 승인됐으므로 500 대신 확인 필요로 표시하고 결과 화면은 보여준다
+                logger.error(
+                    "결제 승인 후 주문 상태 전이 실패: order=%s paymentKey=%s (%s)",
+                    order.order_number,
+                    payment_key,
+                    exc,
+                )
+                Order.objects.filter(pk=order.pk).update(payment_review_required=True)
+                order.payment_review_required = True
 
         return self.render_to_response({"payment": data, "order": order})
 
@@ -152,3 +189,18 @@ class TossFailView(TemplateView):
         ctx["code"] = self.request.GET.get("code")
         ctx["message"] = self.request.GET.get("message")
         return ctx
+
+
+class OrderHistoryView(LoginRequiredMixin, View):
+    """로그인 회원의 주문 내역 JSON (?cursor=&limit=)"""
+
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = min(MAX_PAGE_SIZE, max(1, int(request.GET.get("limit", PAGE_SIZE))))
+        except ValueError:
+            return HttpResponseBadRequest("invalid limit")
+        try:
+            page = get_history(request.user.pk, request.GET.get("cursor") or None, limit)
+        except ValueError:
+            return HttpResponseBadRequest("invalid cursor")
+        return JsonResponse(page)
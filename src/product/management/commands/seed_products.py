@@ -1,15 +1,21 @@
 from decimal import Decimal
+import os
 import random
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 from django.db.models import ProtectedError
 
 from catalog.models import Category
+from common import seeding
 from product.models import Product, ProductOption
 from cart.models import CartItem
 from order.models import OrderItem
 from cart.models import WishlistItem
 
+COLORS = ["블랙", "화이트", "네이비", "베이지", "그레이", "카키"]
+SIZES = ["XS", "S", "M", "L", "XL"]
+
 
 class Command(BaseCommand):
     help = "의류 상품/옵션 더미 데이터 생성"
@@ -31,6 +37,24 @@ class Command(BaseCommand):
             action="store_true",
             help="reset 시 관련 참조 데이터(CartItem/WishlistItem/OrderItem)까지 삭제",
         )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help="대량 생성: 워커 프로세스별 bulk_create, 색인 신호 대신 마지막에 한 번 색인",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="--bulk 워커 프로세스 수(기본 CPU 수)",
+        )
+        parser.add_argument("--chunk-size", type=int, default=2000, help="--bulk 청크당 상품 수(기본 2000)")
+        parser.add_argument(
+            "--random-seed",
+            type=int,
+            default=0,
+            help="--bulk 난수 시드(기본 0). 워커 수와 상관없이 같은 시드면 같은 데이터",
+        )
 
     def handle(self, *args, **options):
         from faker import Faker  # lazy import to keep command lightweight
@@ -66,8 +90,9 @@ class Command(BaseCommand):
                 Category.objects.create(name="원피스", slug="onepiece"),
             ]
 
-        colors = ["블랙", "화이트", "네이비", "베이지", "그레이", "카키"]
-        sizes = ["XS", "S", "M", "L", "XL"]
+        if options["bulk"]:
+            self._handle_bulk(categories, options)
+            return
 
         for _ in range(count):
             base_price = random.randint(19000, 99000)
@@ -84,8 +109,8 @@ class Command(BaseCommand):
                 is_active=True,
             )
 
-            for color in random.sample(colors, k=random.randint(2, len(colors))):
-                for size in random.sample(sizes, k=random.randint(2, len(sizes))):
+            for color in random.sample(COLORS, k=random.randint(2, len(COLORS))):
+                for size in random.sample(SIZES, k=random.randint(2, len(SIZES))):
                     ProductOption.objects.create(
                         product=product,
                         color=color,
@@ -96,3 +121,67 @@ class Command(BaseCommand):
                     )
 
         self.stdout.write(self.style.SUCCESS(f"{count}건 생성 완료"))
+
+    def _handle_bulk(self, categories, options):
+        count = options["count"]
+        seed = options["random_seed"]
+        if Product.objects.filter(sku__startswith=f"BJ-S{seed}-").exists():
+            raise CommandError(f"--random-seed {seed}로 만든 상품이 이미 있습니다. --reset 하거나 다른 시드를 쓰세요")
+        tasks = seeding.blocks(count, max(1, options["chunk_size"]))
+        workers = max(1, options["workers"])
+        with seeding.index_signals_disabled():
+            seeding.share(
+                seed=seed,
+                category_ids=[category.pk for category in categories],
+                first_product_id=seeding.next_id(Product),
+            )
+            self.stdout.write(f"{count}건 생성 중 (청크 {len(tasks)}개, 워커 {workers}개)...")
+            created = seeding.run_blocks(_bulk_products, tasks, workers)
+        indexed = seeding.reindex_products()
+        if indexed is not None:
+            self.stdout.write(f"상품 {indexed}건 색인")
+        self.stdout.write(self.style.SUCCESS(f"{created}건 생성 완료"))
+
+
+def _bulk_products(task):
+    from faker import Faker
+
+    ctx = seeding.shared
+    block, start, end = task
+    rng = seeding.block_rng(ctx["seed"], "product", block)
+    faker = Faker("ko_KR")
+    faker.seed_instance(seeding.block_seed(ctx["seed"], "product", block))
+    products, options = [], []
+    for index in range(start, end):
+        pk = ctx["first_product_id"] + index
+        base_price = rng.randint(19000, 99000)
+        discount = rng.choice([0, 0, rng.randint(2000, base_price // 3)])
+        products.append(
+            Product(
+                id=pk,
+                name=faker.catch_phrase()[:150],
+                sku=f"BJ-S{ctx['seed']}-{index:07d}",
+                category_id=rng.choice(ctx["category_ids"]),
+                price=Decimal(base_price),
+                discount_price=Decimal(base_price - discount) if discount else None,
+                stock=rng.randint(10, 80),
+                description=faker.text(200),
+                is_active=True,
+            )
+        )
+        for color in rng.sample(COLORS, k=rng.randint(2, len(COLORS))):
+            for size in rng.sample(SIZES, k=rng.randint(2, len(SIZES))):
+                options.append(
+                    ProductOption(
+                        product_id=pk,
+                        color=color,
+                        size=size,
+                        extra_price=Decimal("0"),
+                        stock=rng.randint(5, 40),
+                        is_active=True,
+                    )
+                )
+    with transaction.atomic():
+        Product.objects.bulk_create(products)
+        ProductOption.objects.bulk_create(options)
+    return len(products)
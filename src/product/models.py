@@ -1,6 +1,8 @@
 from decimal import Decimal
 
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Coalesce, NullIf
 from catalog.models import Category
 
 
@@ -47,6 +49,11 @@ class Product(models.Model):
         """할인 가격이 설정된 경우 그 값을, 아니면 기본 가격을 반환"""
         return self.discount_price or self.price
 
+    @staticmethod
+    def sale_price_expression():
+        """sale_price와 같은 규칙의 DB 식 (annotate/values 용, 할인 가격이 없거나 0이면 기본 가격)"""
+        return Coalesce(NullIf("discount_price", Value(Decimal("0"))), "price")
+
     @property
     def discount_rate(self) -> Decimal:
         """할인율(%)을 반환. 할인 가격이 없으면 0"""
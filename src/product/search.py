@@ -7,8 +7,10 @@ from common.meili import get_product_index
 
 def _document(product: Product) -> Dict:
     # 인스턴스 dictionary 변환
-    colors = list(product.options.values_list("color", flat=True).distinct())
-    sizes = list(product.options.values_list("size", flat=True).distinct())
+    # options를 prefetch 했으면 추가 쿼리 없음 (bulk_index)
+    options = list(product.options.all())
+    colors = list(dict.fromkeys(option.color for option in options))
+    sizes = list(dict.fromkeys(option.size for option in options))
     return {
         "id": product.id,
         "name": product.name,
@@ -37,7 +39,24 @@ def delete_product(product_id: int):
     get_product_index().delete_documents([product_id])
 
 
-def bulk_index():
-    #모든 상품 색인
-    docs: List[Dict] = [_document(p) for p in Product.objects.all()]
-    get_product_index().add_documents(docs)
+def bulk_index(batch_size: int = 1000) -> int:
+    #모든 상품 색인 (batch_size개씩 나눠 전송, 색인한 상품 수 반환)
+    index = get_product_index()
+    products = (
+        Product.objects.select_related("category")
+        .prefetch_related("options")
+        .order_by("id")
+        .iterator(chunk_size=batch_size)
+    )
+    count = 0
+    docs: List[Dict] = []
+    for product in products:
+        docs.append(_document(product))
+        if len(docs) >= batch_size:
+            index.add_documents(docs)
+            count += len(docs)
+            docs = []
+    if docs:
+        index.add_documents(docs)
+        count += len(docs)
+    return count
@@ -8,6 +8,8 @@ from django.urls import reverse_lazy
 from django.views import View
 from django.views.generic import TemplateView
 
+from cart.wishlist import wishlisted_ids
+from common import metrics
 from common.meili import get_product_index
 from product.models import Product
 
@@ -93,10 +95,13 @@ class ProductSearchView(TemplateView):
             ],
         }
 
-        search_res = get_product_index().search(q, search_params)
+        with metrics.timed(metrics.SEARCH_SECONDS):
+            search_res = get_product_index().search(q, search_params)
         hits = search_res.get("hits", []) # 검색 결과 리스트
         total = search_res.get("estimatedTotalHits", 0) # 검색된 총 결과 수
         processing_ms = search_res.get("processingTimeMs") # 검색 처리 시간 (밀리초)
+        if processing_ms is not None:
+            metrics.SEARCH_ENGINE_SECONDS.observe(processing_ms / 1000)
 
         # 페이징 객체 생성 (템플릿에서 page_obj 사용 가능)
         paginator = Paginator(range(total), per_page)  # 더미 리스트로 페이지 정보만 생성
@@ -123,6 +128,7 @@ class ProductSearchView(TemplateView):
             page_obj=page_obj,
             per_page=per_page,
             base_querystring=base_querystring,
+            wishlisted_ids=wishlisted_ids(request.user, [hit["id"] for hit in hits]),
         )
         return ctx
 
@@ -157,5 +163,6 @@ class ProductDetailView(TemplateView):
             options=options,
             toss_client_key=getattr(settings, "TOSS_CLIENT_KEY", ""),
             order_prepare_url=reverse_lazy("order:prepare"),
+            is_wishlisted=bool(wishlisted_ids(self.request.user, [product.pk])),
         )
         return ctx
@@ -1,7 +1,70 @@
+// 인증 메일은 서버 큐에서 발송되므로 발송 결과를 짧게 폴링해서 표시
+const MAIL_STATUS_TEXT = {
+  PENDING: "인증번호 메일을 보내는 중입니다...",
+  SENDING: "인증번호 메일을 보내는 중입니다...",
+  SENT: "인증번호 메일을 보냈습니다. 메일함을 확인해 주세요.",
+  FAILED: "메일 발송에 실패했습니다. 인증번호를 다시 요청해 주세요.",
+};
+
+const watchMailStatus = (el) => {
+  const url = el.dataset.mailStatusUrl;
+  let status = el.dataset.mailStatus;
+  let polls = 0;
+  const render = () => {
+    el.textContent = MAIL_STATUS_TEXT[status] || "";
+  };
+  const poll = () => {
+    if (status === "SENT" || status === "FAILED" || polls++ >= 30) return;
+    fetch(url, { credentials: "same-origin" })
+      .then((res) => (res.ok ? res.json() : null))
+      .then((data) => {
+        if (!data || !data.status) return;
+        status = data.status;
+        render();
+        setTimeout(poll, 1000);
+      })
+      .catch(() => setTimeout(poll, 2000));
+  };
+  render();
+  if (status) setTimeout(poll, 500);
+};
+
 document.addEventListener("DOMContentLoaded", () => {
+  const mailStatus = document.querySelector("[data-mail-status-url]");
+  if (mailStatus) watchMailStatus(mailStatus);
+
   const form = document.querySelector("[data-signup-form]");
   if (!form) return;
 
+  // 닉네임/이메일/전화번호 입력 후 포커스가 빠지면 중복 여부를 바로 표시
+  const TAKEN_TEXT = {
+    username: "이미 사용 중인 닉네임입니다.",
+    email: "이미 사용 중인 이메일입니다.",
+    phone: "이미 사용 중인 전화번호입니다.",
+  };
+  const availabilityUrl = form.dataset.availabilityUrl;
+  Object.keys(TAKEN_TEXT).forEach((name) => {
+    const input = form.querySelector(`[name="${name}"]`);
+    if (!input || !availabilityUrl) return;
+    const hint = document.createElement("p");
+    hint.className = "auth-form__hint";
+    input.insertAdjacentElement("afterend", hint);
+    input.addEventListener("blur", () => {
+      const value = input.value.trim();
+      if (!value) {
+        hint.textContent = "";
+        return;
+      }
+      fetch(`${availabilityUrl}?${new URLSearchParams({ [name]: value })}`, { credentials: "same-origin" })
+        .then((res) => (res.ok ? res.json() : null))
+        .then((data) => {
+          if (!data || !(name in data.available)) return;
+          hint.textContent = data.available[name] ? "" : TAKEN_TEXT[name];
+        })
+        .catch(() => {});
+    });
+  });
+
   const completeButton = form.querySelector("[data-complete-button]");
   if (!completeButton) return;
 
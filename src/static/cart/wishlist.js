@@ -0,0 +1,64 @@
+// 찜 토글: 상세 페이지 버튼(#btn-wishlist)과 목록/검색 카드의 하트
+// 클릭하면 /cart/wishlist/add 또는 /cart/wishlist/remove로 POST 하고 응답대로 표시를 바꾼다.
+document.addEventListener("DOMContentLoaded", () => {
+  const config = window.WISHLIST || {};
+  const toggles = document.querySelectorAll(
+    "#btn-wishlist, .search-card__wish[data-product-id], .product-card__wish[data-product-id]"
+  );
+
+  const render = (el, wishlisted) => {
+    el.classList.toggle("is-active", wishlisted);
+    el.setAttribute("aria-pressed", wishlisted ? "true" : "false");
+    if (el.id === "btn-wishlist") {
+      el.textContent = wishlisted ? "♥ 찜 해제" : "♡ 찜하기";
+    } else {
+      el.textContent = wishlisted ? "♥" : "♡";
+    }
+  };
+
+  toggles.forEach((el) => {
+    el.setAttribute("role", "button");
+    el.setAttribute("aria-pressed", el.classList.contains("is-active") ? "true" : "false");
+
+    el.addEventListener("click", async (event) => {
+      // 카드 전체 클릭(상세 이동)으로 번지지 않도록
+      event.preventDefault();
+      event.stopPropagation();
+
+      if (!config.authenticated) {
+        window.location.href = `${config.loginUrl}?next=${encodeURIComponent(window.location.pathname + window.location.search)}`;
+        return;
+      }
+      if (el.dataset.pending) return;
+
+      const wishlisted = el.classList.contains("is-active");
+      const formData = new FormData();
+      formData.append("product_id", el.dataset.productId);
+      // 상세 페이지에서는 선택한 옵션을 함께 찜한다
+      const optionSelect = el.id === "btn-wishlist" ? document.getElementById("product-option") : null;
+      if (!wishlisted && optionSelect) {
+        formData.append("option_id", optionSelect.value);
+      }
+
+      el.dataset.pending = "1";
+      try {
+        const res = await fetch(wishlisted ? config.removeUrl : config.addUrl, {
+          method: "POST",
+          headers: { "X-CSRFToken": config.csrfToken },
+          body: formData,
+        });
+        if (!res.ok) throw new Error(`wishlist ${res.status}`);
+        const data = await res.json();
+        // 같은 상품의 하트가 페이지에 여러 개 있을 수 있다
+        toggles.forEach((other) => {
+          if (other.dataset.productId === el.dataset.productId) render(other, data.wishlisted);
+        });
+      } catch (e) {
+        console.error(e);
+        alert("찜 처리에 실패했습니다. 잠시 후 다시 시도해 주세요.");
+      } finally {
+        delete el.dataset.pending;
+      }
+    });
+  });
+});